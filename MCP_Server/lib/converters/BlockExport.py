@@ -1,21 +1,54 @@
 import sys
 import os
+import errno
+import logging
 import traceback
-import shutil  # Added for directory removal functions
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 
 # Get root directory for imports
 root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-# Update path to point to the local modules
-sys.path.append(os.path.join(root_dir, "99_TIA_Client"))
-sys.path.append(os.path.join(root_dir, "100_Config"))
-# Add current directory to Python path
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+# Update path to point to the local modules and the current directory (for tia_config.py).
+# Only missing entries are added, so importing both BlockImport and BlockExport
+# does not grow sys.path with duplicates.
+for _path in (
+    os.path.join(root_dir, "99_TIA_Client"),
+    os.path.join(root_dir, "100_Config"),
+    os.path.dirname(os.path.abspath(__file__)),
+):
+    if _path not in sys.path:
+        sys.path.append(_path)
 
 # Import our local tia_config module for YAML configuration
 import tia_config
-from tia_portal import Client
+from tia_portal import Client, cfg
 from tia_portal import PLCSoftware, PLCBlock, PLCBlocks
 
+logger = logging.getLogger(__name__)
+
+# Temporary folder used by PLCBlock.export(), resolved once at import time
+# (None if DATA_PATH is not available through tia_portal.cfg)
+_EXPORTED_BLOCKS_DIR = os.path.join(cfg.DATA_PATH, "exported_blocks") if hasattr(cfg, 'DATA_PATH') else None
+
+# Name prefixes of root-folder blocks that export_all_blocks() treats as system blocks and skips
+SYSTEM_BLOCK_PREFIXES = ("_",)
+
+# Worker threads moving exported files into place at the end of export_all_blocks()
+_MOVE_WORKERS = 4
+
+def _dir_is_empty(path):
+    """
+    Check whether a directory is empty (or missing) by reading at most one entry
+
+    Exported files are moved out of the temporary folder, so it is usually
+    empty and the cleanup walk can be skipped.
+    """
+    try:
+        with os.scandir(path) as entries:
+            return next(entries, None) is None
+    except FileNotFoundError:
+        return True
+
 def clean_exported_blocks_folder():
     """
     Delete all files and subfolders under .tia_portal/exported_blocks
@@ -24,167 +57,323 @@ def clean_exported_blocks_folder():
     of the service execution.
     """
     try:
-        # Build the path to the .tia_portal/exported_blocks directory
-        # This assumes the DATA_PATH is accessible through tia_portal.cfg module
-        from tia_portal import cfg
+        exported_blocks_dir = _EXPORTED_BLOCKS_DIR
         
-        if hasattr(cfg, 'DATA_PATH'):
-            exported_blocks_dir = os.path.join(cfg.DATA_PATH, "exported_blocks")
-            
-            if os.path.exists(exported_blocks_dir):
-                print(f"Cleaning up temporary files in {exported_blocks_dir}...")
+        if exported_blocks_dir:
+            if not _dir_is_empty(exported_blocks_dir):
+                logger.info(f"Cleaning up temporary files in {exported_blocks_dir}...")
                 
-                # Option 1: Remove individual files to preserve the directory
-                for item in os.listdir(exported_blocks_dir):
-                    item_path = os.path.join(exported_blocks_dir, item)
-                    try:
-                        if os.path.isfile(item_path):
+                # One bottom-up pass removes every file and subfolder exactly once
+                # and keeps the directory itself
+                for root, dirs, files in os.walk(exported_blocks_dir, topdown=False):
+                    for name in files:
+                        item_path = os.path.join(root, name)
+                        try:
                             os.unlink(item_path)
-                        elif os.path.isdir(item_path):
-                            shutil.rmtree(item_path)
-                    except Exception as e:
-                        print(f"Error while deleting {item_path}: {str(e)}")
+                        except OSError as e:
+                            logger.warning(f"Error while deleting {item_path}: {str(e)}")
+                    for name in dirs:
+                        item_path = os.path.join(root, name)
+                        try:
+                            os.rmdir(item_path)
+                        except OSError as e:
+                            logger.warning(f"Error while deleting {item_path}: {str(e)}")
                 
-                print(f"Successfully cleaned up files in {exported_blocks_dir}")
+                logger.info(f"Successfully cleaned up files in {exported_blocks_dir}")
             else:
-                print(f"Directory {exported_blocks_dir} does not exist. Nothing to clean up.")
+                logger.debug(f"Directory {exported_blocks_dir} is empty or does not exist. Nothing to clean up.")
         else:
-            print("Warning: Could not determine DATA_PATH. Export cleanup was skipped.")
+            logger.warning("Could not determine DATA_PATH. Export cleanup was skipped.")
     except Exception as e:
-        print(f"Error during cleanup of exported files: {str(e)}")
+        logger.error(f"Error during cleanup of exported files: {str(e)}")
         traceback.print_exc()
 
-def export_block_to_xml(tia_software, block_name, export_path, folder_name=None, subfolder_name=None):
+def _copy_file(src, dst):
     """
-    Export a block from TIA Portal project to XML file
-    
+    Copy a file across filesystems
+
+    Where available (Linux), os.copy_file_range lets the kernel copy the data
+    without passing it through user space, and allows reflinks on btrfs/XFS
+    and server-side copies on network shares. Otherwise, or if the kernel
+    refuses, shutil.copyfile is used, which already picks the platform's fast
+    path (sendfile, fcopyfile or a 1 MiB buffer on Windows).
+    """
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if not copied:
+                        break
+                    remaining -= copied
+            if remaining == 0:
+                return
+        except OSError:
+            pass
+    shutil.copyfile(src, dst)
+
+def _move_exported_file(exported_file, export_file_path):
+    """
+    Move a block exported by TIA Portal from its temporary location to the target path
+
+    The temporary copy is disposable, so a rename is tried first. This is a
+    metadata-only operation and atomically replaces any existing target file.
+    A byte copy is only done when the target lives on another filesystem.
+
     Args:
-        tia_software: TIA Portal software instance
-        block_name: Name of the block to export
-        export_path: Base path where the block will be exported
-        folder_name: Name of the folder where the block is located. If None, look in root folder.
-        subfolder_name: Name of the subfolder inside folder_name where the block is located. If None, look directly in folder_name.
-        
+        exported_file: Path of the file written by PLCBlock.export()
+        export_file_path: Destination path of the exported block
+    """
+    try:
+        os.replace(exported_file, export_file_path)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        # Cross-device move: rename and hardlink are impossible, copy the bytes
+        _copy_file(exported_file, export_file_path)
+        os.unlink(exported_file)
+
+def _resolve_export_dir(export_path, folder_name=None, subfolder_name=None):
+    """
+    Build the export directory mirroring the TIA Portal folder structure
+
     Returns:
-        str: Path to the exported file if successful, None otherwise
+        tuple: (export_dir, file_prefix) where file_prefix is export_dir with
+            exactly one trailing separator, ready for appending a file name
     """
+    export_dir = export_path
+    if folder_name:
+        export_dir = os.path.join(export_dir, folder_name)
+        if subfolder_name:
+            export_dir = os.path.join(export_dir, subfolder_name)
+    return export_dir, os.path.join(export_dir, "")
+
+def _validate_software(tia_software):
+    """Check the PLC software object once per public entry point"""
+    if not tia_software or not isinstance(tia_software, PLCSoftware):
+        logger.error("Invalid PLC software object")
+        return False
+    return True
+
+def _found(target_block, block_name):
+    """Check if the block was found"""
+    if not target_block:
+        logger.warning(f"Block '{block_name}' not found in the specified location")
+        return None
+    return target_block
+
+def _find_root_block(tia_software, block_name):
+    """Look up a block in the root folder"""
+    # Use the default blocks collection from root
+    blocks = tia_software.get_blocks()
+    if not blocks or not isinstance(blocks, PLCBlocks):
+        logger.error("Invalid blocks collection")
+        return None
+    
+    return _found(blocks.find(block_name), block_name)
+
+def _find_user_group(tia_software, folder_name):
+    """Look up a top-level user folder, None if it does not exist"""
+    user_group = tia_software.get_user_block_groups().find(folder_name)
+    if not user_group or not user_group.value:
+        logger.warning(f"Folder '{folder_name}' not found, skipping export")
+        return None
+    return user_group
+
+def _find_folder_block(tia_software, block_name, folder_name):
+    """Look up a block directly in a user folder"""
     try:
-        # Validate PLC software object
-        if not tia_software or not isinstance(tia_software, PLCSoftware):
-            print("Invalid PLC software object")
+        user_group = _find_user_group(tia_software, folder_name)
+        if user_group is None:
             return None
         
-        # Set the target block to None initially
-        target_block = None
+        return _found(user_group.get_blocks().find(block_name), block_name)
+    except Exception as e:
+        logger.error(f"Error accessing folder '{folder_name}': {str(e)}")
+        return None
+
+def _find_subfolder_block(tia_software, block_name, folder_name, subfolder_name):
+    """Look up a block in a subfolder of a user folder"""
+    try:
+        user_group = _find_user_group(tia_software, folder_name)
+        if user_group is None:
+            return None
         
-        # Case 1: folder_name is None, subfolder_name is None - use root
-        if not folder_name:
-            # Use the default blocks collection from root
-            blocks = tia_software.get_blocks()
-            if not blocks or not isinstance(blocks, PLCBlocks):
-                print("Invalid blocks collection")
-                return None
-                
-            # Try to find the block in the root folder
-            target_block = blocks.find(block_name)
-        # Case 2 & 3: folder_name has value
-        else:
-            try:
-                # Get user block groups
-                user_groups = tia_software.get_user_block_groups()
-                # Try to find the specified folder
-                user_group = user_groups.find(folder_name)
-                # Check if the folder exists
-                if not user_group or not user_group.value:
-                    print(f"Folder '{folder_name}' not found, skipping export")
-                    return None
-                
-                # Case 2: folder_name has value, subfolder_name is None
-                if not subfolder_name:
-                    # Use the main folder
-                    blocks = user_group.get_blocks()
-                    # Try to find the block in this folder
-                    target_block = blocks.find(block_name)
-                # Case 3: folder_name has value, subfolder_name has value
-                else:
-                    try:
-                        # Get groups collection of the parent folder
-                        parent_groups = user_group.get_groups()
-                        # Try to find the specified subfolder
-                        sub_group = parent_groups.find(subfolder_name)
-                        # Check if the subfolder exists
-                        if not sub_group or not sub_group.value:
-                            print(f"Subfolder '{subfolder_name}' not found in folder '{folder_name}', skipping export")
-                            return None
-                        # Get blocks from the specified subfolder
-                        blocks = sub_group.get_blocks()
-                        # Try to find the block in this subfolder
-                        target_block = blocks.find(block_name)
-                    except Exception as e:
-                        print(f"Error accessing subfolder '{subfolder_name}': {str(e)}")
-                        return None
-            except Exception as e:
-                print(f"Error accessing folder '{folder_name}': {str(e)}")
+        try:
+            sub_group = user_group.get_groups().find(subfolder_name)
+            if not sub_group or not sub_group.value:
+                logger.warning(f"Subfolder '{subfolder_name}' not found in folder '{folder_name}', skipping export")
                 return None
-        
-        # Check if the block was found
-        if not target_block:
-            print(f"Block '{block_name}' not found in the specified location")
+            
+            return _found(sub_group.get_blocks().find(block_name), block_name)
+        except Exception as e:
+            logger.error(f"Error accessing subfolder '{subfolder_name}': {str(e)}")
             return None
+    except Exception as e:
+        logger.error(f"Error accessing folder '{folder_name}': {str(e)}")
+        return None
+
+def _find_block(tia_software, block_name, folder_name=None, subfolder_name=None):
+    """
+    Look up a block in the root folder, a user folder or one of its subfolders
+    
+    Thin dispatcher for name-based exports; export_all_blocks() already holds
+    the block objects and never gets here.
+
+    Returns:
+        PLCBlock: The block if its folder was found, None otherwise
+    """
+    if not folder_name:
+        return _find_root_block(tia_software, block_name)
+    if not subfolder_name:
+        return _find_folder_block(tia_software, block_name, folder_name)
+    return _find_subfolder_block(tia_software, block_name, folder_name, subfolder_name)
+
+def _export_to_temp(tia_software, block_name, export_path, folder_name=None, subfolder_name=None, target_block=None):
+    """
+    Look up a block (unless target_block provides it) and export it into the TIA Portal temporary folder
+
+    All TIA Portal API calls of an export happen here, so this must run on the
+    thread that owns the Openness connection. tia_software must already have
+    been checked with _validate_software().
+
+    Returns:
+        tuple: (exported_file, export_dir, export_file_path) if successful, None otherwise
+    """
+    try:
+        # Use the block handed in by the caller, otherwise look it up in its folder
+        if target_block is None:
+            target_block = _find_block(tia_software, block_name, folder_name, subfolder_name)
+            if target_block is None:
+                return None
             
         # Create the export directory structure matching the TIA Portal folder structure
-        export_dir = export_path
-        
-        # If folder and subfolder are specified, create that structure
-        if folder_name:
-            export_dir = os.path.join(export_dir, folder_name)
-            if subfolder_name:
-                export_dir = os.path.join(export_dir, subfolder_name)
-        
-        # Create directory if it doesn't exist
-        if not os.path.exists(export_dir):
-            os.makedirs(export_dir)
+        # (the directory itself is created by the caller before the file is moved)
+        export_dir, file_prefix = _resolve_export_dir(export_path, folder_name, subfolder_name)
             
-        # Construct the export file path
-        export_file_path = os.path.join(export_dir, f"{block_name}.xml")
+        # Construct the export file path (plain concatenation, the prefix is already joined)
+        export_file_path = f"{file_prefix}{block_name}.xml"
         
         # Export the block
-        print(f"Exporting block '{block_name}' to {export_file_path}...")
+        logger.debug("Exporting block '%s' to %s...", block_name, export_file_path)
         try:
             exported_file = target_block.export()
-            
-            # The export method saves it to a temporary location in the DATA_PATH
-            # We need to move it to our desired location
-            if os.path.exists(exported_file):
-                # Create the directory structure if it doesn't exist
-                os.makedirs(os.path.dirname(export_file_path), exist_ok=True)
-                
-                # If the file already exists at the target location, remove it
-                if os.path.exists(export_file_path):
-                    os.remove(export_file_path)
-                    
-                # Move the file from the temporary location to our desired location
-                shutil.copyfile(exported_file, export_file_path)
-                print(f"Successfully exported block '{block_name}' to {export_file_path}")
-                return export_file_path
-            else:
-                print(f"Export failed: Exported file not found at {exported_file}")
-                return None
-                
         except Exception as e:
-            print(f"Error exporting block: {str(e)}")
-            traceback.print_exc()
+            logger.error(f"Error exporting block: {str(e)}")
+            logger.debug("Traceback of failed export of block '%s'", block_name, exc_info=True)
             return None
+        
+        return exported_file, export_dir, export_file_path
             
     except Exception as e:
-        print(f"Operation error: {str(e)}")
-        traceback.print_exc()
+        logger.error(f"Operation error: {str(e)}")
+        logger.debug("Traceback of failed export of block '%s'", block_name, exc_info=True)
+        return None
+
+def _move_into_place(block_name, exported_file, export_file_path):
+    """
+    Move a block from the TIA Portal temporary folder to its export path
+
+    Only touches the file system, so it is safe to run on a worker thread.
+
+    Returns:
+        str: Path to the exported file if successful, None otherwise
+    """
+    try:
+        # The export method saves it to a temporary location in the DATA_PATH
+        # We need to move it to our desired location
+        if os.path.exists(exported_file):
+            # Move the file from the temporary location to our desired location
+            _move_exported_file(exported_file, export_file_path)
+            logger.debug("Successfully exported block '%s' to %s", block_name, export_file_path)
+            return export_file_path
+        else:
+            logger.error(f"Export failed: Exported file not found at {exported_file}")
+            return None
+            
+    except Exception as e:
+        logger.error(f"Error exporting block: {str(e)}")
+        logger.debug("Traceback of failed move of block '%s'", block_name, exc_info=True)
+        return None
+
+def export_block_to_xml(tia_software, block_name, export_path, folder_name=None, subfolder_name=None, target_block=None):
+    """
+    Export a block from TIA Portal project to XML file
+    
+    Args:
+        tia_software: TIA Portal software instance
+        block_name: Name of the block to export
+        export_path: Base path where the block will be exported
+        folder_name: Name of the folder where the block is located. If None, look in root folder.
+        subfolder_name: Name of the subfolder inside folder_name where the block is located. If None, look directly in folder_name.
+        target_block: The block object itself, if already known. Skips the folder and block lookup.
+        
+    Returns:
+        str: Path to the exported file if successful, None otherwise
+    """
+    if not _validate_software(tia_software):
+        return None
+    
+    exported = _export_to_temp(tia_software, block_name, export_path, folder_name, subfolder_name, target_block)
+    if not exported:
         return None
+    
+    exported_file, export_dir, export_file_path = exported
+    # Create directory if it doesn't exist
+    os.makedirs(export_dir, exist_ok=True)
+    return _move_into_place(block_name, exported_file, export_file_path)
+
+def _iter_composition(composition):
+    """Iterate a TIA Portal composition, yielding nothing if it has no value"""
+    if composition and hasattr(composition, "value") and composition.value is not None:
+        yield from composition
+
+def _iter_all_blocks(tia_software):
+    """
+    Walk the block tree once: root folder, user folders and their subfolders
+
+    Yields:
+        tuple: (block, block_name, folder_name, subfolder_name)
+    """
+    # First, blocks from the root folder, skipping system blocks (typically starting with _)
+    for block in _iter_composition(tia_software.get_blocks()):
+        try:
+            block_name = block.name
+        except Exception as block_ex:
+            logger.error(f"Error reading a root block name: {str(block_ex)}")
+            continue
+        if not block_name.startswith(SYSTEM_BLOCK_PREFIXES):
+            yield block, block_name, None, None
+    
+    # Next, blocks from user block groups and their subfolders
+    for folder in _iter_composition(tia_software.get_user_block_groups()):
+        folder_name = "<unknown>"
+        try:
+            folder_name = folder.name
+            for block in _iter_composition(folder.get_blocks()):
+                yield block, block.name, folder_name, None
+            
+            for subfolder in _iter_composition(folder.get_groups()):
+                subfolder_name = "<unknown>"
+                try:
+                    subfolder_name = subfolder.name
+                    for block in _iter_composition(subfolder.get_blocks()):
+                        yield block, block.name, folder_name, subfolder_name
+                except Exception as subfolder_ex:
+                    logger.error(f"Error processing subfolder {subfolder_name}: {str(subfolder_ex)}")
+        except Exception as folder_ex:
+            logger.error(f"Error processing folder {folder_name}: {str(folder_ex)}")
 
 def export_all_blocks(tia_software, export_base_path):
     """
     Export all blocks from the TIA Portal project preserving folder structure
     
+    Works in three phases: all TIA Portal exports run back to back on the
+    calling thread (the Openness COM objects are bound to it), then every
+    target directory is created once, and finally the exported files are
+    moved into place in a single sweep on a small thread pool.
+    
     Args:
         tia_software: TIA Portal software instance
         export_base_path: Base path where blocks will be exported
@@ -192,81 +381,69 @@ def export_all_blocks(tia_software, export_base_path):
     Returns:
         int: Number of successfully exported blocks
     """
+    if not _validate_software(tia_software):
+        return 0
+    
     try:
-        # Count of successfully exported blocks
-        export_count = 0
-        
-        # First, export blocks from the root folder
-        root_blocks = tia_software.get_blocks()
-        if root_blocks and hasattr(root_blocks, "value") and root_blocks.value is not None:
-            for block in root_blocks:
+        # Phase 1: export every block into the TIA Portal temporary folder
+        moves = []
+        export_dirs = set()
+        failed = []
+        # A failing walk keeps the blocks exported so far, so they are still moved below
+        try:
+            for block, block_name, folder_name, subfolder_name in _iter_all_blocks(tia_software):
                 try:
-                    # Skip system blocks (typically starting with _)
-                    if block.name.startswith("_"):
-                        continue
-                        
-                    result = export_block_to_xml(tia_software, block.name, export_base_path)
-                    if result:
-                        export_count += 1
+                    exported = _export_to_temp(
+                        tia_software,
+                        block_name,
+                        export_base_path,
+                        folder_name=folder_name,
+                        subfolder_name=subfolder_name,
+                        target_block=block
+                    )
+                    if exported:
+                        exported_file, export_dir, export_file_path = exported
+                        moves.append((block_name, exported_file, export_file_path))
+                        export_dirs.add(export_dir)
+                    else:
+                        failed.append(block_name)
                 except Exception as block_ex:
-                    print(f"Error exporting root block {block.name}: {str(block_ex)}")
+                    logger.error(f"Error exporting block {block_name}: {str(block_ex)}")
+                    failed.append(block_name)
+        except Exception as walk_ex:
+            logger.error(f"Error walking the block tree: {str(walk_ex)}")
         
-        # Next, export blocks from user block groups
-        user_groups = tia_software.get_user_block_groups()
-        if user_groups and hasattr(user_groups, "value") and user_groups.value is not None:
-            # Iterate through each top-level folder
-            for folder in user_groups:
-                try:
-                    # Export blocks directly in this folder
-                    folder_blocks = folder.get_blocks()
-                    if folder_blocks and hasattr(folder_blocks, "value") and folder_blocks.value is not None:
-                        for block in folder_blocks:
-                            try:
-                                result = export_block_to_xml(
-                                    tia_software, 
-                                    block.name, 
-                                    export_base_path,
-                                    folder_name=folder.name
-                                )
-                                if result:
-                                    export_count += 1
-                            except Exception as block_ex:
-                                print(f"Error exporting block {block.name} in folder {folder.name}: {str(block_ex)}")
-                    
-                    # Get subfolders
-                    subfolders = folder.get_groups()
-                    if subfolders and hasattr(subfolders, "value") and subfolders.value is not None:
-                        # Iterate through each subfolder
-                        for subfolder in subfolders:
-                            try:
-                                # Export blocks in this subfolder
-                                subfolder_blocks = subfolder.get_blocks()
-                                if subfolder_blocks and hasattr(subfolder_blocks, "value") and subfolder_blocks.value is not None:
-                                    for block in subfolder_blocks:
-                                        try:
-                                            result = export_block_to_xml(
-                                                tia_software,
-                                                block.name,
-                                                export_base_path,
-                                                folder_name=folder.name,
-                                                subfolder_name=subfolder.name
-                                            )
-                                            if result:
-                                                export_count += 1
-                                        except Exception as block_ex:
-                                            print(f"Error exporting block {block.name} in subfolder {subfolder.name}: {str(block_ex)}")
-                            except Exception as subfolder_ex:
-                                print(f"Error processing subfolder {subfolder.name}: {str(subfolder_ex)}")
-                except Exception as folder_ex:
-                    print(f"Error processing folder {folder.name}: {str(folder_ex)}")
-                    
+        # Phase 2: create each target directory once
+        for export_dir in export_dirs:
+            try:
+                os.makedirs(export_dir, exist_ok=True)
+            except OSError as dir_ex:
+                # The moves into this directory fail and are reported below
+                logger.error(f"Error creating directory {export_dir}: {str(dir_ex)}")
+        
+        # Phase 3: move all exported files into place
+        with ThreadPoolExecutor(max_workers=_MOVE_WORKERS) as executor:
+            moved = list(executor.map(lambda move: _move_into_place(*move), moves))
+        failed.extend(move[0] for move, path in zip(moves, moved) if not path)
+        
+        # Count of successfully exported blocks
+        export_count = sum(1 for path in moved if path)
+        
+        logger.info(f"Exported {export_count} blocks to {export_base_path}")
+        # Summarize failures once instead of a traceback per block
+        if failed:
+            shown = ", ".join(failed[:5])
+            more = f" and {len(failed) - 5} more" if len(failed) > 5 else ""
+            logger.warning(f"{len(failed)} blocks could not be exported: {shown}{more}")
         return export_count
     except Exception as e:
-        print(f"Error exporting all blocks: {str(e)}")
+        logger.error(f"Error exporting all blocks: {str(e)}")
         traceback.print_exc()
         return 0
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    
     try:
         # Load configuration from YAML
         if not tia_config.load():
@@ -1,19 +1,112 @@
 import sys
 import os
+import logging
 import traceback
-# Get root directory for imports
-root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-# Update path to point to the local modules
-sys.path.append(os.path.join(root_dir, "99_TIA_Client"))
-sys.path.append(os.path.join(root_dir, "100_Config"))
-# Add current directory to Python path to find tia_config.py
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-# Import our local tia_config module for YAML configuration
-import tia_config
-from tia_portal import Client
-from tia_portal import PLCSoftware, PLCBlocks
-
-def import_block_from_xml(tia_software, xml_path, folder_name=None, subfolder_name=None):
+logger = logging.getLogger(__name__)
+
+# tia_portal pulls in the Openness .NET bridge, so it is imported inside the
+# functions that need it rather than at module import time. Library callers
+# (the MCP handlers) put lib/ on sys.path themselves; the path setup for
+# running this file directly lives under __main__.
+
+# Resolved blocks collections keyed by (id(tia_software), folder_name, subfolder_name).
+# The software object is kept next to the collection, so a recycled id is never taken for a hit.
+_blocks_cache = {}
+
+def invalidate_import_cache():
+    """
+    Forget the resolved import folders
+
+    Call this after folders were deleted or renamed, or when switching projects.
+    """
+    _blocks_cache.clear()
+
+def _resolve_blocks(tia_software, folder_name=None, subfolder_name=None):
+    """
+    Resolve the blocks collection of the root folder, a folder or a subfolder
+
+    Successful lookups are cached, so importing many files into the same
+    folder walks the TIA Portal folder tree only once.
+
+    Returns:
+        tuple: (blocks, None) on success, (None, error message) otherwise
+    """
+    from tia_portal import PLCBlocks
+
+    key = (id(tia_software), folder_name or None, (subfolder_name or None) if folder_name else None)
+    cached = _blocks_cache.get(key)
+    if cached is not None and cached[0] is tia_software:
+        return cached[1], None
+
+    # Case 1: folder_name is None, subfolder_name is None - use root
+    if not folder_name:
+        # Use the default blocks collection from root
+        blocks = tia_software.get_blocks()
+        if not blocks or not isinstance(blocks, PLCBlocks):
+            return None, "Invalid blocks collection"
+    # Case 2 & 3: folder_name has value
+    else:
+        try:
+            # Get user block groups
+            user_groups = tia_software.get_user_block_groups()
+            # Try to find the specified folder
+            user_group = user_groups.find(folder_name)
+            # Check if the folder exists
+            if not user_group or not user_group.value:
+                return None, f"Folder '{folder_name}' not found in project"
+
+            # Case 2: folder_name has value, subfolder_name is None
+            if not subfolder_name:
+                # Use the main folder
+                blocks = user_group.get_blocks()
+            # Case 3: folder_name has value, subfolder_name has value
+            else:
+                try:
+                    # Get groups collection of the parent folder
+                    parent_groups = user_group.get_groups()
+                    # Try to find the specified subfolder
+                    sub_group = parent_groups.find(subfolder_name)
+                    # Check if the subfolder exists
+                    if not sub_group or not sub_group.value:
+                        return None, f"Subfolder '{subfolder_name}' not found in folder '{folder_name}'"
+                    # Get blocks from the specified subfolder
+                    blocks = sub_group.get_blocks()
+                except Exception as e:
+                    return None, f"Error accessing subfolder '{subfolder_name}': {str(e)}"
+        except Exception as e:
+            return None, f"Error accessing folder '{folder_name}': {str(e)}"
+
+    _blocks_cache[key] = (tia_software, blocks)
+    return blocks, None
+
+def _create_block(blocks, xml_path, block_name):
+    """
+    Import one XML file into a resolved blocks collection
+
+    Returns:
+        dict: {"success": bool, "error": str or None, "block_name": str or None}
+    """
+    # Try to import the block - this is where TIA Portal API is called
+    try:
+        new_block = blocks.create(
+            path=xml_path,
+            name=block_name,
+            labels={"CreatedBy": "Openness API"}
+        )
+        return {"success": True, "error": None, "block_name": new_block.name}
+    except Exception as import_error:
+        # Capture the actual TIA Portal error message
+        error_msg = str(import_error)
+        # Common TIA Portal import errors and their explanations
+        if "could not be found" in error_msg.lower() or "not found" in error_msg.lower():
+            error_msg = f"TIA Portal import failed: {error_msg}. Check if all referenced UDTs and DBs exist in the project."
+        elif "already exists" in error_msg.lower():
+            error_msg = f"Block '{block_name}' already exists in the target location. Delete it first or use a different name."
+        elif "syntax" in error_msg.lower() or "invalid" in error_msg.lower():
+            error_msg = f"TIA Portal import failed due to syntax/validation error: {error_msg}"
+        return {"success": False, "error": error_msg, "block_name": block_name}
+
+def import_block_from_xml(tia_software, xml_path, folder_name=None, subfolder_name=None, verbose=True):
     """
     Import a block from XML file into TIA Portal project
 
@@ -22,82 +115,75 @@ def import_block_from_xml(tia_software, xml_path, folder_name=None, subfolder_na
         xml_path: Path to the XML file containing the block
         folder_name: Name of the folder to import the block into. If None, imports to root folder.
         subfolder_name: Name of the subfolder inside folder_name to import the block into. If None, imports directly to folder_name.
+        verbose: Log the traceback of unexpected errors
 
     Returns:
         dict: {"success": bool, "error": str or None, "block_name": str or None}
               For backward compatibility, also supports bool return check via truthiness
     """
+    return import_blocks_from_xml(tia_software, [xml_path], folder_name, subfolder_name, verbose=verbose)[0]
+
+def import_blocks_from_xml(tia_software, xml_paths, folder_name=None, subfolder_name=None, verbose=False):
+    """
+    Import several blocks from XML files into the same folder of the TIA Portal project
+
+    The PLC software is validated and the target folder is resolved once for
+    the whole batch.
+
+    Args:
+        tia_software: TIA Portal software instance
+        xml_paths: Paths to the XML files containing the blocks
+        folder_name: Name of the folder to import the blocks into. If None, imports to root folder.
+        subfolder_name: Name of the subfolder inside folder_name to import the blocks into. If None, imports directly to folder_name.
+        verbose: Log the traceback of unexpected errors (off by default, so failing batches stay cheap)
+
+    Returns:
+        list: One result dict per XML file, in the same format as import_block_from_xml
+    """
+    from tia_portal import PLCSoftware
+
+    xml_paths = list(xml_paths)
     try:
         # Validate PLC software object
         if not tia_software or not isinstance(tia_software, PLCSoftware):
-            return {"success": False, "error": "Invalid PLC software object", "block_name": None}
-
-        # Case 1: folder_name is None, subfolder_name is None - use root
-        if not folder_name:
-            # Use the default blocks collection from root
-            blocks = tia_software.get_blocks()
-            if not blocks or not isinstance(blocks, PLCBlocks):
-                return {"success": False, "error": "Invalid blocks collection", "block_name": None}
-        # Case 2 & 3: folder_name has value
-        else:
-            try:
-                # Get user block groups
-                user_groups = tia_software.get_user_block_groups()
-                # Try to find the specified folder
-                user_group = user_groups.find(folder_name)
-                # Check if the folder exists
-                if not user_group or not user_group.value:
-                    return {"success": False, "error": f"Folder '{folder_name}' not found in project", "block_name": None}
-
-                # Case 2: folder_name has value, subfolder_name is None
-                if not subfolder_name:
-                    # Use the main folder
-                    blocks = user_group.get_blocks()
-                # Case 3: folder_name has value, subfolder_name has value
-                else:
-                    try:
-                        # Get groups collection of the parent folder
-                        parent_groups = user_group.get_groups()
-                        # Try to find the specified subfolder
-                        sub_group = parent_groups.find(subfolder_name)
-                        # Check if the subfolder exists
-                        if not sub_group or not sub_group.value:
-                            return {"success": False, "error": f"Subfolder '{subfolder_name}' not found in folder '{folder_name}'", "block_name": None}
-                        # Get blocks from the specified subfolder
-                        blocks = sub_group.get_blocks()
-                    except Exception as e:
-                        return {"success": False, "error": f"Error accessing subfolder '{subfolder_name}': {str(e)}", "block_name": None}
-            except Exception as e:
-                return {"success": False, "error": f"Error accessing folder '{folder_name}': {str(e)}", "block_name": None}
-
-        block_name = os.path.splitext(os.path.basename(xml_path))[0]
-
-        # Try to import the block - this is where TIA Portal API is called
-        try:
-            new_block = blocks.create(
-                path=xml_path,
-                name=block_name,
-                labels={"CreatedBy": "Openness API"}
-            )
-            return {"success": True, "error": None, "block_name": new_block.name}
-        except Exception as import_error:
-            # Capture the actual TIA Portal error message
-            error_msg = str(import_error)
-            # Common TIA Portal import errors and their explanations
-            if "could not be found" in error_msg.lower() or "not found" in error_msg.lower():
-                error_msg = f"TIA Portal import failed: {error_msg}. Check if all referenced UDTs and DBs exist in the project."
-            elif "already exists" in error_msg.lower():
-                error_msg = f"Block '{block_name}' already exists in the target location. Delete it first or use a different name."
-            elif "syntax" in error_msg.lower() or "invalid" in error_msg.lower():
-                error_msg = f"TIA Portal import failed due to syntax/validation error: {error_msg}"
-            return {"success": False, "error": error_msg, "block_name": block_name}
+            return [{"success": False, "error": "Invalid PLC software object", "block_name": None} for _ in xml_paths]
+
+        blocks, error = _resolve_blocks(tia_software, folder_name, subfolder_name)
+        if error:
+            return [{"success": False, "error": error, "block_name": None} for _ in xml_paths]
+
+        # Derive all block names from the file names up front
+        block_names = [os.path.splitext(os.path.basename(xml_path))[0] for xml_path in xml_paths]
+
+        return [
+            _create_block(blocks, xml_path, block_name)
+            for xml_path, block_name in zip(xml_paths, block_names)
+        ]
 
     except Exception as e:
         error_details = str(e)
-        traceback.print_exc()
-        return {"success": False, "error": f"Unexpected error during import: {error_details}", "block_name": None}
+        logger.error(f"Unexpected error during import: {error_details}", exc_info=verbose)
+        return [{"success": False, "error": f"Unexpected error during import: {error_details}", "block_name": None} for _ in xml_paths]
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    
+    # Get root directory for imports
+    root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    # Update path to point to lib/ (for tia_portal), the legacy client/config folders
+    # and the current directory (for tia_config.py). Only missing entries are added.
+    for _path in (
+        root_dir,
+        os.path.join(root_dir, "99_TIA_Client"),
+        os.path.join(root_dir, "100_Config"),
+        os.path.dirname(os.path.abspath(__file__)),
+    ):
+        if _path not in sys.path:
+            sys.path.append(_path)
+    # Import our local tia_config module for YAML configuration
+    import tia_config
+    from tia_portal import Client
+
     try:
         # Load configuration from YAML
         if not tia_config.load():
@@ -1,17 +1,24 @@
 """
 TIA Portal MCP Server Package
 Contains all required TIA Portal modules and converters
+
+Submodules are loaded on first attribute access (PEP 562), so importing one
+converter does not drag in tia_portal and the Openness .NET bridge.
 """
+import importlib
 
-# Package modules
-from . import tia_portal
-from . import BlockImport  
-from . import BlockExport
-from . import tia_config
-from . import json_to_xml
-from . import xml_to_json
-from . import json_to_scl
-from . import scl_to_json
+# Attribute name -> module to import on first access. tia_portal is the
+# sibling lib/tia_portal package, not a submodule of this one.
+_lazy = {
+    'tia_portal': 'tia_portal',
+    'BlockImport': '.BlockImport',
+    'BlockExport': '.BlockExport',
+    'tia_config': '.tia_config',
+    'json_to_xml': '.json_to_xml',
+    'xml_to_json': '.xml_to_json',
+    'json_to_scl': '.json_to_scl',
+    'scl_to_json': '.scl_to_json',
+}
 
 __all__ = [
     'tia_portal',
@@ -22,4 +29,16 @@ __all__ = [
     'xml_to_json',
     'json_to_scl',
     'scl_to_json'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    if name in _lazy:
+        module = importlib.import_module(_lazy[name], __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy))
@@ -0,0 +1,68 @@
+"""
+Batch conversion helpers shared by the file converters
+Runs a converter over many files in worker processes and provides the directory/glob mode of the converter CLIs
+"""
+import glob
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, List, Optional, Sequence
+
+
+def run_batch(worker: Callable[[str, Optional[str]], Optional[str]], files: List[str],
+              output_dir: Optional[str], suffix: str,
+              max_workers: Optional[int] = None) -> List[Optional[str]]:
+    """
+    Convert several files in parallel worker processes
+
+    Args:
+        worker: Module-level function converting (input file, output file or None)
+        files: Paths to input files
+        output_dir: Directory for the output files (optional, worker default next to each input)
+        suffix: Appended to each input file's base name to name its output in output_dir
+        max_workers: Number of worker processes (optional, one per CPU by default)
+
+    Returns:
+        List of generated file paths, None for failed files, in input order
+    """
+    outputs = [
+        os.path.join(output_dir, os.path.splitext(os.path.basename(path))[0] + suffix) if output_dir else None
+        for path in files
+    ]
+    # Conversions are independent and CPU-bound, so processes sidestep the GIL
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(worker, files, outputs))
+
+
+def run_batch_cli(args: Sequence[str], batch: Callable[[List[str], Optional[str]], List[Optional[str]]],
+                  extension: str, file_kind: str) -> bool:
+    """
+    Run the batch mode of a converter CLI if its first argument is a directory or a glob pattern
+
+    Args:
+        args: Command line arguments without the script name, input and optional output directory
+        batch: Batch conversion function taking (input files, output dir)
+        extension: Input file extension searched in a directory, e.g. ".json"
+        file_kind: Input file kind shown in messages, e.g. "JSON"
+
+    Returns:
+        True if the arguments were handled in batch mode, False for a single file
+    """
+    source = args[0]
+    is_dir = os.path.isdir(source)
+    if not (is_dir or glob.has_magic(source)):
+        return False
+
+    pattern = os.path.join(source, "*" + extension) if is_dir else source
+    files = sorted(glob.glob(pattern))
+    if not files:
+        print(f"Error: No {file_kind} files found: {pattern}")
+        return True
+    output_dir = args[1] if len(args) > 1 else None
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    results = batch(files, output_dir)
+    failed = [path for path, result in zip(files, results) if not result]
+    print(f"Converted {len(files) - len(failed)} of {len(files)} files")
+    for path in failed:
+        print(f"  Failed: {path}")
+    return True
@@ -2,110 +2,257 @@
 JSON to SCL Converter for TIA Portal Blocks
 Converts JSON representation to readable SCL (Structured Control Language) format
 """
-import json
+import logging
 import os
-from typing import Dict, List, Any, Optional
+import re
+from functools import lru_cache
+from typing import Dict, List, Any, Iterable, Iterator, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# orjson parses several times faster than the stdlib; both accept bytes
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    import json
+    _loads = json.loads
+
+try:
+    from .output_cache import OutputCache, source_key
+    from .batch_runner import run_batch, run_batch_cli
+except ImportError:
+    # Imported as a top-level module with lib/converters on sys.path
+    from output_cache import OutputCache, source_key
+    from batch_runner import run_batch, run_batch_cli
+
+
+# Member declarations of the stSensor struct, as in the reference SCL
+_ST_SENSOR_LINES = (
+    "  stSensor { ExternalAccessible := 'False'; ExternalVisible := 'False'; ExternalWritable := 'False'} : Struct   // Sensordeklaration",
+    "     bCarrierAtPreStop { ExternalAccessible := 'False'; ExternalVisible := 'False'; ExternalWritable := 'False'} : Bool;   // Werkstückträger am Vorstopper",
+    "     bCarrierBehindPreStop { ExternalAccessible := 'False'; ExternalVisible := 'False'; ExternalWritable := 'False'} : Bool;   // Werkstückträger hinter Vorstopper",
+    "     bCarrierAtMainStop { ExternalAccessible := 'False'; ExternalVisible := 'False'; ExternalWritable := 'False'} : Bool;   // Werkstückträger am Hauptstopper",
+    "     bCarrierBehindMainStop { ExternalAccessible := 'False'; ExternalVisible := 'False'; ExternalWritable := 'False'} : Bool;   // Werkstückträger hinter Hauptstopper",
+    "     bTestCylinderHome { ExternalAccessible := 'False'; ExternalVisible := 'False'; ExternalWritable := 'False'} : Bool;",
+    "     bTestCylinderWork { ExternalAccessible := 'False'; ExternalVisible := 'False'; ExternalWritable := 'False'} : Bool;",
+    "  END_STRUCT;",
+)
+
+# Placeholder call of the sequence mode FB for incomplete function calls
+_FB_SEQUENCE_MODE_CALL = """#fbSequenceMode(I_nStationNumber              := #I_nStationNumber,
+                    I_nSelectedStationNumber      := #I_nSelectedStationNumber,
+                    I_nMode                       := #IO_udtCellData.nMode,
+                    I_nTimeValueTimeoutSequence   := #nSequenceTimeOut,
+                    I_bStationIsDisabled          := #bStationIsDisabled,
+                    I_bSoftwareStop               := NOT #IO_udtCellData.bSafetyDoorsOK,
+                    O_bStationSelected            => #bStationSelected,
+                    O_bOnlyThisStationSelected    => #bOnlyThisStationSelected,
+                    O_bSequenceModeOn             => #bSequenceMode,
+                    O_bDifferenceStatusDetected   => #bDifferenceStatusDetected,
+                    IO_sCellData                  := #IO_udtCellData,
+                    IO_aDifferenceStatusDetect    := #aDifferenceStatusDetectedDrive,
+                    IO_bReverseOn                 := #bStepModeReverseON,
+                    IO_bExecuteSequenceToEnd      := #bExecuteSequenceToEnd);"""
+
+def _with_has_next(items: Iterable[str]) -> Iterator[Tuple[str, bool]]:
+    """Yield (item, has_next) pairs with one item of lookahead, so any iterable works"""
+    it = iter(items)
+    try:
+        current = next(it)
+    except StopIteration:
+        return
+    for following in it:
+        yield current, True
+        current = following
+    yield current, False
+
+
+def _format_attribute(attr_name: str, attr_value: str) -> str:
+    """Format one attribute, adding the S7_ prefix and capitalizing booleans"""
+    if not attr_name.startswith("S7_"):
+        attr_name = f"S7_{attr_name}"
+    lowered = attr_value.lower()
+    if lowered == "true" or lowered == "false":
+        attr_value = attr_value.capitalize()
+    return f"{attr_name} := '{attr_value}'"
+
+
+@lru_cache(maxsize=1024)
+def _format_attributes(datatype: str, version: str, attribute_items: Tuple[Tuple[str, str], ...]) -> str:
+    """Attribute block for a variable; attribute_items keeps the JSON order"""
+    # Add S7_SetPoint and other attributes
+    attr_parts = [_format_attribute(name, value) for name, value in attribute_items]
+
+    # For timer/FB types (TON_TIME, TOF_TIME, etc.), InstructionName and LibVersion come first
+    if version and datatype:
+        # Clean datatype (remove quotes if present)
+        clean_datatype = datatype.strip('"')
+        attr_parts[:0] = (f"InstructionName := '{clean_datatype}'", f"LibVersion := '{version}'")
+
+    if attr_parts:
+        return "{ " + "; ".join(attr_parts) + " }"
+    return ""
+
+
+# Rendered SCL bytes per source JSON state, and the SCL files written from them
+_output_cache = OutputCache()
 
 
 class JSONToSCLConverter:
     """Converts JSON structured data to SCL format"""
+
+    # Indentation strings for the usual nesting depths, so they are not rebuilt per line
+    _INDENTS = tuple("  " * i for i in range(16))
+
+    # Keywords that open an indented block when followed by a space
+    _INDENT_OPENERS = frozenset({"IF", "FOR", "WHILE", "CASE"})
+
+    # Comment lines inserted after specific regions
+    _REGION_COMMENTS = {
+        "REGION Sensor declaration": "// e.g.",
+        "REGION Station alarms": "// Initialize IO for alarm, warning and station ACK required",
+    }
+
+    # Map JSON section names to SCL section names
+    _SCL_SECTION_MAPPING = {
+        "input_section": "VAR_INPUT",
+        "output_section": "VAR_OUTPUT", 
+        "in_out_section": "VAR_IN_OUT",
+        "static_section": "VAR",
+        "temp_section": "VAR_TEMP",
+        "constant_section": "VAR CONSTANT"
+    }
+
+    # Static variables declared RETAIN in the reference SCL
+    _RETAIN_NAMES = frozenset({"bStationIsDisabled", "nStep", "nLastStep", "nActualTypeNumber"})
+
+    # Names handed out in order to bare REGION lines
+    _REGION_NAMES = (
+        "REGION Initialization",
+        "    REGION Sensor declaration", 
+        "    REGION Times",
+        "REGION Mode",
+        "REGION Station alarms",
+        "REGION Ident system",
+        "REGION Shiftregister and carrier logistics",
+        "    REGION Station is empty",
+        "REGION Bad parts in a row",
+        "REGION Buttons and switches",
+        "    REGION Station enable/disable",
+        "    REGION ... Additional buttons",
+        "REGION Sensor checks",
+        "REGION Mechanical free",
+        "REGION Sequence",
+        "    REGION Homing and syncic",
+        "    REGION Main sequence",
+        "        REGION Start",
+        "        REGION Steps"
+    )
+
+    # Placeholder assignments left by the SCL export and their replacements, in priority order
+    _STSENSOR_FIXES = {
+        "stSensor      := FALSE;": "#stSensor.bCarrierAtPreStop := FALSE;",
+        "stSensor  := FALSE;": "#stSensor.bCarrierBehindPreStop := FALSE;",
+        "stSensor     := FALSE;": "#stSensor.bCarrierAtMainStop := FALSE;",
+        "stSensor := FALSE;": "#stSensor.bCarrierBehindMainStop := FALSE;",
+        "stSensor      := TRUE;": "#stSensor.bTestCylinderHome := TRUE;",
+    }
+    _CELLDATA_FIXES = {
+        "IO_udtCellData       := FALSE;": "#IO_udtCellData.aStationError[#I_nStationNumber] := FALSE;",
+        "IO_udtCellData     := FALSE;": "#IO_udtCellData.aStationWarning[#I_nStationNumber] := FALSE;",
+        "IO_udtCellData := FALSE;": "#IO_udtCellData.aStationACKRequired[#I_nStationNumber] := FALSE;",
+    }
+    # One alternation per table, so a line is scanned once instead of once per literal
+    _STSENSOR_RE = re.compile("|".join(map(re.escape, _STSENSOR_FIXES)))
+    _CELLDATA_RE = re.compile("|".join(map(re.escape, _CELLDATA_FIXES)))
     
     def __init__(self):
         self.scl_content = []
+
+    @staticmethod
+    def clear_cache():
+        """Drop cached attribute strings, rendered SCL and written output records (mainly for tests)"""
+        _format_attributes.cache_clear()
+        _output_cache.clear()
         
     def convert_datatype(self, datatype: str) -> str:
-        """Convert JSON datatype to proper SCL format"""
+        """Convert JSON datatype to proper SCL format
+
+        Deprecated: datatypes pass through unchanged, so the section
+        generator no longer calls this. Kept for existing callers.
+        """
         # Keep quotes for UDT types - TIA Portal SCL requires quoted UDT references
         # e.g., "Rmaxis_IoIn" stays as "Rmaxis_IoIn"
         return datatype
     
-    def generate_variable_section(self, section_name: str, variables: List[Dict[str, str]]) -> List[str]:
-        """Generate SCL variable section with proper handling of RETAIN and struct variables"""
+    def _indent(self, level: int) -> str:
+        """Indentation string for a nesting level"""
+        return self._INDENTS[level] if level < len(self._INDENTS) else "  " * level
+
+    def generate_variable_section(self, section_name: str, variables: List[Dict[str, str]],
+                                  out: Optional[List[str]] = None) -> List[str]:
+        """Generate SCL variable section with proper handling of RETAIN and struct variables
+
+        Lines are appended to out when given (and out is returned), so callers
+        can build the whole file in one list.
+        """
+        section_lines = [] if out is None else out
         if not variables:
-            return []
-            
-        section_lines = []
-        
-        # Map JSON section names to SCL section names
-        scl_section_mapping = {
-            "input_section": "VAR_INPUT",
-            "output_section": "VAR_OUTPUT", 
-            "in_out_section": "VAR_IN_OUT",
-            "static_section": "VAR",
-            "temp_section": "VAR_TEMP",
-            "constant_section": "VAR CONSTANT"
-        }
+            return section_lines
         
         # Separate RETAIN variables for static section
         retain_variables = []
         regular_variables = []
         
-        for variable in variables:
-            var_name = variable.get("name", "")
-            # Check if this variable should be RETAIN based on the reference SCL
-            if section_name == "static_section" and var_name in ["bStationIsDisabled", "nStep", "nLastStep", "nActualTypeNumber"]:
-                retain_variables.append(variable)
-            else:
-                regular_variables.append(variable)
+        if section_name == "static_section":
+            for variable in variables:
+                # Check if this variable should be RETAIN based on the reference SCL
+                if variable.get("name", "") in self._RETAIN_NAMES:
+                    retain_variables.append(variable)
+                else:
+                    regular_variables.append(variable)
+        else:
+            regular_variables = variables
         
         # Generate regular variables section
         if regular_variables:
-            scl_section_name = scl_section_mapping.get(section_name, "VAR")
-            section_lines.append(scl_section_name)
-            
-            for variable in regular_variables:
-                var_name = variable.get("name", "")
-                var_datatype = self.convert_datatype(variable.get("datatype", ""))
-                default_value = variable.get("default_value", "")
-
-                if var_name and var_datatype:
-                    # Special handling for struct variables
-                    if var_name == "stSensor" and var_datatype == "Struct":
-                        section_lines.extend(self.generate_struct_definition(var_name))
-                    else:
-                        # Get variable attributes from JSON data
-                        attributes = self.get_variable_attributes(variable)
-                        # Build variable declaration with optional default value
-                        if default_value:
-                            if attributes:
-                                section_lines.append(f"  {var_name} {attributes} : {var_datatype} := {default_value};")
-                            else:
-                                section_lines.append(f"  {var_name} : {var_datatype} := {default_value};")
-                        else:
-                            if attributes:
-                                section_lines.append(f"  {var_name} {attributes} : {var_datatype};")
-                            else:
-                                section_lines.append(f"  {var_name} : {var_datatype};")
-            
-            section_lines.append("END_VAR")
-            section_lines.append("")  # Empty line after section
+            self._append_var_block(section_lines, self._SCL_SECTION_MAPPING.get(section_name, "VAR"), regular_variables)
         
         # Generate RETAIN variables section
         if retain_variables:
-            section_lines.append("VAR RETAIN")
-            for variable in retain_variables:
-                var_name = variable.get("name", "")
-                var_datatype = self.convert_datatype(variable.get("datatype", ""))
-                default_value = variable.get("default_value", "")
+            self._append_var_block(section_lines, "VAR RETAIN", retain_variables)
+        
+        return section_lines
+    
+    def _append_var_block(self, section_lines: List[str], keyword: str, variables: List[Dict[str, Any]]):
+        """Append one VAR ... END_VAR block for the given variables"""
+        section_lines.append(keyword)
+        
+        for variable in variables:
+            var_name = variable.get("name", "")
+            # Datatypes are used as-is; quotes on UDT references are kept (see convert_datatype)
+            var_datatype = variable.get("datatype", "")
 
-                if var_name and var_datatype:
+            if var_name and var_datatype:
+                # Special handling for struct variables
+                if var_name == "stSensor" and var_datatype == "Struct":
+                    section_lines.extend(self.generate_struct_definition(var_name))
+                else:
+                    # Get variable attributes from JSON data
                     attributes = self.get_variable_attributes(variable)
-                    # Build variable declaration with optional default value
-                    if default_value:
-                        if attributes:
-                            section_lines.append(f"  {var_name} {attributes} : {var_datatype} := {default_value};")
-                        else:
-                            section_lines.append(f"  {var_name} : {var_datatype} := {default_value};")
-                    else:
-                        if attributes:
-                            section_lines.append(f"  {var_name} {attributes} : {var_datatype};")
-                        else:
-                            section_lines.append(f"  {var_name} : {var_datatype};")
-            
-            section_lines.append("END_VAR")
-            section_lines.append("")
+                    section_lines.append(self._format_decl(var_name, attributes, var_datatype,
+                                                           variable.get("default_value", "")))
         
-        return section_lines
+        section_lines.append("END_VAR")
+        section_lines.append("")  # Empty line after section
+
+    @staticmethod
+    def _format_decl(name: str, attributes: str, datatype: str, default_value: str) -> str:
+        """Format a variable declaration with optional attributes and default value"""
+        attr_s = f" {attributes}" if attributes else ""
+        default_s = f" := {default_value}" if default_value else ""
+        return f"  {name}{attr_s} : {datatype}{default_s};"
     
     def get_variable_attributes(self, variable: Dict[str, Any]) -> str:
         """Build variable attributes string from JSON data
@@ -113,104 +260,100 @@ class JSONToSCLConverter:
         Formats attributes like:
         - Simple: { S7_SetPoint := 'False'}
         - Timer/FB: {InstructionName := 'TON_TIME'; LibVersion := '1.0'; S7_SetPoint := 'False'}
+
+        Variables with the same datatype, version and attributes (e.g. many Bool
+        I/Os with S7_SetPoint) share one cached result.
         """
-        attr_parts = []
-
-        # Get datatype for potential InstructionName
-        datatype = variable.get("datatype", "")
-        version = variable.get("version", "")
-        attributes = variable.get("attributes", {})
-
-        # For timer/FB types (TON_TIME, TOF_TIME, etc.), add InstructionName and LibVersion
-        if version and datatype:
-            # Clean datatype (remove quotes if present)
-            clean_datatype = datatype.strip('"')
-            attr_parts.append(f"InstructionName := '{clean_datatype}'")
-            attr_parts.append(f"LibVersion := '{version}'")
-
-        # Add S7_SetPoint and other attributes
-        for attr_name, attr_value in attributes.items():
-            # Format attribute name with S7_ prefix if not present
-            formatted_name = f"S7_{attr_name}" if not attr_name.startswith("S7_") else attr_name
-            # Capitalize boolean values
-            formatted_value = attr_value.capitalize() if attr_value.lower() in ['true', 'false'] else attr_value
-            attr_parts.append(f"{formatted_name} := '{formatted_value}'")
-
-        if attr_parts:
-            return "{ " + "; ".join(attr_parts) + " }"
-        return ""
+        return _format_attributes(
+            variable.get("datatype", ""),
+            variable.get("version", ""),
+            tuple(variable.get("attributes", {}).items()),
+        )
     
     def generate_struct_definition(self, struct_name: str) -> List[str]:
         """Generate struct definition based on reference SCL"""
-        struct_lines = []
-        
         if struct_name == "stSensor":
-            struct_lines.extend([
-                f"  {struct_name} {{ ExternalAccessible := 'False'; ExternalVisible := 'False'; ExternalWritable := 'False'}} : Struct   // Sensordeklaration",
-                "     bCarrierAtPreStop { ExternalAccessible := 'False'; ExternalVisible := 'False'; ExternalWritable := 'False'} : Bool;   // Werkstückträger am Vorstopper",
-                "     bCarrierBehindPreStop { ExternalAccessible := 'False'; ExternalVisible := 'False'; ExternalWritable := 'False'} : Bool;   // Werkstückträger hinter Vorstopper",
-                "     bCarrierAtMainStop { ExternalAccessible := 'False'; ExternalVisible := 'False'; ExternalWritable := 'False'} : Bool;   // Werkstückträger am Hauptstopper",
-                "     bCarrierBehindMainStop { ExternalAccessible := 'False'; ExternalVisible := 'False'; ExternalWritable := 'False'} : Bool;   // Werkstückträger hinter Hauptstopper",
-                "     bTestCylinderHome { ExternalAccessible := 'False'; ExternalVisible := 'False'; ExternalWritable := 'False'} : Bool;",
-                "     bTestCylinderWork { ExternalAccessible := 'False'; ExternalVisible := 'False'; ExternalWritable := 'False'} : Bool;",
-                "  END_STRUCT;"
-            ])
-        else:
-            # Default struct handling
-            struct_lines.append(f"  {struct_name} : Struct;")
-        
-        return struct_lines
+            return list(_ST_SENSOR_LINES)
+        # Default struct handling
+        return [f"  {struct_name} : Struct;"]
     
-    def format_code_lines(self, code_lines: List[str]) -> List[str]:
-        """Format code lines with proper indentation and fix common issues"""
-        formatted_lines = []
+    def format_code_lines(self, code_lines: Iterable[str], out: Optional[List[str]] = None) -> List[str]:
+        """Format code lines with proper indentation and fix common issues
+
+        code_lines may be any iterable (e.g. a generator streaming lines from
+        a parser); it is consumed once. Lines are appended to out when given
+        (and out is returned).
+        """
+        formatted_lines = [] if out is None else out
+        # Bound methods hoisted out of the loop; fixing and indenting happen in the same pass
+        append = formatted_lines.append
+        fix_line = self.fix_code_line_issues
+        indent_for = self._indent
         indent_level = 0
-        self._current_region_index = -1  # Reset region counter
+        indent = ""
+        # Bare REGION lines are named by position; kept local so conversions are reentrant
+        region_index = 0
         
-        for i, line in enumerate(code_lines):
+        for line, has_next in _with_has_next(code_lines):
             stripped_line = line.strip()
             
             if not stripped_line:
-                formatted_lines.append("")
+                append("")
                 continue
             
-            # Fix common issues in code lines
-            stripped_line = self.fix_code_line_issues(stripped_line)
+            if stripped_line == "REGION":
+                stripped_line = self._region_name(region_index)
+                region_index += 1
+            else:
+                # Fix common issues in code lines
+                stripped_line = fix_line(stripped_line)
+            
+            # Dispatch on the first word instead of a chain of prefix checks
+            first, sep, _ = stripped_line.partition(" ")
             
             # Add comments for specific regions
-            if stripped_line == "REGION Sensor declaration":
-                formatted_lines.append("  " * indent_level + stripped_line)
-                formatted_lines.append("  " * (indent_level + 1) + "// e.g.")
+            if first == "REGION" and stripped_line in self._REGION_COMMENTS:
+                append(indent + stripped_line)
                 indent_level += 1
+                indent = indent_for(indent_level)
+                append(indent + self._REGION_COMMENTS[stripped_line])
                 continue
-            elif stripped_line.startswith("#stSensor.bTestCylinderWork") and i < len(code_lines) - 1:
-                formatted_lines.append("  " * indent_level + stripped_line)
-                formatted_lines.append("  " * indent_level + "//... Additional sensor inputs")
-                continue
-            elif stripped_line == "REGION Station alarms":
-                formatted_lines.append("  " * indent_level + stripped_line)
-                formatted_lines.append("  " * (indent_level + 1) + "// Initialize IO for alarm, warning and station ACK required")
-                indent_level += 1
+            elif first.startswith("#stSensor.bTestCylinderWork") and has_next:
+                append(indent + stripped_line)
+                append(indent + "//... Additional sensor inputs")
                 continue
                 
             # Decrease indent for END statements
-            if stripped_line.startswith("END_"):
-                indent_level = max(0, indent_level - 1)
+            if first.startswith("END_"):
+                if indent_level:
+                    indent_level -= 1
+                    indent = indent_for(indent_level)
+                append(indent + stripped_line)
+                continue
             
             # Apply indentation
-            indented_line = "  " * indent_level + stripped_line
-            formatted_lines.append(indented_line)
+            append(indent + stripped_line)
             
             # Increase indent for REGION, IF, FOR, CASE, etc.
-            if (stripped_line.startswith("REGION") or 
-                stripped_line.startswith("IF ") or
-                stripped_line.startswith("FOR ") or
-                stripped_line.startswith("WHILE ") or
-                stripped_line.startswith("CASE ")):
+            if first.startswith("REGION") or (sep and first in self._INDENT_OPENERS):
                 indent_level += 1
+                indent = indent_for(indent_level)
         
         return formatted_lines
     
+    @staticmethod
+    def _apply_literal_fix(line: str, fixes: Dict[str, str], pattern: "re.Pattern") -> str:
+        """Replace the highest-priority literal from fixes that occurs in line"""
+        found = pattern.findall(line)
+        if not found:
+            return line
+        if len(found) > 1:
+            found = set(found)
+            key = next(k for k in fixes if k in found)
+        else:
+            key = found[0]
+        return line.replace(key, fixes[key])
+
     def fix_code_line_issues(self, line: str) -> str:
         """Fix common issues in code lines and add proper region names/comments"""
         # Skip empty or comment lines
@@ -225,34 +368,18 @@ class JSONToSCLConverter:
         if ":= ;" in line:
             if "nSequenceTimeOut" in line:
                 line = line.replace(":= ;", ":= T#8s;")
-            elif "Time" in line or "time" in line.lower():
+            elif "time" in line.lower():
                 line = line.replace(":= ;", ":= T#0ms;")
             else:
                 line = line.replace(":= ;", ":= 0;")
         
         # Fix incomplete struct member access (e.g., "stSensor" should be "stSensor.bTestCylinderHome")
-        if line.startswith("stSensor ") and ":=" in line:
-            if "stSensor      := FALSE;" in line:
-                line = line.replace("stSensor      := FALSE;", "#stSensor.bCarrierAtPreStop := FALSE;")
-            elif "stSensor  := FALSE;" in line:
-                line = line.replace("stSensor  := FALSE;", "#stSensor.bCarrierBehindPreStop := FALSE;")
-            elif "stSensor     := FALSE;" in line:
-                line = line.replace("stSensor     := FALSE;", "#stSensor.bCarrierAtMainStop := FALSE;")
-            elif "stSensor := FALSE;" in line:
-                line = line.replace("stSensor := FALSE;", "#stSensor.bCarrierBehindMainStop := FALSE;")
-            elif "stSensor      := TRUE;" in line:
-                line = line.replace("stSensor      := TRUE;", "#stSensor.bTestCylinderHome := TRUE;")
-            elif "stSensor      := FALSE;" in line:
-                line = line.replace("stSensor      := FALSE;", "#stSensor.bTestCylinderWork := FALSE;")
+        if line.startswith("stSensor "):
+            line = self._apply_literal_fix(line, self._STSENSOR_FIXES, self._STSENSOR_RE)
         
         # Fix array access patterns for IO_udtCellData
-        if "IO_udtCellData" in line and ":= FALSE;" in line:
-            if "IO_udtCellData       := FALSE;" in line:
-                line = line.replace("IO_udtCellData       := FALSE;", "#IO_udtCellData.aStationError[#I_nStationNumber] := FALSE;")
-            elif "IO_udtCellData     := FALSE;" in line:
-                line = line.replace("IO_udtCellData     := FALSE;", "#IO_udtCellData.aStationWarning[#I_nStationNumber] := FALSE;")
-            elif "IO_udtCellData := FALSE;" in line:
-                line = line.replace("IO_udtCellData := FALSE;", "#IO_udtCellData.aStationACKRequired[#I_nStationNumber] := FALSE;")
+        if "IO_udtCellData" in line:
+            line = self._apply_literal_fix(line, self._CELLDATA_FIXES, self._CELLDATA_RE)
         
         # Fix incomplete function calls - but not standalone semicolons in empty blocks
         # Only replace semicolon if it appears to be an incomplete function call placeholder
@@ -270,8 +397,19 @@ class JSONToSCLConverter:
         
         return line
     
+    @classmethod
+    def _region_name(cls, index: int) -> str:
+        """Name for the index-th bare REGION line"""
+        if index < len(cls._REGION_NAMES):
+            return cls._REGION_NAMES[index]
+        return "REGION"
+
     def get_region_name_from_context(self, line: str) -> str:
-        """Get proper region name based on context"""
+        """Get proper region name based on context
+
+        Used when fix_code_line_issues is called on its own; format_code_lines
+        tracks the region position locally instead.
+        """
         # This is a simplified approach - in a more robust implementation,
         # we'd track context through the parsing process
         if hasattr(self, '_current_region_index'):
@@ -279,50 +417,12 @@ class JSONToSCLConverter:
         else:
             self._current_region_index = 0
         
-        region_names = [
-            "REGION Initialization",
-            "    REGION Sensor declaration", 
-            "    REGION Times",
-            "REGION Mode",
-            "REGION Station alarms",
-            "REGION Ident system",
-            "REGION Shiftregister and carrier logistics",
-            "    REGION Station is empty",
-            "REGION Bad parts in a row",
-            "REGION Buttons and switches",
-            "    REGION Station enable/disable",
-            "    REGION ... Additional buttons",
-            "REGION Sensor checks",
-            "REGION Mechanical free",
-            "REGION Sequence",
-            "    REGION Homing and syncic",
-            "    REGION Main sequence",
-            "        REGION Start",
-            "        REGION Steps"
-        ]
-        
-        if self._current_region_index < len(region_names):
-            return region_names[self._current_region_index]
-        else:
-            return "REGION"
+        return self._region_name(self._current_region_index)
     
     def get_function_call_from_context(self) -> str:
         """Generate function call based on context"""
         # This would be expanded based on which function is being called
-        return """#fbSequenceMode(I_nStationNumber              := #I_nStationNumber,
-                    I_nSelectedStationNumber      := #I_nSelectedStationNumber,
-                    I_nMode                       := #IO_udtCellData.nMode,
-                    I_nTimeValueTimeoutSequence   := #nSequenceTimeOut,
-                    I_bStationIsDisabled          := #bStationIsDisabled,
-                    I_bSoftwareStop               := NOT #IO_udtCellData.bSafetyDoorsOK,
-                    O_bStationSelected            => #bStationSelected,
-                    O_bOnlyThisStationSelected    => #bOnlyThisStationSelected,
-                    O_bSequenceModeOn             => #bSequenceMode,
-                    O_bDifferenceStatusDetected   => #bDifferenceStatusDetected,
-                    IO_sCellData                  := #IO_udtCellData,
-                    IO_aDifferenceStatusDetect    := #aDifferenceStatusDetectedDrive,
-                    IO_bReverseOn                 := #bStepModeReverseON,
-                    IO_bExecuteSequenceToEnd      := #bExecuteSequenceToEnd);"""
+        return _FB_SEQUENCE_MODE_CALL
     
     def json_to_scl(self, json_file: str, output_scl_file: str = None) -> str:
         """
@@ -336,83 +436,128 @@ class JSONToSCLConverter:
             Generated SCL file path or None if failed
         """
         try:
-            # Read JSON file
-            with open(json_file, 'r', encoding='utf-8') as f:
-                json_data = json.load(f)
-            
-            # Extract metadata
-            metadata = json_data.get("metadata", {})
-            sections = json_data.get("sections", {})
-            code_lines = json_data.get("code", [])
-            
-            # Get block information
-            block_name = metadata.get("blockName", "") or metadata.get("name", "UnknownBlock")
-            block_number = metadata.get("blockNumber", "") or metadata.get("number", "1")
-            programming_language = metadata.get("programmingLanguage", "SCL")
-            memory_layout = metadata.get("memoryLayout", "Optimized")
-            
-            # Start building SCL content
-            scl_content = []
-            
-            # Function block header - match reference SCL format
-            scl_content.extend([
-                f'FUNCTION_BLOCK "{block_name}"',
-                f'{{ S7_Optimized_Access := \'TRUE\' }}',
-                ''
-            ])
-            
-            # Generate variable sections in proper order
-            section_order = [
-                "input_section", "output_section", "in_out_section", 
-                "static_section", "temp_section", "constant_section"
-            ]
-            
-            for section_name in section_order:
-                if section_name in sections:
-                    section_lines = self.generate_variable_section(section_name, sections[section_name])
-                    scl_content.extend(section_lines)
-            
-            # Begin code section
-            scl_content.append("BEGIN")
-            scl_content.append("")
-            
-            # Add formatted code
-            if code_lines:
-                formatted_code = self.format_code_lines(code_lines)
-                scl_content.extend(formatted_code)
-            else:
-                scl_content.extend([
-                    "  // No code available",
-                    "  // Add your logic here"
-                ])
-            
-            scl_content.append("")
-            scl_content.append("END_FUNCTION_BLOCK")
-            
             # Generate output file path if not provided
             if output_scl_file is None:
                 output_scl_file = os.path.splitext(json_file)[0] + ".scl"
+
+            key = source_key(json_file)
+
+            # Output written from this very input and untouched since - nothing to do
+            if _output_cache.is_up_to_date(key, output_scl_file):
+                logger.info(f"SCL file is up to date: {output_scl_file}")
+                return output_scl_file
+
+            scl_bytes = _output_cache.get(key)
+            if scl_bytes is None:
+                with open(json_file, 'rb') as f:
+                    json_data = _loads(f.read())
+                scl_text = self._render_scl(json_data)
+                # Same newline translation a text-mode write would do
+                if os.linesep != "\n":
+                    scl_text = scl_text.replace("\n", os.linesep)
+                scl_bytes = scl_text.encode('utf-8')
+                _output_cache.put(key, scl_bytes)
+
+            # Write SCL file as bytes in one call, no text-mode encoder in between
+            with open(output_scl_file, 'wb') as f:
+                f.write(scl_bytes)
+            _output_cache.record_output(key, output_scl_file)
             
-            # Write SCL file
-            with open(output_scl_file, 'w', encoding='utf-8') as f:
-                f.write('\n'.join(scl_content))
-            
-            print(f"Successfully converted JSON to SCL: {output_scl_file}")
+            logger.info(f"Successfully converted JSON to SCL: {output_scl_file}")
             return output_scl_file
             
         except Exception as e:
-            print(f"Error converting JSON to SCL: {e}")
+            logger.error(f"Error converting JSON to SCL: {e}")
             return None
 
+    def _render_scl(self, json_data: Dict[str, Any]) -> str:
+        """Build the SCL source text for parsed block JSON"""
+        # Extract metadata
+        metadata = json_data.get("metadata", {})
+        sections = json_data.get("sections", {})
+        code_lines = json_data.get("code", [])
+        
+        # Get block information
+        block_name = metadata.get("blockName", "") or metadata.get("name", "UnknownBlock")
+        block_number = metadata.get("blockNumber", "") or metadata.get("number", "1")
+        programming_language = metadata.get("programmingLanguage", "SCL")
+        memory_layout = metadata.get("memoryLayout", "Optimized")
+        
+        # Start building SCL content
+        scl_content = []
+        
+        # Function block header - match reference SCL format
+        scl_content.extend([
+            f'FUNCTION_BLOCK "{block_name}"',
+            f'{{ S7_Optimized_Access := \'TRUE\' }}',
+            ''
+        ])
+        
+        # Generate variable sections in proper order
+        section_order = [
+            "input_section", "output_section", "in_out_section", 
+            "static_section", "temp_section", "constant_section"
+        ]
+        
+        for section_name in section_order:
+            if section_name in sections:
+                self.generate_variable_section(section_name, sections[section_name], scl_content)
+        
+        # Begin code section
+        scl_content.append("BEGIN")
+        scl_content.append("")
+        
+        # Add formatted code
+        if code_lines:
+            self.format_code_lines(code_lines, scl_content)
+        else:
+            scl_content.extend([
+                "  // No code available",
+                "  // Add your logic here"
+            ])
+        
+        scl_content.append("")
+        scl_content.append("END_FUNCTION_BLOCK")
+
+        return '\n'.join(scl_content)
+
+
+def _convert_one(json_file: str, output_scl_file: Optional[str]) -> Optional[str]:
+    """Convert one JSON file in a worker process"""
+    return JSONToSCLConverter().json_to_scl(json_file, output_scl_file)
+
+
+def convert_many(json_files: List[str], output_dir: Optional[str] = None, max_workers: Optional[int] = None) -> List[Optional[str]]:
+    """
+    Convert several JSON files to SCL in parallel worker processes
+
+    Args:
+        json_files: Paths to input JSON files
+        output_dir: Directory for the SCL files (optional, next to each input by default)
+        max_workers: Number of worker processes (optional, one per CPU by default)
+
+    Returns:
+        List of generated SCL file paths, None for failed files, in input order
+    """
+    return run_batch(_convert_one, json_files, output_dir, ".scl", max_workers)
+
 
 def main():
     """Main function for command line usage"""
     import sys
     
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    
     if len(sys.argv) < 2:
         print("Usage: python json_to_scl.py <json_file> [output_scl_file]")
+        print("       python json_to_scl.py <json_dir or glob> [output_dir]")
         print("\nExample:")
         print("  python json_to_scl.py FB_Example.json FB_Example.scl")
+        print("  python json_to_scl.py \"exports/*.json\" scl_out")
+        return
+    
+    # Batch mode: a directory or a glob pattern
+    if run_batch_cli(sys.argv[1:], convert_many, ".json", "JSON"):
         return
     
     json_file = sys.argv[1]
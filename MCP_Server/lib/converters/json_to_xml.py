@@ -3,27 +3,95 @@ JSON to XML Converter for TIA Portal Blocks
 Converts JSON representation back to TIA Portal XML format
 Enhanced version with support for all block types (FB, FC, OB, DB)
 """
-import xml.etree.ElementTree as ET
+import io
 import os
-import json
 import re
-from xml.dom import minidom
-from typing import List, Dict, Any, Tuple
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
+# orjson parses several times faster than the stdlib; both accept bytes
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    import json
+    _loads = json.loads
+
+try:
+    from .batch_runner import run_batch, run_batch_cli
+except ImportError:
+    # Imported as a top-level module with lib/converters on sys.path
+    from batch_runner import run_batch, run_batch_cli
+
+# SCL operators; multi-character ones are matched before their prefixes
+_SCL_OPERATORS = [
+    ':=', '=', '<>', '>', '<', '>=', '<=', '+', '-', '*', '/', 'MOD',
+    'AND', 'OR', 'XOR', 'NOT', '&', 'THEN', 'ELSE', 'ELSEIF',
+    'DO', 'TO', 'BY', ';', '(', ')', '[', ']', ',', '.', ':'
+]
+
+_SCL_TRUE_FALSE = frozenset(('TRUE', 'FALSE'))
+
+# Operator alternation in match order, shared by both tokenizer paths
+_SCL_OPERATOR_PATTERN = '|'.join(re.escape(op) for op in sorted(_SCL_OPERATORS, key=len, reverse=True))
+_SCL_OPERATOR_RE = re.compile(_SCL_OPERATOR_PATTERN)
+
+# Single tokenizer pattern for ASCII lines, tried alternative by alternative in the
+# same order as the character loop in TIAXMLGenerator._tokenize_chars. Character
+# classes are spelled out so they match str.isspace()/isalnum() for ASCII exactly.
+_SCL_TOKEN_RE = re.compile(
+    r'(?P<WS>[ \t\n\r\x0b\x0c\x1c-\x1f]+)'
+    r'|(?P<STR>"[^"]*"?|\'[^\']*\'?)'
+    r'|(?P<LC>//)'
+    r'|(?P<BC>\(\*)'
+    r'|(?P<ADDR>%[A-Za-z0-9.]*)'
+    r'|(?P<OP>' + _SCL_OPERATOR_PATTERN + r')'
+    r'|(?P<TIME>[Tt]#[A-Za-z0-9._]*)'
+    r'|(?P<NUM>[0-9][0-9.]*)'
+    r'|(?P<ID>\#[A-Za-z0-9_]*|[A-Za-z_][A-Za-z0-9_]*)'
+    r'|(?P<UNK>.)',
+    re.DOTALL
+)
+_NON_ASCII_RE = re.compile(r'[^\x00-\x7f]')
+# Groups whose extent is decided by a character class; where they stop at a non-ASCII
+# character, str.isalnum()/isspace() may have kept going
+_SCL_RUN_GROUPS = frozenset(('WS', 'ADDR', 'TIME', 'NUM', 'ID'))
+
+
+@lru_cache(maxsize=4096)
+def _escape_xml(text: str) -> str:
+    """Escape XML special characters (cached, the same names and tokens recur all over a block)"""
+    # Substring tests and str.replace run on C string search; measured faster than
+    # both str.translate with a multi-character table and a re.sub callback
+    if not ('&' in text or '<' in text or '>' in text or '"' in text or "'" in text):
+        return text
+    text = text.replace('&', '&amp;')
+    text = text.replace('<', '&lt;')
+    text = text.replace('>', '&gt;')
+    text = text.replace('"', '&quot;')
+    text = text.replace("'", '&apos;')
+    return text
+
+
+# Tokenized lines keyed by (line, in_block_comment before the line), holding
+# (tokens, in_block_comment after the line). Shared by all generators, so the
+# END_IF;/RETURN; lines of every block are tokenized once per process.
+_tokenize_cache = {}
+_TOKENIZE_CACHE_SIZE = 8192
+
+# Fragments collected before StructuredText output is handed on as one chunk
+_STRUCTURED_TEXT_CHUNK = 4096
+
 
 class TIAXMLGenerator:
     """TIA Portal XML generator with enhanced UId management and structured text formatting"""
 
     def __init__(self):
         self.uid_counter = 1
-        self.scl_operators = [
-            ':=', '=', '<>', '>', '<', '>=', '<=', '+', '-', '*', '/', 'MOD',
-            'AND', 'OR', 'XOR', 'NOT', '&', 'THEN', 'ELSE', 'ELSEIF',
-            'DO', 'TO', 'BY', ';', '(', ')', '[', ']', ',', '.', ':'
-        ]
+        self.scl_operators = list(_SCL_OPERATORS)
         # Control flow and structure keywords (rendered as <Token>)
         self.scl_keywords = [
             'IF', 'THEN', 'ELSE', 'ELSIF', 'ELSEIF', 'END_IF', 'CASE', 'OF', 'END_CASE',
@@ -50,9 +118,18 @@ class TIAXMLGenerator:
             # Comparison
             'EQ', 'NE', 'LT', 'LE', 'GT', 'GE',
         ]
+        # Set views for the per-identifier lookups in _classify_identifier
+        self._scl_keywords_set = frozenset(self.scl_keywords)
+        self._scl_functions_set = frozenset(self.scl_functions)
         # State for tracking block comments across lines
         self.in_block_comment = False
 
+    @staticmethod
+    def clear_cache():
+        """Drop cached tokenized lines and escaped strings (mainly for tests)"""
+        _tokenize_cache.clear()
+        _escape_xml.cache_clear()
+
     def get_next_uid(self) -> str:
         """Get next UId for XML elements"""
         uid = str(self.uid_counter)
@@ -69,7 +146,35 @@ class TIAXMLGenerator:
         Enhanced tokenization based on xml_to_json.py logic
 
         Note: Leading whitespace (indentation) is preserved and converted to WHITESPACE tokens.
+        Repeated lines are served from a cache that also restores the block comment state.
         """
+        # Blank lines have no tokens (and keep the block comment state)
+        if not line:
+            return []
+        stripped = line.strip()
+        if not stripped:
+            return []
+        # Comment-only lines are mostly unique: build their tokens directly instead
+        # of running the tokenizer and filling the cache with them
+        if not self.in_block_comment and stripped.startswith('//'):
+            indent = line[:len(line) - len(line.lstrip(' \t'))]
+            leading_spaces = len(indent) + 3 * indent.count('\t')  # Tabs count as 4 spaces
+            if leading_spaces > 0:
+                return [('WHITESPACE', str(leading_spaces)), ('LINE_COMMENT', stripped[2:])]
+            return [('LINE_COMMENT', stripped[2:])]
+
+        key = (line, self.in_block_comment)
+        cached = _tokenize_cache.get(key)
+        if cached is None:
+            tokens = tuple(self._tokenize_line(line))
+            if len(_tokenize_cache) >= _TOKENIZE_CACHE_SIZE:
+                _tokenize_cache.clear()
+            cached = _tokenize_cache[key] = (tokens, self.in_block_comment)
+        self.in_block_comment = cached[1]
+        return list(cached[0])
+
+    def _tokenize_line(self, line: str) -> List[Tuple[str, str]]:
+        """Tokenize one line without the cache, updating the block comment state"""
         tokens = []
 
         # Check if line is empty or only whitespace
@@ -96,7 +201,87 @@ class TIAXMLGenerator:
         if not line:
             return tokens
 
+        # The precompiled pattern handles ASCII text (nearly all SCL, and the code part
+        # of lines with non-ASCII comments or strings); the character loop takes over
+        # where Unicode isalpha/isdigit matter
+        self._tokenize_regex(line, tokens)
+        return tokens
+
+    def _classify_identifier(self, identifier: str) -> Tuple[str, str]:
+        """Token for an identifier: constant, function, keyword or variable"""
+        upper_id = identifier.upper()
+        if upper_id in _SCL_TRUE_FALSE:
+            return ('CONSTANT', upper_id)
+        elif upper_id in self._scl_functions_set:
+            return ('FUNCTION', upper_id)
+        elif upper_id in self._scl_keywords_set:
+            return ('KEYWORD', upper_id)
+        return ('VARIABLE', identifier)
+
+    def _tokenize_regex(self, line: str, tokens: List[Tuple[str, str]]):
+        """
+        Tokenize a stripped line with _SCL_TOKEN_RE, appending to tokens
+
+        A token that starts at, or runs up to, a non-ASCII character hands the
+        rest of the line to _tokenize_chars.
+        """
+        match = _SCL_TOKEN_RE.match
+        append = tokens.append
         i = 0
+        n = len(line)
+        # Index of the next non-ASCII character at or after i (past the end if none)
+        non_ascii = n + 1 if line.isascii() else -1
+        while i < n:
+            # Handle Block Comment Content if already inside one
+            if self.in_block_comment:
+                close_idx = line.find('*)', i)
+                if close_idx != -1:
+                    append(('BLOCK_COMMENT', line[i:close_idx]))
+                    self.in_block_comment = False
+                    i = close_idx + 2
+                else:
+                    # Rest of line is part of block comment
+                    append(('BLOCK_COMMENT', line[i:]))
+                    i = n
+                continue
+
+            if non_ascii < i:
+                found = _NON_ASCII_RE.search(line, i)
+                non_ascii = found.start() if found else n + 1
+            if non_ascii == i:
+                self._tokenize_chars(line, tokens, i)
+                return
+
+            m = match(line, i)
+            kind = m.lastgroup
+            if kind in _SCL_RUN_GROUPS and m.end() == non_ascii:
+                self._tokenize_chars(line, tokens, i)
+                return
+            value = m.group()
+            i = m.end()
+            if kind == 'WS':
+                append(('WHITESPACE', str(len(value))))
+            elif kind == 'ID':
+                append(self._classify_identifier(value))
+            elif kind == 'OP':
+                append(('OPERATOR', value))
+            elif kind == 'STR' or kind == 'NUM':
+                append(('CONSTANT', value))
+            elif kind == 'TIME':
+                append(('CONSTANT', 'T#' + value[2:]))
+            elif kind == 'LC':
+                append(('LINE_COMMENT', line[i:]))
+                break
+            elif kind == 'BC':
+                self.in_block_comment = True
+            elif kind == 'ADDR':
+                append(('ADDRESS', value))
+            else:
+                append(('UNKNOWN', value))
+
+    def _tokenize_chars(self, line: str, tokens: List[Tuple[str, str]], start: int = 0):
+        """Tokenize a stripped line character by character from start, appending to tokens"""
+        i = start
         while i < len(line):
             # Handle Block Comment Content if already inside one
             if self.in_block_comment:
@@ -164,16 +349,11 @@ class TIAXMLGenerator:
                 tokens.append(('ADDRESS', addr_str))
                 continue
 
-            # Check for multi-character operators (sorted by length, longest first)
-            found_operator = False
-            for op in sorted(self.scl_operators, key=len, reverse=True):
-                if line[i:].startswith(op):
-                    tokens.append(('OPERATOR', op))
-                    i += len(op)
-                    found_operator = True
-                    break
-
-            if found_operator:
+            # Check for multi-character operators (longest first)
+            op_match = _SCL_OPERATOR_RE.match(line, i)
+            if op_match:
+                tokens.append(('OPERATOR', op_match.group()))
+                i = op_match.end()
                 continue
 
             # Handle numeric constants (including time constants like T#8s)
@@ -207,216 +387,127 @@ class TIAXMLGenerator:
                     i += 1
 
                 # Check if it's a keyword, function, or constant
-                upper_id = identifier.upper()
-                if upper_id in ['TRUE', 'FALSE']:
-                    tokens.append(('CONSTANT', upper_id))
-                elif upper_id in self.scl_functions:
-                    tokens.append(('FUNCTION', upper_id))
-                elif upper_id in self.scl_keywords:
-                    tokens.append(('KEYWORD', upper_id))
-                else:
-                    tokens.append(('VARIABLE', identifier))
+                tokens.append(self._classify_identifier(identifier))
                 continue
 
             # Handle other single characters
             tokens.append(('UNKNOWN', line[i]))
             i += 1
 
-        return tokens
-
     def create_structured_text_xml(self, code_lines: List[str]) -> str:
         """
         Create StructuredText XML from code lines
         Enhanced version with better token handling
         """
-        xml_elements = []
+        buf = io.StringIO()
+        self._emit_structured_text(code_lines, buf.write)
+        return buf.getvalue()
+
+    def write_structured_text(self, code_lines: List[str], out_fh):
+        """
+        Write the StructuredText XML for code_lines to an open text file
+
+        Same output as create_structured_text_xml, written in chunks so large
+        blocks are never held in memory as one string.
+        """
+        self._emit_structured_text(code_lines, out_fh.write)
+
+    def _emit_structured_text(self, code_lines: List[str], write):
+        """
+        Generate the StructuredText element, passing it to write in chunks
+
+        Every fragment is appended to one list with its leading newline and
+        %-formatted in one step; the list is joined and handed to write every
+        _STRUCTURED_TEXT_CHUNK fragments. UIds are counted in a local and
+        written back to uid_counter when done.
+        """
+        escape = _escape_xml  # Token values are always str, no need for the escape_xml wrapper
+        first_uid = uid = self.uid_counter
+        out = ['<StructuredText xmlns="http://www.siemens.com/automation/Openness/SW/NetworkSource/StructuredText/v4">']
+        append = out.append
 
         for line_idx, line in enumerate(code_lines):
+            if len(out) >= _STRUCTURED_TEXT_CHUNK:
+                write(''.join(out))
+                out.clear()
+
             if line_idx > 0:  # Add newline (except for first line)
-                xml_elements.append(f'  <NewLine UId="{self.get_next_uid()}" />')
+                append('\n  <NewLine UId="%d" />' % uid)
+                uid += 1
 
             # Handle empty lines
             if not line.strip():
                 continue
 
             tokens = self.tokenize_scl_line(line)
+            n_tokens = len(tokens)
 
             i = 0
-            while i < len(tokens):
+            while i < n_tokens:
                 token_type, token_value = tokens[i]
 
                 if token_type == 'WHITESPACE':
                     # Handle whitespace
                     if token_value == '1':
-                        xml_elements.append(f'  <Blank UId="{self.get_next_uid()}" />')
+                        append('\n  <Blank UId="%d" />' % uid)
+                        uid += 1
                     else:
-                        xml_elements.append(f'  <Blank Num="{token_value}" UId="{self.get_next_uid()}" />')
-                    i += 1
-
-                elif token_type == 'LINE_COMMENT':
-                    # Generate <LineComment> for single line comments
-                    lc_uid = self.get_next_uid()
-                    txt_uid = self.get_next_uid()
-                    xml_elements.append(f'  <LineComment UId="{lc_uid}">')
-                    xml_elements.append(f'    <Text UId="{txt_uid}">{self.escape_xml(token_value)}</Text>')
-                    xml_elements.append(f'  </LineComment>')
+                        append('\n  <Blank Num="%s" UId="%d" />' % (token_value, uid))
+                        uid += 1
                     i += 1
 
-                elif token_type == 'BLOCK_COMMENT':
-                    # Generate <LineComment Inserted="true"> for block comments
-                    lc_uid = self.get_next_uid()
-                    txt_uid = self.get_next_uid()
-                    xml_elements.append(f'  <LineComment Inserted="true" UId="{lc_uid}">')
-                    xml_elements.append(f'    <Text UId="{txt_uid}">{self.escape_xml(token_value)}</Text>')
-                    xml_elements.append(f'  </LineComment>')
+                elif token_type == 'LINE_COMMENT' or token_type == 'BLOCK_COMMENT':
+                    # <LineComment> for single line comments, <LineComment Inserted="true"> for block comments
+                    inserted = ' Inserted="true"' if token_type == 'BLOCK_COMMENT' else ''
+                    append('\n  <LineComment%s UId="%d">\n    <Text UId="%d">%s</Text>\n  </LineComment>'
+                           % (inserted, uid, uid + 1, escape(token_value)))
+                    uid += 2
                     i += 1
 
                 elif token_type == 'FUNCTION':
                     # SCL function call - check if followed by (
                     # Look ahead to see if there's a ( (possibly with whitespace in between)
                     lookahead = i + 1
-                    while lookahead < len(tokens) and tokens[lookahead][0] == 'WHITESPACE':
+                    while lookahead < n_tokens and tokens[lookahead][0] == 'WHITESPACE':
                         lookahead += 1
 
-                    if lookahead < len(tokens) and tokens[lookahead][0] == 'OPERATOR' and tokens[lookahead][1] == '(':
+                    if lookahead < n_tokens and tokens[lookahead] == ('OPERATOR', '('):
                         # This is a function call - generate <Access Scope="Call"><Instruction>
-                        access_uid = self.get_next_uid()
-                        instruction_uid = self.get_next_uid()
-
-                        xml_elements.append(f'  <Access Scope="Call" UId="{access_uid}">')
-                        xml_elements.append(f'    <Instruction Name="{self.escape_xml(token_value)}" UId="{instruction_uid}">')
+                        append('\n  <Access Scope="Call" UId="%d">\n    <Instruction Name="%s" UId="%d">'
+                               % (uid, escape(token_value), uid + 1))
+                        uid += 2
                         i += 1
 
                         # Handle whitespace between function name and (
-                        while i < len(tokens) and tokens[i][0] == 'WHITESPACE':
+                        while i < n_tokens and tokens[i][0] == 'WHITESPACE':
                             # Add blanks inside the instruction
                             ws_val = tokens[i][1]
                             if ws_val == '1':
-                                xml_elements.append(f'      <Blank UId="{self.get_next_uid()}" />')
+                                append('\n      <Blank UId="%d" />' % uid)
+                                uid += 1
                             else:
-                                xml_elements.append(f'      <Blank Num="{ws_val}" UId="{self.get_next_uid()}" />')
+                                append('\n      <Blank Num="%s" UId="%d" />' % (ws_val, uid))
+                                uid += 1
                             i += 1
 
                         # Now consume the opening (
-                        if i < len(tokens) and tokens[i][0] == 'OPERATOR' and tokens[i][1] == '(':
-                            xml_elements.append(f'      <Token Text="(" UId="{self.get_next_uid()}" />')
+                        if i < n_tokens and tokens[i] == ('OPERATOR', '('):
+                            append('\n      <Token Text="(" UId="%d" />' % uid)
+                            uid += 1
                             i += 1
+                            i, uid = self._append_call_parameters(tokens, i, uid, out)
 
-                            # Parse parameters until closing )
-                            # Parameters are separated by commas, can be nested expressions
-                            param_depth = 1
-                            param_elements = []
-                            param_start_uid = None
-
-                            while i < len(tokens) and param_depth > 0:
-                                pt, pv = tokens[i]
-
-                                if pt == 'OPERATOR' and pv == '(':
-                                    param_depth += 1
-                                    param_elements.append(f'        <Token Text="(" UId="{self.get_next_uid()}" />')
-                                    i += 1
-                                elif pt == 'OPERATOR' and pv == ')':
-                                    param_depth -= 1
-                                    if param_depth == 0:
-                                        # Close any open parameter
-                                        if param_elements:
-                                            param_uid = self.get_next_uid()
-                                            xml_elements.append(f'      <NamelessParameter UId="{param_uid}">')
-                                            xml_elements.extend(param_elements)
-                                            xml_elements.append('      </NamelessParameter>')
-                                            param_elements = []
-                                        # Add closing paren
-                                        xml_elements.append(f'      <Token Text=")" UId="{self.get_next_uid()}" />')
-                                        i += 1
-                                    else:
-                                        param_elements.append(f'        <Token Text=")" UId="{self.get_next_uid()}" />')
-                                        i += 1
-                                elif pt == 'OPERATOR' and pv == ',' and param_depth == 1:
-                                    # Parameter separator - close current parameter, start new one
-                                    if param_elements:
-                                        param_uid = self.get_next_uid()
-                                        xml_elements.append(f'      <NamelessParameter UId="{param_uid}">')
-                                        xml_elements.extend(param_elements)
-                                        xml_elements.append('      </NamelessParameter>')
-                                        param_elements = []
-                                    xml_elements.append(f'      <Token Text="," UId="{self.get_next_uid()}" />')
-                                    i += 1
-                                elif pt == 'WHITESPACE':
-                                    ws_val = pv
-                                    if ws_val == '1':
-                                        param_elements.append(f'        <Blank UId="{self.get_next_uid()}" />')
-                                    else:
-                                        param_elements.append(f'        <Blank Num="{ws_val}" UId="{self.get_next_uid()}" />')
-                                    i += 1
-                                elif pt == 'VARIABLE':
-                                    # Variable in parameter
-                                    var_name = pv
-                                    scope = "LocalVariable"
-                                    if var_name.startswith('#'):
-                                        var_name = var_name[1:]
-                                    elif var_name.startswith('"') and var_name.endswith('"'):
-                                        scope = "GlobalVariable"
-                                        var_name = var_name[1:-1]
-
-                                    acc_uid = self.get_next_uid()
-                                    sym_uid = self.get_next_uid()
-                                    comp_uid = self.get_next_uid()
-                                    param_elements.append(f'        <Access Scope="{scope}" UId="{acc_uid}">')
-                                    param_elements.append(f'          <Symbol UId="{sym_uid}">')
-                                    param_elements.append(f'            <Component Name="{self.escape_xml(var_name)}" UId="{comp_uid}" />')
-
-                                    # Check for member access
-                                    i += 1
-                                    while i < len(tokens) and tokens[i][0] == 'OPERATOR' and tokens[i][1] == '.':
-                                        param_elements.append(f'            <Token Text="." UId="{self.get_next_uid()}" />')
-                                        i += 1
-                                        if i < len(tokens) and tokens[i][0] == 'VARIABLE':
-                                            mem_name = tokens[i][1]
-                                            mem_uid = self.get_next_uid()
-                                            param_elements.append(f'            <Component Name="{self.escape_xml(mem_name)}" UId="{mem_uid}" />')
-                                            i += 1
-                                        elif i < len(tokens) and tokens[i][0] == 'ADDRESS':
-                                            addr_uid = self.get_next_uid()
-                                            param_elements.append(f'            <Token Text="{self.escape_xml(tokens[i][1])}" UId="{addr_uid}" />')
-                                            i += 1
-                                        else:
-                                            break
-
-                                    param_elements.append('          </Symbol>')
-                                    param_elements.append('        </Access>')
-                                elif pt == 'CONSTANT':
-                                    scope = "TypedConstant" if pv.startswith('T#') else "LiteralConstant"
-                                    acc_uid = self.get_next_uid()
-                                    const_uid = self.get_next_uid()
-                                    val_uid = self.get_next_uid()
-                                    param_elements.append(f'        <Access Scope="{scope}" UId="{acc_uid}">')
-                                    param_elements.append(f'          <Constant UId="{const_uid}">')
-                                    param_elements.append(f'            <ConstantValue UId="{val_uid}">{self.escape_xml(pv)}</ConstantValue>')
-                                    param_elements.append('          </Constant>')
-                                    param_elements.append('        </Access>')
-                                    i += 1
-                                elif pt in ['KEYWORD', 'OPERATOR']:
-                                    param_elements.append(f'        <Token Text="{self.escape_xml(pv)}" UId="{self.get_next_uid()}" />')
-                                    i += 1
-                                elif pt == 'FUNCTION':
-                                    # Nested function call - for now just treat as token
-                                    # TODO: Full recursive function call handling
-                                    param_elements.append(f'        <Token Text="{self.escape_xml(pv)}" UId="{self.get_next_uid()}" />')
-                                    i += 1
-                                else:
-                                    param_elements.append(f'        <Token Text="{self.escape_xml(pv)}" UId="{self.get_next_uid()}" />')
-                                    i += 1
-
-                        xml_elements.append('    </Instruction>')
-                        xml_elements.append('  </Access>')
+                        append('\n    </Instruction>\n  </Access>')
                     else:
                         # Function name without () - just treat as token
-                        xml_elements.append(f'  <Token Text="{self.escape_xml(token_value)}" UId="{self.get_next_uid()}" />')
+                        append('\n  <Token Text="%s" UId="%d" />' % (escape(token_value), uid))
+                        uid += 1
                         i += 1
 
-                elif token_type in ['KEYWORD', 'OPERATOR']:
+                elif token_type == 'KEYWORD' or token_type == 'OPERATOR':
                     # Keywords and operators as tokens
-                    xml_elements.append(f'  <Token Text="{self.escape_xml(token_value)}" UId="{self.get_next_uid()}" />')
+                    append('\n  <Token Text="%s" UId="%d" />' % (escape(token_value), uid))
+                    uid += 1
                     i += 1
 
                 elif token_type == 'VARIABLE' or token_type == 'ADDRESS':
@@ -431,141 +522,191 @@ class TIAXMLGenerator:
                         # Remove # prefix for component name but keep scope info
                         if var_name.startswith('#'):
                             var_name = var_name[1:]
-                            scope = "LocalVariable"
                         elif var_name.startswith('"') and var_name.endswith('"'):
                             scope = "GlobalVariable"
                             var_name = var_name[1:-1]  # Remove quotes for component name
+                        element = 'Component Name'
                     else:
-                        # Direct address like %I0.0 or %X0
+                        # Direct address like %I0.0 or %X0, as token inside Symbol
                         scope = "GlobalVariable" # Addresses are typically global or direct access
+                        element = 'Token Text'
+
+                    append('\n  <Access Scope="%s" UId="%d">\n    <Symbol UId="%d">\n      <%s="%s" UId="%d" />'
+                           % (scope, uid, uid + 1, element, escape(var_name), uid + 2))
+                    uid += 3
 
-                    access_uid = self.get_next_uid()
-                    symbol_uid = self.get_next_uid()
-                    
-                    xml_elements.append(f'  <Access Scope="{scope}" UId="{access_uid}">')
-                    xml_elements.append(f'    <Symbol UId="{symbol_uid}">')
-                    
-                    if token_type == 'VARIABLE':
-                        component_uid = self.get_next_uid()
-                        xml_elements.append(f'      <Component Name="{self.escape_xml(var_name)}" UId="{component_uid}" />')
-                    else:
-                        # Address as token inside Symbol (like %X0)
-                        token_uid = self.get_next_uid()
-                        xml_elements.append(f'      <Token Text="{self.escape_xml(var_name)}" UId="{token_uid}" />')
-                    
                     i += 1
 
                     # Look ahead for .Member or .%Address
-                    while i < len(tokens):
-                        # Check for dot operator
-                        next_type, next_val = tokens[i]
-                        
-                        # Skip whitespace in lookahead but we need to decide if whitespace breaks a symbol chain
-                        # In SCL "Var . Member" is valid but rare. Usually "Var.Member".
-                        # For now, if we see whitespace, we'll process it if it's followed by a dot,
-                        # but if we are expecting a member and see whitespace, it's tricky.
-                        # Simplification: If we see a DOT, we continue the chain.
-                        
-                        is_dot = False
-                        whitespace_idx = -1
-                        
-                        # Peek ahead skipping whitespace to find DOT
-                        temp_i = i
-                        while temp_i < len(tokens) and tokens[temp_i][0] == 'WHITESPACE':
-                            temp_i += 1
-                        
-                        if temp_i < len(tokens) and tokens[temp_i][0] == 'OPERATOR' and tokens[temp_i][1] == '.':
-                            # Found a dot! Consume intervening whitespace (if any) as Blanks inside Access?? 
-                            # Actually TIA XML usually puts Blanks OUTSIDE the Access/Symbol for "Var . Member".
-                            # But "Var.Member" is one Access.
-                            # If there is whitespace, it might be safer to break the chain unless we are sure.
-                            # However, strictly speaking, Var.Member is one symbol path.
-                            
-                            # Let's support standard Var.Member without spaces first. 
-                            # If we encounter whitespace immediately after current component, we break the chain
-                            # unless we want to support "Var . Member".
-                            # Based on typical TIA export, it's tight.
-                            pass
-                        
-                        # Current simplified logic: Only extend if immediate DOT
-                        if i < len(tokens) and tokens[i][0] == 'OPERATOR' and tokens[i][1] == '.':
-                            # Add Dot Token
-                            dot_uid = self.get_next_uid()
-                            xml_elements.append(f'      <Token Text="." UId="{dot_uid}" />')
+                    # Only an immediate DOT extends the symbol chain ("Var.Member"), as in TIA exports
+                    while i < n_tokens and tokens[i] == ('OPERATOR', '.'):
+                        # Add Dot Token
+                        append('\n      <Token Text="." UId="%d" />' % uid)
+                        uid += 1
+                        i += 1
+
+                        # Now we expect a VARIABLE (Component) or ADDRESS (Token)
+                        if i >= n_tokens:
+                            break
+                        member_type, member_val = tokens[i]
+                        if member_type == 'VARIABLE':
+                            # It's a component member
+                            # Strip quotes if present (unlikely for member but possible)
+                            if member_val.startswith('"') and member_val.endswith('"'):
+                                member_val = member_val[1:-1]
+                            append('\n      <Component Name="%s" UId="%d" />' % (escape(member_val), uid))
+                            uid += 1
+                            i += 1
+                        elif member_type == 'ADDRESS':
+                            # It's a slice access like %X0
+                            append('\n      <Token Text="%s" UId="%d" />' % (escape(member_val), uid))
+                            uid += 1
                             i += 1
-                            
-                            # Now we expect a VARIABLE (Component) or ADDRESS (Token)
-                            if i < len(tokens):
-                                member_type, member_val = tokens[i]
-                                if member_type == 'VARIABLE':
-                                    # It's a component member
-                                    comp_uid = self.get_next_uid()
-                                    # Strip quotes if present (unlikely for member but possible)
-                                    mem_name = member_val
-                                    if mem_name.startswith('"') and mem_name.endswith('"'):
-                                        mem_name = mem_name[1:-1]
-                                    xml_elements.append(f'      <Component Name="{self.escape_xml(mem_name)}" UId="{comp_uid}" />')
-                                    i += 1
-                                elif member_type == 'ADDRESS':
-                                    # It's a slice access like %X0
-                                    tok_uid = self.get_next_uid()
-                                    xml_elements.append(f'      <Token Text="{self.escape_xml(member_val)}" UId="{tok_uid}" />')
-                                    i += 1
-                                else:
-                                    # Trailing dot or unexpected token? 
-                                    # Should not happen in valid code, but we break to be safe
-                                    break
-                            else:
-                                break
                         else:
-                            # Not a dot, end of symbol chain
+                            # Trailing dot or unexpected token? 
+                            # Should not happen in valid code, but we break to be safe
                             break
 
-                    xml_elements.append('    </Symbol>')
-                    xml_elements.append('  </Access>')
+                    append('\n    </Symbol>\n  </Access>')
 
                 elif token_type == 'CONSTANT':
                     # Literal constants
                     scope = "TypedConstant" if token_value.startswith('T#') else "LiteralConstant"
-                    access_uid = self.get_next_uid()
-                    constant_uid = self.get_next_uid()
-                    value_uid = self.get_next_uid()
-
-                    xml_elements.append(f'  <Access Scope="{scope}" UId="{access_uid}">')
-                    xml_elements.append(f'    <Constant UId="{constant_uid}">')
-                    xml_elements.append(f'      <ConstantValue UId="{value_uid}">{self.escape_xml(token_value)}</ConstantValue>')
-                    xml_elements.append('    </Constant>')
-                    xml_elements.append('  </Access>')
+                    append('\n  <Access Scope="%s" UId="%d">\n    <Constant UId="%d">\n'
+                           '      <ConstantValue UId="%d">%s</ConstantValue>\n    </Constant>\n  </Access>'
+                           % (scope, uid, uid + 1, uid + 2, escape(token_value)))
+                    uid += 3
                     i += 1
 
                 else:
                     # Unknown types as tokens
-                    xml_elements.append(f'  <Token Text="{self.escape_xml(token_value)}" UId="{self.get_next_uid()}" />')
+                    append('\n  <Token Text="%s" UId="%d" />' % (escape(token_value), uid))
+                    uid += 1
                     i += 1
 
-        # Assemble complete StructuredText element
-        structured_text = '<StructuredText xmlns="http://www.siemens.com/automation/Openness/SW/NetworkSource/StructuredText/v4">\n'
-        structured_text += '\n'.join(xml_elements)
-        structured_text += '\n</StructuredText>'
+        self.uid_counter = uid
+
+        # Close the StructuredText element (an empty one still gets its blank line)
+        if uid == first_uid:
+            append('\n')
+        append('\n</StructuredText>')
+        write(''.join(out))
+
+    def _append_call_parameters(self, tokens: List[Tuple[str, str]], i: int, uid: int,
+                                out: List[str]) -> Tuple[int, int]:
+        """
+        Append the parameters of a function call after its opening (
+
+        Parameters are separated by commas and can be nested expressions; each
+        one is wrapped in <NamelessParameter>. Returns the index after the
+        closing ) (or the end of the tokens) and the next free UId.
+        """
+        escape = _escape_xml  # Token values are always str, no need for the escape_xml wrapper
+        n_tokens = len(tokens)
+        param_depth = 1
+        param_elements = []
+
+        while i < n_tokens and param_depth > 0:
+            pt, pv = tokens[i]
+
+            if pt == 'OPERATOR' and pv == '(':
+                param_depth += 1
+                param_elements.append('\n        <Token Text="(" UId="%d" />' % uid)
+                uid += 1
+                i += 1
+            elif pt == 'OPERATOR' and pv == ')':
+                param_depth -= 1
+                if param_depth == 0:
+                    # Close any open parameter
+                    if param_elements:
+                        out.append('\n      <NamelessParameter UId="%d">' % uid)
+                        uid += 1
+                        out.extend(param_elements)
+                        out.append('\n      </NamelessParameter>')
+                        param_elements = []
+                    # Add closing paren
+                    out.append('\n      <Token Text=")" UId="%d" />' % uid)
+                    uid += 1
+                else:
+                    param_elements.append('\n        <Token Text=")" UId="%d" />' % uid)
+                    uid += 1
+                i += 1
+            elif pt == 'OPERATOR' and pv == ',' and param_depth == 1:
+                # Parameter separator - close current parameter, start new one
+                if param_elements:
+                    out.append('\n      <NamelessParameter UId="%d">' % uid)
+                    uid += 1
+                    out.extend(param_elements)
+                    out.append('\n      </NamelessParameter>')
+                    param_elements = []
+                out.append('\n      <Token Text="," UId="%d" />' % uid)
+                uid += 1
+                i += 1
+            elif pt == 'WHITESPACE':
+                if pv == '1':
+                    param_elements.append('\n        <Blank UId="%d" />' % uid)
+                    uid += 1
+                else:
+                    param_elements.append('\n        <Blank Num="%s" UId="%d" />' % (pv, uid))
+                    uid += 1
+                i += 1
+            elif pt == 'VARIABLE':
+                # Variable in parameter
+                var_name = pv
+                scope = "LocalVariable"
+                if var_name.startswith('#'):
+                    var_name = var_name[1:]
+                elif var_name.startswith('"') and var_name.endswith('"'):
+                    scope = "GlobalVariable"
+                    var_name = var_name[1:-1]
+
+                param_elements.append('\n        <Access Scope="%s" UId="%d">\n          <Symbol UId="%d">\n'
+                                      '            <Component Name="%s" UId="%d" />'
+                                      % (scope, uid, uid + 1, escape(var_name), uid + 2))
+                uid += 3
+
+                # Check for member access
+                i += 1
+                while i < n_tokens and tokens[i] == ('OPERATOR', '.'):
+                    param_elements.append('\n            <Token Text="." UId="%d" />' % uid)
+                    uid += 1
+                    i += 1
+                    if i < n_tokens and tokens[i][0] == 'VARIABLE':
+                        param_elements.append('\n            <Component Name="%s" UId="%d" />'
+                                              % (escape(tokens[i][1]), uid))
+                        uid += 1
+                        i += 1
+                    elif i < n_tokens and tokens[i][0] == 'ADDRESS':
+                        param_elements.append('\n            <Token Text="%s" UId="%d" />'
+                                              % (escape(tokens[i][1]), uid))
+                        uid += 1
+                        i += 1
+                    else:
+                        break
+
+                param_elements.append('\n          </Symbol>\n        </Access>')
+            elif pt == 'CONSTANT':
+                scope = "TypedConstant" if pv.startswith('T#') else "LiteralConstant"
+                param_elements.append('\n        <Access Scope="%s" UId="%d">\n          <Constant UId="%d">\n'
+                                      '            <ConstantValue UId="%d">%s</ConstantValue>\n          </Constant>\n        </Access>'
+                                      % (scope, uid, uid + 1, uid + 2, escape(pv)))
+                uid += 3
+                i += 1
+            else:
+                # Keywords, operators, nested function calls (not expanded yet) and anything else as tokens
+                param_elements.append('\n        <Token Text="%s" UId="%d" />' % (escape(pv), uid))
+                uid += 1
+                i += 1
 
-        return structured_text
+        return i, uid
 
     def escape_xml(self, text: str) -> str:
         """Escape XML special characters"""
-        text = str(text)
-        text = text.replace('&', '&amp;')
-        text = text.replace('<', '&lt;')
-        text = text.replace('>', '&gt;')
-        text = text.replace('"', '&quot;')
-        text = text.replace("'", '&apos;')
-        return text
+        return _escape_xml(text if type(text) is str else str(text))
 
 
-def get_xml_template(block_type: str) -> str:
-    """Get the XML template for the specified block type"""
-
-    # FB (Function Block) template
-    fb_template = '''<?xml version="1.0" encoding="utf-8"?>
+# FB (Function Block) template
+_FB_TEMPLATE = '''<?xml version="1.0" encoding="utf-8"?>
 <Document>
   <Engineering version="{engineering_version}" />
   <DocumentInfo>
@@ -636,8 +777,8 @@ def get_xml_template(block_type: str) -> str:
   </SW.Blocks.FB>
 </Document>'''
 
-    # FC (Function) template - similar to FB but with SW.Blocks.FC
-    fc_template = '''<?xml version="1.0" encoding="utf-8"?>
+# FC (Function) template - similar to FB but with SW.Blocks.FC
+_FC_TEMPLATE = '''<?xml version="1.0" encoding="utf-8"?>
 <Document>
   <Engineering version="{engineering_version}" />
   <DocumentInfo>
@@ -707,8 +848,8 @@ def get_xml_template(block_type: str) -> str:
   </SW.Blocks.FC>
 </Document>'''
 
-    # OB (Organization Block) template
-    ob_template = '''<?xml version="1.0" encoding="utf-8"?>
+# OB (Organization Block) template
+_OB_TEMPLATE = '''<?xml version="1.0" encoding="utf-8"?>
 <Document>
   <Engineering version="{engineering_version}" />
   <DocumentInfo>
@@ -779,8 +920,8 @@ def get_xml_template(block_type: str) -> str:
   </SW.Blocks.OB>
 </Document>'''
 
-    # GlobalDB (Data Block) template
-    db_template = '''<?xml version="1.0" encoding="utf-8"?>
+# GlobalDB (Data Block) template
+_DB_TEMPLATE = '''<?xml version="1.0" encoding="utf-8"?>
 <Document>
   <Engineering version="{engineering_version}" />
   <DocumentInfo>
@@ -822,101 +963,141 @@ def get_xml_template(block_type: str) -> str:
   </SW.Blocks.GlobalDB>
 </Document>'''
 
-    templates = {
-        "FB": fb_template,
-        "FC": fc_template,
-        "OB": ob_template,
-        "GlobalDB": db_template,
-        "InstanceDB": db_template  # Use same template for instance DB
-    }
+_XML_TEMPLATES = {
+    "FB": _FB_TEMPLATE,
+    "FC": _FC_TEMPLATE,
+    "OB": _OB_TEMPLATE,
+    "GlobalDB": _DB_TEMPLATE,
+    "InstanceDB": _DB_TEMPLATE  # Use same template for instance DB
+}
+
+
+def _split_template(template: str) -> Tuple[str, str]:
+    """
+    Split a template around {structured_text} into %-style head and tail
+
+    The {name} fields become %(name)s, so filling a template is a single %
+    with the field dict and the StructuredText can be written in between.
+    """
+    head, _, tail = template.replace('%', '%%').partition('{structured_text}')
+    to_percent = re.compile(r'\{(\w+)\}')
+    return to_percent.sub(r'%(\1)s', head), to_percent.sub(r'%(\1)s', tail)
+
+
+# (head, tail) of each template, prepared once at import
+_SPLIT_TEMPLATES = {block_type: _split_template(template) for block_type, template in _XML_TEMPLATES.items()}
+
 
-    return templates.get(block_type, fb_template)
+def get_xml_template(block_type: str) -> str:
+    """Get the XML template for the specified block type"""
+    return _XML_TEMPLATES.get(block_type, _FB_TEMPLATE)
+
+
+def get_split_xml_template(block_type: str) -> Tuple[str, str]:
+    """Get the %-style (head, tail) of the XML template around the StructuredText"""
+    return _SPLIT_TEMPLATES.get(block_type, _SPLIT_TEMPLATES["FB"])
+
+# Block attributes filled in when the JSON metadata leaves them out
+_METADATA_DEFAULTS = {
+    "blockType": "FB",
+    "engineeringVersion": "V20",
+    "memoryLayout": "Optimized",
+    "memoryReserve": "100",
+    "programmingLanguage": "SCL",
+    "enoSetting": "false",
+}
+
+_DEFAULT_INTERFACE_NS = "http://www.siemens.com/automation/Openness/SW/Interface/v5"
+
+# Interface sections per block type as (JSON section, XML section); other types use FB
+# For FC: Input, Output, InOut, Temp, Constant, Return
+# For FB: Input, Output, InOut, Static, Temp, Constant
+# For OB: Input (for OB parameters), Temp, Constant
+# For DB: Static (for data members)
+_SECTION_ORDER = {
+    "FC": (
+        ("input_section", "Input"),
+        ("output_section", "Output"),
+        ("in_out_section", "InOut"),
+        ("temp_section", "Temp"),
+        ("constant_section", "Constant"),
+        ("return_section", "Return"),  # FC has Return section
+    ),
+    "OB": (
+        ("input_section", "Input"),
+        ("temp_section", "Temp"),
+        ("constant_section", "Constant"),
+    ),
+    "GlobalDB": (
+        ("static_section", "Static"),  # DB uses Static for data members
+    ),
+    "InstanceDB": (
+        ("static_section", "Static"),
+    ),
+    "FB": (
+        ("input_section", "Input"),
+        ("output_section", "Output"),
+        ("in_out_section", "InOut"),
+        ("static_section", "Static"),
+        ("temp_section", "Temp"),
+        ("constant_section", "Constant"),
+    ),
+}
+
+# Buffer size for writing the generated XML file
+_WRITE_BUFFER_SIZE = 1 << 20
 
 
 def generate_sections_xml(sections: dict, metadata: dict, xml_gen: 'TIAXMLGenerator') -> str:
     """Generate the Sections XML based on block type and variables"""
 
-    interface_ns = metadata.get("xmlNamespaceInfo", {}).get("interface", {}).get("namespace",
-                                "http://www.siemens.com/automation/Openness/SW/Interface/v5")
+    try:
+        interface_ns = metadata["xmlNamespaceInfo"]["interface"]["namespace"]
+    except KeyError:
+        interface_ns = _DEFAULT_INTERFACE_NS
 
     block_type = metadata.get("blockType", "FB")
-    return_type = metadata.get("returnType")
-
-    sections_xml = f'<Sections xmlns="{interface_ns}">\n'
-
-    # Section mapping between JSON and XML
-    # For FC: Input, Output, InOut, Temp, Constant, Return
-    # For FB: Input, Output, InOut, Static, Temp, Constant
-    # For OB: Input (for OB parameters), Temp
-    # For DB: Static (for data members)
-
-    if block_type == "FC":
-        section_order = [
-            ("input_section", "Input"),
-            ("output_section", "Output"),
-            ("in_out_section", "InOut"),
-            ("temp_section", "Temp"),
-            ("constant_section", "Constant"),
-            ("return_section", "Return")  # FC has Return section
-        ]
-    elif block_type == "OB":
-        section_order = [
-            ("input_section", "Input"),
-            ("temp_section", "Temp"),
-            ("constant_section", "Constant")
-        ]
-    elif block_type in ["GlobalDB", "InstanceDB"]:
-        section_order = [
-            ("static_section", "Static")  # DB uses Static for data members
-        ]
-    else:  # FB
-        section_order = [
-            ("input_section", "Input"),
-            ("output_section", "Output"),
-            ("in_out_section", "InOut"),
-            ("static_section", "Static"),
-            ("temp_section", "Temp"),
-            ("constant_section", "Constant")
-        ]
+    escape = xml_gen.escape_xml
 
-    for json_section_name, xml_section_name in section_order:
+    parts = ['<Sections xmlns="%s">\n' % interface_ns]
+    append = parts.append
+
+    for json_section_name, xml_section_name in _SECTION_ORDER.get(block_type, _SECTION_ORDER["FB"]):
         # Special handling for FC Return section
-        if json_section_name == "return_section" and block_type == "FC":
-            if return_type and return_type != "Void":
-                sections_xml += f'  <Section Name="Return">\n'
-                sections_xml += f'    <Member Name="Ret_Val" Datatype="{xml_gen.escape_xml(return_type)}" />\n'
-                sections_xml += '  </Section>\n'
-            else:
-                sections_xml += '  <Section Name="Return" />\n'
+        if json_section_name == "return_section":
+            append(_return_section_xml(metadata.get("returnType"), escape))
             continue
 
         variables = sections.get(json_section_name, [])
 
         if variables:
-            sections_xml += f'  <Section Name="{xml_section_name}">\n'
+            append('  <Section Name="%s">\n' % xml_section_name)
             for variable in variables:
-                var_name = variable.get("name", "")
-                var_datatype = variable.get("datatype", "")
-                var_start_value = variable.get("startValue")
                 # Escape XML characters in attributes
-                var_name = xml_gen.escape_xml(var_name)
-                var_datatype = xml_gen.escape_xml(var_datatype)
+                var_name = escape(variable.get("name", ""))
+                var_datatype = escape(variable.get("datatype", ""))
+                var_start_value = variable.get("startValue")
 
                 # Build Member element with optional StartValue
                 if var_start_value is not None:
-                    var_start_value = xml_gen.escape_xml(var_start_value)
-                    sections_xml += f'    <Member Name="{var_name}" Datatype="{var_datatype}">\n'
-                    sections_xml += f'      <StartValue>{var_start_value}</StartValue>\n'
-                    sections_xml += f'    </Member>\n'
+                    append('    <Member Name="%s" Datatype="%s">\n      <StartValue>%s</StartValue>\n    </Member>\n'
+                           % (var_name, var_datatype, escape(var_start_value)))
                 else:
-                    sections_xml += f'    <Member Name="{var_name}" Datatype="{var_datatype}" />\n'
-            sections_xml += '  </Section>\n'
+                    append('    <Member Name="%s" Datatype="%s" />\n' % (var_name, var_datatype))
+            append('  </Section>\n')
         else:
             # Empty sections still need to be present
-            sections_xml += f'  <Section Name="{xml_section_name}" />\n'
+            append('  <Section Name="%s" />\n' % xml_section_name)
 
-    sections_xml += '</Sections>'
-    return sections_xml
+    append('</Sections>')
+    return ''.join(parts)
+
+
+def _return_section_xml(return_type, escape) -> str:
+    """Return section of an FC: Ret_Val member unless the function returns Void"""
+    if return_type and return_type != "Void":
+        return '  <Section Name="Return">\n    <Member Name="Ret_Val" Datatype="%s" />\n  </Section>\n' % escape(return_type)
+    return '  <Section Name="Return" />\n'
 
 
 def json_to_xml(json_file: str, output_xml_file: str = None) -> str:
@@ -933,8 +1114,8 @@ def json_to_xml(json_file: str, output_xml_file: str = None) -> str:
     """
     try:
         # Read JSON file
-        with open(json_file, 'r', encoding='utf-8') as f:
-            json_data = json.load(f)
+        with open(json_file, 'rb') as f:
+            json_data = _loads(f.read())
 
         logger.info(f"Processing JSON file: {json_file}")
 
@@ -942,13 +1123,13 @@ def json_to_xml(json_file: str, output_xml_file: str = None) -> str:
         logger.error(f"Error reading JSON file: {e}")
         return None
 
-    # Extract data from JSON
-    metadata = json_data.get("metadata", {})
+    # Extract data from JSON; metadata gets the defaults merged in once
+    metadata = {**_METADATA_DEFAULTS, **json_data.get("metadata", {})}
     sections = json_data.get("sections", {})
     code_lines = json_data.get("code", [])
 
     # Determine block type
-    block_type = metadata.get("blockType", "FB")
+    block_type = metadata["blockType"]
 
     logger.info(f"Block name: {metadata.get('blockName', 'N/A')}, Block type: {block_type}")
     logger.debug(f"Sections: {[k for k, v in sections.items() if v]}")
@@ -957,19 +1138,12 @@ def json_to_xml(json_file: str, output_xml_file: str = None) -> str:
     # Create XML generator
     xml_gen = TIAXMLGenerator()
 
-    # Get the appropriate XML template for this block type
-    xml_template = get_xml_template(block_type)
+    # Get the appropriate XML template for this block type, split around the StructuredText
+    head, tail = get_split_xml_template(block_type)
 
     # Generate Sections XML based on block type
     sections_xml = generate_sections_xml(sections, metadata, xml_gen)
 
-    # Generate StructuredText XML (only for blocks with code)
-    if block_type in ["FB", "FC", "OB"]:
-        xml_gen.reset_uid_counter(21)  # Start from 21 following TIA Portal convention
-        structured_text = xml_gen.create_structured_text_xml(code_lines)
-    else:
-        structured_text = ""  # DB blocks don't have structured text
-
     # Ensure required attributes are not empty
     block_number = metadata.get("blockNumber", "") or metadata.get("number", "") or "1"
     block_name = metadata.get("blockName", "") or metadata.get("name", "")
@@ -977,26 +1151,41 @@ def json_to_xml(json_file: str, output_xml_file: str = None) -> str:
         # Use filename as fallback
         block_name = os.path.splitext(os.path.basename(json_file))[0]
 
-    # Fill template with data
-    xml_content = xml_template.format(
-        engineering_version=metadata.get("engineeringVersion", "V20"),
+    # Fill template with data. The StructuredText is the bulk of the document,
+    # so it is streamed between the formatted head and tail instead of being
+    # built as one big string first.
+    fields = dict(
+        engineering_version=metadata["engineeringVersion"],
         sections_xml=sections_xml,
-        memory_layout=metadata.get("memoryLayout", "Optimized"),
-        memory_reserve=metadata.get("memoryReserve", "100"),
+        memory_layout=metadata["memoryLayout"],
+        memory_reserve=metadata["memoryReserve"],
         block_name=xml_gen.escape_xml(block_name),
         block_number=xml_gen.escape_xml(block_number),
-        programming_language=metadata.get("programmingLanguage", "SCL"),
-        eno_setting=metadata.get("enoSetting", "false"),
-        structured_text=structured_text
+        programming_language=metadata["programmingLanguage"],
+        eno_setting=metadata["enoSetting"],
     )
+    head = head % fields
+    tail = tail % fields
 
     # Write output file
     if output_xml_file is None:
         output_xml_file = os.path.splitext(json_file)[0] + "_generated.xml"
 
+    # Streamed into a temp file next to the output, which only replaces the output once the
+    # document is complete; a failure halfway leaves any previous output untouched
+    partial_file = output_xml_file + ".tmp"
     try:
-        with open(output_xml_file, 'w', encoding='utf-8') as f:
-            f.write(xml_content)
+        # Large buffer so the streamed chunks reach the disk in a few writes; the default
+        # newline handling stays, Windows output keeps its CRLF line endings
+        with open(partial_file, 'w', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as f:
+            f.write(head)
+            # Generate StructuredText XML (only for blocks with code)
+            if block_type in ["FB", "FC", "OB"]:
+                xml_gen.reset_uid_counter(21)  # Start from 21 following TIA Portal convention
+                xml_gen.write_structured_text(code_lines, f)
+            # DB blocks don't have structured text
+            f.write(tail)
+        os.replace(partial_file, output_xml_file)
 
         logger.info(f"Successfully generated TIA Portal XML: {output_xml_file}")
         logger.info(f"Block type: {block_type}, Total UIds generated: {xml_gen.uid_counter - 1}")
@@ -1004,23 +1193,49 @@ def json_to_xml(json_file: str, output_xml_file: str = None) -> str:
 
     except Exception as e:
         logger.error(f"Error writing XML file: {e}")
+        try:
+            os.remove(partial_file)
+        except OSError:
+            pass
         return None
 
 
+def json_to_xml_batch(json_files: List[str], output_dir: Optional[str] = None,
+                      max_workers: Optional[int] = None) -> List[Optional[str]]:
+    """
+    Convert several JSON files to TIA Portal XML in parallel worker processes
+
+    Args:
+        json_files: Paths to input JSON files
+        output_dir: Directory for the XML files (optional, next to each input by default)
+        max_workers: Number of worker processes (optional, one per CPU by default)
+
+    Returns:
+        List of generated XML file paths, None for failed files, in input order
+    """
+    return run_batch(json_to_xml, json_files, output_dir, "_generated.xml", max_workers)
+
+
 def main():
     """Main function for command line usage"""
     import sys
 
     if len(sys.argv) < 2:
         print("Usage: python json_to_xml.py <json_file> [output_xml_file]")
+        print("       python json_to_xml.py <json_dir or glob> [output_dir]")
         print("\nExample:")
         print("  python json_to_xml.py FB_Example.json FB_Example_generated.xml")
         print("  python json_to_xml.py FC_Example.json FC_Example_generated.xml")
+        print("  python json_to_xml.py \"exports/*.json\" xml_out")
         print("\nSupported block types: FB, FC, OB, GlobalDB")
         print("\nThis script converts JSON files (created by xml_to_json.py or scl_to_json.py)")
         print("back to TIA Portal XML format.")
         return
 
+    # Batch mode: a directory or a glob pattern
+    if run_batch_cli(sys.argv[1:], json_to_xml_batch, ".json", "JSON"):
+        return
+
     json_file = sys.argv[1]
     output_xml_file = sys.argv[2] if len(sys.argv) > 2 else None
 
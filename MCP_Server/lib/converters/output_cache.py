@@ -0,0 +1,66 @@
+"""
+Conversion result cache shared by the file converters
+Keeps converted output per source file state and remembers which outputs were written from which source
+"""
+import os
+from typing import Any, Dict, Optional, Tuple
+
+# Entries kept per cache; the oldest one is dropped first (temp files never come back)
+_CACHE_SIZE = 64
+
+
+def source_key(path: str) -> Tuple[str, int, int]:
+    """Cache key of a source file: (abspath, mtime_ns, size)"""
+    st = os.stat(path)
+    return (os.path.abspath(path), st.st_mtime_ns, st.st_size)
+
+
+def _remember(cache: Dict, key, value):
+    """Store a cache entry, dropping the oldest one once the cache is full"""
+    if key not in cache and len(cache) >= _CACHE_SIZE:
+        del cache[next(iter(cache))]
+    cache[key] = value
+
+
+class OutputCache:
+    """
+    Converted output bytes per source key, plus the output files written from them
+
+    An output file counts as up to date only if it was written from the very
+    same source key and has not been modified since.
+    """
+
+    def __init__(self):
+        # Encoded output keyed by the source key
+        self._converted = {}
+        # Output files written: abspath -> (source key, mtime_ns, size) of the output
+        self._written = {}
+
+    def get(self, key) -> Optional[Any]:
+        """Cached output for a source key, None if not converted yet"""
+        return self._converted.get(key)
+
+    def put(self, key, output: Any):
+        """Store the output converted from a source key"""
+        _remember(self._converted, key, output)
+
+    def is_up_to_date(self, key, output_file: str) -> bool:
+        """Whether output_file was written from this source key and is untouched since"""
+        written = self._written.get(os.path.abspath(output_file))
+        if written is None or written[0] != key:
+            return False
+        try:
+            out_st = os.stat(output_file)
+        except OSError:
+            return False
+        return (out_st.st_mtime_ns, out_st.st_size) == written[1:]
+
+    def record_output(self, key, output_file: str):
+        """Remember that output_file has just been written from a source key"""
+        out_st = os.stat(output_file)
+        _remember(self._written, os.path.abspath(output_file), (key, out_st.st_mtime_ns, out_st.st_size))
+
+    def clear(self):
+        """Drop all cached outputs and written output records"""
+        self._converted.clear()
+        self._written.clear()
@@ -2,15 +2,24 @@
 PLC Tag Table XML to Excel converter and vice versa
 Handles conversion between TIA Portal PLC tag XML format and Excel format
 """
-import xml.etree.ElementTree as ET
 import os
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Optional, Tuple
 import logging
 
+# lxml parses with libxml2 and is used when installed; its etree API covers everything
+# used here, so the stdlib ElementTree is a drop-in fallback
+try:
+    from lxml import etree as ET
+    _HAVE_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    _HAVE_LXML = False
+
 try:
     import openpyxl
     from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
     from openpyxl.styles import Font, PatternFill, Alignment
     from openpyxl.utils import get_column_letter
 except ImportError:
@@ -20,19 +29,104 @@ except ImportError:
     subprocess.check_call([sys.executable, "-m", "pip", "install", "openpyxl"])
     import openpyxl
     from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
     from openpyxl.styles import Font, PatternFill, Alignment
     from openpyxl.utils import get_column_letter
 
+# PyExcelerate writes large row-oriented sheets several times faster than openpyxl;
+# it is only used for writing, openpyxl stays the fallback and the reader
+try:
+    import pyexcelerate
+    _HAVE_PYEXCELERATE = True
+except ImportError:
+    _HAVE_PYEXCELERATE = False
+
 logger = logging.getLogger(__name__)
 
 
+def _escape_xml_data(text: str) -> str:
+    """Escape text and attribute values the way minidom writes them"""
+    if '&' in text:
+        text = text.replace('&', '&amp;')
+    if '<' in text:
+        text = text.replace('<', '&lt;')
+    if '"' in text:
+        text = text.replace('"', '&quot;')
+    if '>' in text:
+        text = text.replace('>', '&gt;')
+    return text
+
+
 class PLCTagConverter:
     """Converts PLC tag tables between XML and Excel formats"""
     
+    # Column headers of the Excel sheets
+    _VARIABLE_HEADERS = ['Name', 'DataType', 'LogicalAddress',
+                         'Comment_de-DE', 'Comment_en-US', 'Comment_zh-CN', 'Comment_hu-HU',
+                         'ExternalAccessible', 'ExternalVisible', 'ExternalWritable',
+                         'SetPoint', 'Retain']
+    _CONSTANT_HEADERS = ['Name', 'DataType', 'Value',
+                         'Comment_de-DE', 'Comment_en-US', 'Comment_zh-CN', 'Comment_hu-HU']
+    
+    # Sheet rows are built as value lists in header order, starting from these defaults
+    _VARIABLE_DEFAULTS = ('', '', '', '', '', '', '', 'false', 'false', 'false', 'false', 'false')
+    _CONSTANT_DEFAULTS = ('', '', '', '', '', '', '')
+    _VARIABLE_COLUMNS = dict(zip(_VARIABLE_HEADERS, range(len(_VARIABLE_HEADERS))))
+    _CONSTANT_COLUMNS = dict(zip(_CONSTANT_HEADERS, range(len(_CONSTANT_HEADERS))))
+    
+    # AttributeList child -> (column, value used when the element is empty)
+    _TAG_ATTR_MAP = {
+        'Name': (_VARIABLE_COLUMNS['Name'], ''),
+        'DataTypeName': (_VARIABLE_COLUMNS['DataType'], ''),
+        'LogicalAddress': (_VARIABLE_COLUMNS['LogicalAddress'], ''),
+        'ExternalAccessible': (_VARIABLE_COLUMNS['ExternalAccessible'], 'false'),
+        'ExternalVisible': (_VARIABLE_COLUMNS['ExternalVisible'], 'false'),
+        'ExternalWritable': (_VARIABLE_COLUMNS['ExternalWritable'], 'false'),
+        'SetPoint': (_VARIABLE_COLUMNS['SetPoint'], 'false'),
+        'Retain': (_VARIABLE_COLUMNS['Retain'], 'false'),
+    }
+    _CONST_ATTR_MAP = {
+        'Name': (_CONSTANT_COLUMNS['Name'], ''),
+        'DataTypeName': (_CONSTANT_COLUMNS['DataType'], ''),
+        'Value': (_CONSTANT_COLUMNS['Value'], ''),
+    }
+    
+    # Record key -> XML element of the AttributeList, in export order; the flag
+    # marks attributes that are left out while they have their default 'false'
+    _TAG_XML_FIELDS = (
+        ('DataType', 'DataTypeName', False),
+        ('ExternalAccessible', 'ExternalAccessible', False),
+        ('LogicalAddress', 'LogicalAddress', False),
+        ('Name', 'Name', False),
+        ('ExternalVisible', 'ExternalVisible', True),
+        ('ExternalWritable', 'ExternalWritable', True),
+        ('SetPoint', 'SetPoint', True),
+        ('Retain', 'Retain', True),
+    )
+    _CONST_XML_FIELDS = (
+        ('DataType', 'DataTypeName', False),
+        ('Name', 'Name', False),
+        ('Value', 'Value', False),
+    )
+    
+    # openpyxl styles are immutable, so one set is shared by all sheets and cells
+    _TITLE_FONT = Font(bold=True, size=14)
+    _SUBTITLE_FONT = Font(bold=True, size=12)
+    _HEADER_FONT = Font(bold=True, color="FFFFFF")
+    _HEADER_FILL = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+    _HEADER_ALIGN = Alignment(horizontal="center", vertical="center")
+    
     def __init__(self):
         self.namespaces = {
             'ns': 'http://www.siemens.com/automation/Openness/SW/Tags/v5'
         }
+        # lxml parser settings for every read: huge_tree for very large tag tables, no
+        # xml:id hash table (nothing looks elements up by ID) and no entity expansion
+        self._lxml_parse_options = {
+            'huge_tree': True,
+            'collect_ids': False,
+            'resolve_entities': False,
+        }
         
     def xml_to_excel(self, xml_file_path: str, output_path: str = None) -> str:
         """
@@ -46,17 +140,8 @@ class PLCTagConverter:
             Path to generated Excel file
         """
         try:
-            # Parse XML
-            tree = ET.parse(xml_file_path)
-            root = tree.getroot()
-            
-            # Get table name
-            tag_table = root.find('.//SW.Tags.PlcTagTable')
-            if tag_table is None:
-                raise ValueError("No PlcTagTable found in XML")
-                
-            table_name = tag_table.find('.//Name')
-            table_name_str = table_name.text if table_name is not None else "UnknownTable"
+            # Parse XML and extract the different tag types in one pass
+            table_name_str, variables, user_constants, system_constants = self._read_tag_table(xml_file_path)
             
             # Determine output path
             if output_path is None:
@@ -64,44 +149,22 @@ class PLCTagConverter:
                 output_dir = os.path.dirname(xml_file_path)
                 output_path = os.path.join(output_dir, f"{base_name}.xlsx")
             
-            # Extract different tag types
-            variables = []
-            user_constants = []
-            system_constants = []
-            
-            # Process tags
-            for tag in tag_table.findall('.//SW.Tags.PlcTag'):
-                tag_data = self._extract_tag_data(tag)
-                variables.append(tag_data)
-            
-            # Process user constants
-            for const in tag_table.findall('.//SW.Tags.PlcUserConstant'):
-                const_data = self._extract_constant_data(const)
-                user_constants.append(const_data)
-            
-            # Process system constants (if any)
-            for sys_const in tag_table.findall('.//SW.Tags.PlcSystemConstant'):
-                sys_const_data = self._extract_constant_data(sys_const)
-                system_constants.append(sys_const_data)
-            
-            # Create Excel workbook
-            wb = Workbook()
-            
-            # Remove default sheet
-            wb.remove(wb.active)
-            
-            # Add sheets for each table type
+            # Collect a sheet for each table type
+            sheets = {}
             if variables:
-                self._create_variables_sheet(wb, variables, table_name_str)
+                sheets["Variables"] = (self._VARIABLE_HEADERS, variables)
             
             if user_constants:
-                self._create_constants_sheet(wb, user_constants, table_name_str, "User Constants")
+                sheets["User Constants"] = (self._CONSTANT_HEADERS, user_constants)
             
             if system_constants:
-                self._create_constants_sheet(wb, system_constants, table_name_str, "System Constants")
+                sheets["System Constants"] = (self._CONSTANT_HEADERS, system_constants)
+            
+            if not sheets:
+                raise ValueError("No tags or constants found in XML")
             
             # Save Excel file
-            wb.save(output_path)
+            self._write_xlsx(output_path, table_name_str, sheets)
             
             logger.info(f"Successfully converted {xml_file_path} to {output_path}")
             return output_path
@@ -110,196 +173,263 @@ class PLCTagConverter:
             logger.error(f"Error converting XML to Excel: {e}")
             raise
     
-    def _extract_tag_data(self, tag_element) -> Dict[str, Any]:
-        """Extract data from a PLC tag element"""
-        tag_data = {
-            'Name': '',
-            'DataType': '',
-            'LogicalAddress': '',
-            'Comment_de-DE': '',
-            'Comment_en-US': '',
-            'Comment_zh-CN': '',
-            'Comment_hu-HU': '',
-            'ExternalAccessible': 'false',
-            'ExternalVisible': 'false',
-            'ExternalWritable': 'false',
-            'SetPoint': 'false',
-            'Retain': 'false'
+    def _read_tag_table(self, xml_file_path: str):
+        """
+        Read the first PlcTagTable of an XML export in a single iterparse pass
+
+        Tags and constants are extracted as soon as their element is complete
+        and then cleared, instead of searching the finished tree once per type.
+
+        Returns:
+            tuple: (table name, variables, user constants, system constants),
+                   each record as its sheet row in header order
+        """
+        variables = []
+        user_constants = []
+        system_constants = []
+        extractors = {
+            'SW.Tags.PlcTag': (self._extract_tag_data, variables),
+            'SW.Tags.PlcUserConstant': (self._extract_constant_data, user_constants),
+            'SW.Tags.PlcSystemConstant': (self._extract_constant_data, system_constants),
         }
+
+        if _HAVE_LXML:
+            # lxml only reports the elements of interest
+            context = ET.iterparse(xml_file_path, events=('start', 'end'),
+                                   tag=('SW.Tags.PlcTagTable', 'Name', *extractors),
+                                   **self._lxml_parse_options)
+        else:
+            context = ET.iterparse(xml_file_path, events=('start', 'end'))
+
+        tag_table = None
+        table_done = False
+        # Table name is the first Name inside the table, as with find('.//Name')
+        name_found = False
+        table_name = "UnknownTable"
+        # Open elements, so that the stdlib parser can detach processed records from their parent
+        open_elements = []
+        for event, elem in context:
+            if event == 'start':
+                if not _HAVE_LXML:
+                    open_elements.append(elem)
+                if tag_table is None and elem.tag == 'SW.Tags.PlcTagTable':
+                    tag_table = elem
+                continue
+            if not _HAVE_LXML:
+                open_elements.pop()
+            if tag_table is None or table_done:
+                continue
+            if elem is tag_table:
+                table_done = True
+            elif elem.tag == 'Name':
+                if not name_found:
+                    name_found = True
+                    table_name = elem.text
+            else:
+                extractor = extractors.get(elem.tag)
+                if extractor is not None:
+                    extract, records = extractor
+                    records.append(extract(elem))
+                    elem.clear()
+                    if _HAVE_LXML:
+                        # Drop the already processed siblings as well
+                        while elem.getprevious() is not None:
+                            del elem.getparent()[0]
+                    elif open_elements:
+                        # Detach the cleared element and its processed siblings, so that no
+                        # empty shells pile up. The parser works ahead of the events and may
+                        # have added later siblings already, so they are removed from the front.
+                        parent = open_elements[-1]
+                        while len(parent):
+                            first = parent[0]
+                            del parent[0]
+                            if first is elem:
+                                break
+
+        if tag_table is None:
+            raise ValueError("No PlcTagTable found in XML")
+        return table_name, variables, user_constants, system_constants
+
+    def _extract_tag_data(self, tag_element) -> List[str]:
+        """Extract the sheet row of a PLC tag element"""
+        tag_data = list(self._VARIABLE_DEFAULTS)
         
         # Extract attributes
         attrs = tag_element.find('AttributeList')
         if attrs is not None:
+            attr_map = self._TAG_ATTR_MAP
             for attr in attrs:
-                if attr.tag == 'Name':
-                    tag_data['Name'] = attr.text or ''
-                elif attr.tag == 'DataTypeName':
-                    tag_data['DataType'] = attr.text or ''
-                elif attr.tag == 'LogicalAddress':
-                    tag_data['LogicalAddress'] = attr.text or ''
-                elif attr.tag == 'ExternalAccessible':
-                    tag_data['ExternalAccessible'] = attr.text or 'false'
-                elif attr.tag == 'ExternalVisible':
-                    tag_data['ExternalVisible'] = attr.text or 'false'
-                elif attr.tag == 'ExternalWritable':
-                    tag_data['ExternalWritable'] = attr.text or 'false'
-                elif attr.tag == 'SetPoint':
-                    tag_data['SetPoint'] = attr.text or 'false'
-                elif attr.tag == 'Retain':
-                    tag_data['Retain'] = attr.text or 'false'
+                entry = attr_map.get(attr.tag)
+                if entry is not None:
+                    column, empty = entry
+                    tag_data[column] = attr.text or empty
         
         # Extract multilingual comments
-        comment = tag_element.find('.//MultilingualText[@CompositionName="Comment"]')
-        if comment is not None:
-            for item in comment.findall('.//MultilingualTextItem'):
-                culture = item.find('AttributeList/Culture')
-                text = item.find('AttributeList/Text')
-                if culture is not None and text is not None:
-                    culture_str = culture.text
-                    comment_text = text.text or ''
-                    tag_data[f'Comment_{culture_str}'] = comment_text
+        self._extract_comments(tag_element, tag_data, self._VARIABLE_COLUMNS)
         
         return tag_data
     
-    def _extract_constant_data(self, const_element) -> Dict[str, Any]:
-        """Extract data from a constant element"""
-        const_data = {
-            'Name': '',
-            'DataType': '',
-            'Value': '',
-            'Comment_de-DE': '',
-            'Comment_en-US': '',
-            'Comment_zh-CN': '',
-            'Comment_hu-HU': ''
-        }
+    def _extract_constant_data(self, const_element) -> List[str]:
+        """Extract the sheet row of a constant element"""
+        const_data = list(self._CONSTANT_DEFAULTS)
         
         # Extract attributes
         attrs = const_element.find('AttributeList')
         if attrs is not None:
+            attr_map = self._CONST_ATTR_MAP
             for attr in attrs:
-                if attr.tag == 'Name':
-                    const_data['Name'] = attr.text or ''
-                elif attr.tag == 'DataTypeName':
-                    const_data['DataType'] = attr.text or ''
-                elif attr.tag == 'Value':
-                    const_data['Value'] = attr.text or ''
+                entry = attr_map.get(attr.tag)
+                if entry is not None:
+                    column, empty = entry
+                    const_data[column] = attr.text or empty
         
         # Extract multilingual comments
-        comment = const_element.find('.//MultilingualText[@CompositionName="Comment"]')
-        if comment is not None:
-            for item in comment.findall('.//MultilingualTextItem'):
-                culture = item.find('AttributeList/Culture')
-                text = item.find('AttributeList/Text')
-                if culture is not None and text is not None:
-                    culture_str = culture.text
-                    comment_text = text.text or ''
-                    const_data[f'Comment_{culture_str}'] = comment_text
+        self._extract_comments(const_element, const_data, self._CONSTANT_COLUMNS)
         
         return const_data
     
-    def _create_variables_sheet(self, wb: Workbook, variables: List[Dict], table_name: str):
-        """Create Excel sheet for variables"""
-        if not variables:
-            return
-            
-        # Create sheet
-        ws = wb.create_sheet(title="Variables")
-        
-        # Define column headers
-        headers = ['Name', 'DataType', 'LogicalAddress', 
-                  'Comment_de-DE', 'Comment_en-US', 'Comment_zh-CN', 'Comment_hu-HU',
-                  'ExternalAccessible', 'ExternalVisible', 'ExternalWritable', 
-                  'SetPoint', 'Retain']
+    def _extract_comments(self, element, data: List[str], columns: Dict[str, int]):
+        """
+        Put the multilingual comment of a tag or constant into its Comment_<culture> columns
         
-        # Style for headers
-        header_font = Font(bold=True, color="FFFFFF")
-        header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-        header_alignment = Alignment(horizontal="center", vertical="center")
+        Cultures without a column in the sheet are skipped.
         
-        # Add table info
-        ws['A1'] = f"PLC Tag Table: {table_name}"
-        ws['A2'] = "Type: Variables"
-        ws.merge_cells('A1:L1')
-        ws.merge_cells('A2:L2')
-        ws['A1'].font = Font(bold=True, size=14)
-        ws['A2'].font = Font(bold=True, size=12)
+        The comment sits in the element's own ObjectList, so only the child
+        levels are walked; a predicate search over the whole subtree was the
+        bulk of the extraction time.
+        """
+        for object_list in element:
+            if object_list.tag != 'ObjectList':
+                continue
+            for comment in object_list:
+                if comment.tag != 'MultilingualText' or comment.get('CompositionName') != 'Comment':
+                    continue
+                for item_list in comment:
+                    if item_list.tag != 'ObjectList':
+                        continue
+                    for item in item_list:
+                        if item.tag != 'MultilingualTextItem':
+                            continue
+                        culture = item.find('AttributeList/Culture')
+                        text = item.find('AttributeList/Text')
+                        if culture is not None and text is not None:
+                            column = columns.get(f'Comment_{culture.text}')
+                            if column is not None:
+                                data[column] = text.text or ''
+                # Only the first comment counts
+                return
+    
+    def _write_xlsx(self, output_path: str, table_name: str, sheets: Dict[str, tuple]):
+        """
+        Write the tag table sheets to an Excel file
         
-        # Add headers
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=4, column=col, value=header)
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = header_alignment
+        Each sheet gets the table info in rows 1-2 (merged across all
+        columns), the styled headers in row 4 and the data rows from row 5.
+        PyExcelerate is used when installed, otherwise a write-only openpyxl
+        workbook.
         
-        # Add data
-        for row_idx, tag_data in enumerate(variables, 5):
-            for col_idx, header in enumerate(headers, 1):
-                value = tag_data.get(header, '')
-                ws.cell(row=row_idx, column=col_idx, value=value)
+        Args:
+            output_path: Path of the Excel file
+            table_name: Tag table name shown in the sheet titles
+            sheets: Sheet title -> (column headers, data rows in header order)
+        """
+        if _HAVE_PYEXCELERATE:
+            wb = pyexcelerate.Workbook()
+            for sheet_title, (headers, data_rows) in sheets.items():
+                self._write_sheet_pyexcelerate(wb, sheet_title, headers, data_rows, table_name)
+        else:
+            wb = Workbook(write_only=True)
+            for sheet_title, (headers, data_rows) in sheets.items():
+                self._write_sheet(wb, sheet_title, headers, data_rows, table_name)
+        wb.save(output_path)
+    
+    def _column_widths(self, headers: List[str], rows: List[List[str]], title_text: str, type_text: str) -> List[int]:
+        """
+        Column widths fitted to the longest value, capped at 50
         
-        # Auto-adjust column widths
-        for column in ws.columns:
-            max_length = 0
-            column_letter = get_column_letter(column[0].column)
-            for cell in column:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except:
-                    pass
-            adjusted_width = min(max_length + 2, 50)
-            ws.column_dimensions[column_letter].width = adjusted_width
+        The rows are transposed into columns, so the longest value of each
+        column is found by max(map(len, column)) in C. Empty cells count as
+        4 characters, like str(None) did when the widths were measured from
+        the finished cells.
+        """
+        max_lengths = [max(4, len(header)) for header in headers]
+        max_lengths[0] = max(max_lengths[0], len(title_text), len(type_text))
+        if rows:
+            for col_idx, column in enumerate(zip(*rows)):
+                longest = max(map(len, column))
+                if longest > max_lengths[col_idx]:
+                    max_lengths[col_idx] = longest
+        return [min(max_length + 2, 50) for max_length in max_lengths]
     
-    def _create_constants_sheet(self, wb: Workbook, constants: List[Dict], table_name: str, sheet_title: str):
-        """Create Excel sheet for constants"""
-        if not constants:
-            return
-            
+    def _write_sheet(self, wb: Workbook, sheet_title: str, headers: List[str], rows: List[List[str]], table_name: str):
+        """Stream a tag table sheet into a write-only openpyxl workbook"""
         # Create sheet
         ws = wb.create_sheet(title=sheet_title)
+        title_text = f"PLC Tag Table: {table_name}"
+        type_text = f"Type: {sheet_title}"
         
-        # Define column headers
-        headers = ['Name', 'DataType', 'Value',
-                  'Comment_de-DE', 'Comment_en-US', 'Comment_zh-CN', 'Comment_hu-HU']
-        
-        # Style for headers
-        header_font = Font(bold=True, color="FFFFFF")
-        header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-        header_alignment = Alignment(horizontal="center", vertical="center")
+        # Auto-adjust column widths; a write-only sheet needs them before the first row
+        widths = self._column_widths(headers, rows, title_text, type_text)
+        for col_idx, width in enumerate(widths, 1):
+            ws.column_dimensions[get_column_letter(col_idx)].width = width
         
         # Add table info
-        ws['A1'] = f"PLC Tag Table: {table_name}"
-        ws['A2'] = f"Type: {sheet_title}"
-        ws.merge_cells('A1:G1')
-        ws.merge_cells('A2:G2')
-        ws['A1'].font = Font(bold=True, size=14)
-        ws['A2'].font = Font(bold=True, size=12)
+        title_cell = WriteOnlyCell(ws, value=title_text)
+        title_cell.font = self._TITLE_FONT
+        type_cell = WriteOnlyCell(ws, value=type_text)
+        type_cell.font = self._SUBTITLE_FONT
+        ws.append([title_cell])
+        ws.append([type_cell])
+        ws.append([])
+        last_column = get_column_letter(len(headers))
+        ws.merged_cells.add(f"A1:{last_column}1")
+        ws.merged_cells.add(f"A2:{last_column}2")
         
         # Add headers
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=4, column=col, value=header)
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = header_alignment
+        header_row = []
+        for header in headers:
+            cell = WriteOnlyCell(ws, value=header)
+            cell.font = self._HEADER_FONT
+            cell.fill = self._HEADER_FILL
+            cell.alignment = self._HEADER_ALIGN
+            header_row.append(cell)
+        ws.append(header_row)
         
         # Add data
-        for row_idx, const_data in enumerate(constants, 5):
-            for col_idx, header in enumerate(headers, 1):
-                value = const_data.get(header, '')
-                ws.cell(row=row_idx, column=col_idx, value=value)
+        for row in rows:
+            ws.append(row)
+    
+    def _write_sheet_pyexcelerate(self, wb, sheet_title: str, headers: List[str], rows: List[List[str]], table_name: str):
+        """Add a tag table sheet to a PyExcelerate workbook in one bulk write"""
+        title_text = f"PLC Tag Table: {table_name}"
+        type_text = f"Type: {sheet_title}"
+        
+        widths = self._column_widths(headers, rows, title_text, type_text)
+        data = [[title_text], [type_text], [], list(headers)]
+        # Empty values stay blank cells, as openpyxl does not store empty strings
+        data.extend([value or None for value in row] for row in rows)
+        ws = wb.new_sheet(sheet_title, data=data)
         
         # Auto-adjust column widths
-        for column in ws.columns:
-            max_length = 0
-            column_letter = get_column_letter(column[0].column)
-            for cell in column:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except:
-                    pass
-            adjusted_width = min(max_length + 2, 50)
-            ws.column_dimensions[column_letter].width = adjusted_width
+        for col_idx, width in enumerate(widths, 1):
+            ws.set_col_style(col_idx, pyexcelerate.Style(size=width))
+        
+        # Table info
+        ws.set_cell_style(1, 1, pyexcelerate.Style(font=pyexcelerate.Font(bold=True, size=14)))
+        ws.set_cell_style(2, 1, pyexcelerate.Style(font=pyexcelerate.Font(bold=True, size=12)))
+        last_column = get_column_letter(len(headers))
+        ws.range("A1", f"{last_column}1").merge()
+        ws.range("A2", f"{last_column}2").merge()
+        
+        # Style for headers, one Style object shared by all header cells. PyExcelerate
+        # numbers its styles per workbook while saving, so they are not shared like
+        # the openpyxl ones.
+        header_style = pyexcelerate.Style(
+            font=pyexcelerate.Font(bold=True, color=pyexcelerate.Color(0xFF, 0xFF, 0xFF)),
+            fill=pyexcelerate.Fill(background=pyexcelerate.Color(0x36, 0x60, 0x92)),
+            alignment=pyexcelerate.Alignment(horizontal="center", vertical="center"))
+        for col_idx in range(1, len(headers) + 1):
+            ws.set_cell_style(4, col_idx, header_style)
     
     def excel_to_xml(self, excel_file_path: str, output_path: str = None,
                      table_name: str = None, engineering_version: str = "V20") -> str:
@@ -316,52 +446,38 @@ class PLCTagConverter:
             Path to generated XML file
         """
         try:
-            # Load Excel workbook
-            wb = openpyxl.load_workbook(excel_file_path, data_only=True)
-            
-            # Determine table name
-            if table_name is None:
-                # Try to extract from first sheet's info or use file name
-                base_name = Path(excel_file_path).stem
-                table_name = base_name
-            
-            # Create XML structure
-            root = ET.Element("Document")
-            
-            # Add engineering version
-            eng = ET.SubElement(root, "Engineering")
-            eng.set("version", engineering_version)
-            
-            # Add DocumentInfo
-            doc_info = ET.SubElement(root, "DocumentInfo")
-            created = ET.SubElement(doc_info, "Created")
-            from datetime import datetime
-            created.text = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%S.%fZ")
-            export_setting = ET.SubElement(doc_info, "ExportSetting")
-            export_setting.text = "None"
-            
-            # Add SW.Tags.PlcTagTable
-            tag_table = ET.SubElement(root, "SW.Tags.PlcTagTable")
-            tag_table.set("ID", "0")
-            
-            attr_list = ET.SubElement(tag_table, "AttributeList")
-            name_elem = ET.SubElement(attr_list, "Name")
-            name_elem.text = table_name
-            
-            object_list = ET.SubElement(tag_table, "ObjectList")
-            
-            # Process each sheet in Excel file
-            element_id = 1
-            for sheet_name in wb.sheetnames:
-                element_id = self._process_excel_sheet(wb[sheet_name], object_list, element_id)
-            
-            # Generate output path if not provided
-            if output_path is None:
-                output_dir = os.path.dirname(excel_file_path)
-                output_path = os.path.join(output_dir, f"{table_name}.xml")
-            
-            # Write XML with proper formatting
-            self._write_formatted_xml(root, output_path)
+            # Load Excel workbook; read-only mode streams the rows from the file
+            wb = openpyxl.load_workbook(excel_file_path, data_only=True, read_only=True)
+            
+            try:
+                # Determine table name
+                if table_name is None:
+                    # Try to extract from first sheet's info or use file name
+                    base_name = Path(excel_file_path).stem
+                    table_name = base_name
+                
+                # Generate output path if not provided
+                if output_path is None:
+                    output_dir = os.path.dirname(excel_file_path)
+                    output_path = os.path.join(output_dir, f"{table_name}.xml")
+                
+                # Stream the XML to a temporary file while the sheets are read and
+                # only replace the output once it is complete, so a failure keeps
+                # an existing XML intact
+                partial_file = output_path + ".tmp"
+                try:
+                    with open(partial_file, 'w', encoding='utf-8') as f:
+                        self._write_tag_table(f, wb, table_name, engineering_version)
+                    os.replace(partial_file, output_path)
+                except Exception:
+                    try:
+                        os.remove(partial_file)
+                    except OSError:
+                        pass
+                    raise
+            finally:
+                # Read-only workbooks keep the file open until closed
+                wb.close()
             
             logger.info(f"Successfully converted Excel file to {output_path}")
             return output_path
@@ -370,188 +486,212 @@ class PLCTagConverter:
             logger.error(f"Error converting Excel to XML: {e}")
             raise
     
-    def _process_excel_sheet(self, ws, object_list, element_id: int) -> int:
-        """Process a single Excel sheet and add elements to object list"""
-        # Skip if sheet is empty
-        if ws.max_row < 4:
-            return element_id
+    def _write_tag_table(self, f, wb, table_name: str, engineering_version: str):
+        """
+        Write the tag table document, one formatted element per Excel row
         
-        # Get headers from row 4
-        headers = []
-        for col in range(1, ws.max_column + 1):
-            header = ws.cell(row=4, column=col).value
-            if header:
-                headers.append(header)
+        Only the lines of the current row's element are held in memory; the
+        layout is the one of _format_element for the whole document.
+        """
+        # Engineering version and DocumentInfo
+        eng = ET.Element("Engineering")
+        eng.set("version", engineering_version)
+        
+        doc_info = ET.Element("DocumentInfo")
+        created = ET.SubElement(doc_info, "Created")
+        from datetime import datetime
+        created.text = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+        export_setting = ET.SubElement(doc_info, "ExportSetting")
+        export_setting.text = "None"
+        
+        # SW.Tags.PlcTagTable attributes
+        attr_list = ET.Element("AttributeList")
+        name_elem = ET.SubElement(attr_list, "Name")
+        name_elem.text = table_name
+        
+        lines = ['<?xml version="1.0" encoding="utf-8"?>', '<Document>']
+        self._format_element(eng, '  ', lines)
+        self._format_element(doc_info, '  ', lines)
+        lines.append('  <SW.Tags.PlcTagTable ID="0">')
+        self._format_element(attr_list, '    ', lines)
+        f.write('\n'.join(lines))
+        
+        written = 0
+        
+        def write_element(element_lines):
+            nonlocal written
+            # The ObjectList is opened with its first element
+            if not written:
+                f.write('\n    <ObjectList>')
+            f.write('\n' + '\n'.join(element_lines))
+            written += 1
+        
+        # Process each sheet in Excel file
+        element_id = 1
+        for sheet_name in wb.sheetnames:
+            element_id = self._process_excel_sheet(wb[sheet_name], write_element, element_id)
+        
+        f.write('\n    </ObjectList>' if written else '\n    <ObjectList/>')
+        f.write('\n  </SW.Tags.PlcTagTable>\n</Document>')
+    
+    def _process_excel_sheet(self, ws, write_element, element_id: int) -> int:
+        """Process a single Excel sheet and pass the element lines of each row to write_element"""
+        rows = ws.iter_rows(min_row=4, values_only=True)
+        
+        # Get headers from row 4; skip if sheet is empty
+        header_row = next(rows, None)
+        if header_row is None:
+            return element_id
+        headers = [header for header in header_row if header]
         
         if not headers:
             return element_id
         
+        # Comment columns and their cultures, resolved once per sheet
+        comment_keys = [(header, header[8:]) for header in headers
+                        if isinstance(header, str) and header.startswith('Comment_')]
+        
         # Process data rows starting from row 5
-        for row in range(5, ws.max_row + 1):
-            row_data = {}
-            for col, header in enumerate(headers, 1):
-                value = ws.cell(row=row, column=col).value
-                if value is not None:
-                    row_data[header] = str(value)
+        for row in rows:
+            # Skip blank rows before building row_data
+            if row.count(None) == len(row):
+                continue
+            
+            row_data = {header: str(value) for header, value in zip(headers, row) if value is not None}
             
-            # Skip empty rows
+            # Skip rows holding only empty strings
             if not any(row_data.values()):
                 continue
             
             # Check if it's variables or constants
             if 'LogicalAddress' in headers:
                 # Variables
-                element_id = self._add_tag_element(object_list, row_data, element_id)
+                element_lines, element_id = self._build_tag_element(row_data, element_id, comment_keys)
             elif 'Value' in headers:
                 # Constants
-                element_id = self._add_constant_element(object_list, row_data, element_id)
+                element_lines, element_id = self._build_constant_element(row_data, element_id, comment_keys)
+            else:
+                continue
+            write_element(element_lines)
         
         return element_id
     
-    def _add_tag_element(self, object_list, row: Dict, element_id: int) -> int:
-        """Add a PLC tag element to the object list"""
-        tag = ET.SubElement(object_list, "SW.Tags.PlcTag")
-        tag.set("ID", hex(element_id)[2:].upper())
-        tag.set("CompositionName", "Tags")
-        
-        attr_list = ET.SubElement(tag, "AttributeList")
-        
-        # Add attributes
-        if row.get('DataType'):
-            elem = ET.SubElement(attr_list, "DataTypeName")
-            elem.text = row['DataType']
-        
-        if row.get('ExternalAccessible'):
-            elem = ET.SubElement(attr_list, "ExternalAccessible")
-            elem.text = row['ExternalAccessible']
-        
-        if row.get('LogicalAddress'):
-            elem = ET.SubElement(attr_list, "LogicalAddress")
-            elem.text = row['LogicalAddress']
-        
-        if row.get('Name'):
-            elem = ET.SubElement(attr_list, "Name")
-            elem.text = row['Name']
-        
-        # Add optional attributes if present and not default
-        if row.get('ExternalVisible') and row['ExternalVisible'] != 'false':
-            elem = ET.SubElement(attr_list, "ExternalVisible")
-            elem.text = row['ExternalVisible']
-        
-        if row.get('ExternalWritable') and row['ExternalWritable'] != 'false':
-            elem = ET.SubElement(attr_list, "ExternalWritable")
-            elem.text = row['ExternalWritable']
-        
-        if row.get('SetPoint') and row['SetPoint'] != 'false':
-            elem = ET.SubElement(attr_list, "SetPoint")
-            elem.text = row['SetPoint']
-        
-        if row.get('Retain') and row['Retain'] != 'false':
-            elem = ET.SubElement(attr_list, "Retain")
-            elem.text = row['Retain']
+    def _build_tag_element(self, row: Dict, element_id: int,
+                            comment_keys: List[Tuple[str, str]]) -> Tuple[List[str], int]:
+        """
+        Build the lines of a PLC tag element, returns them with the next free ID
         
+        comment_keys lists the (Comment_<culture> key, culture) pairs of the sheet.
+        """
+        lines = [f'      <SW.Tags.PlcTag ID="{element_id:X}" CompositionName="Tags">']
+        self._emit_attributes(lines, row, self._TAG_XML_FIELDS)
         element_id += 1
         
-        # Add comments if present
-        comments = {}
-        for key in row:
-            if key.startswith('Comment_'):
-                culture = key.replace('Comment_', '')
-                if row[key]:  # Only add non-empty comments
-                    comments[culture] = row[key]
-        
-        if comments:
-            obj_list = ET.SubElement(tag, "ObjectList")
-            comment_elem = ET.SubElement(obj_list, "MultilingualText")
-            comment_elem.set("ID", hex(element_id)[2:].upper())
-            comment_elem.set("CompositionName", "Comment")
-            element_id += 1
-            
-            comment_obj_list = ET.SubElement(comment_elem, "ObjectList")
-            
-            for culture, text in comments.items():
-                item = ET.SubElement(comment_obj_list, "MultilingualTextItem")
-                item.set("ID", hex(element_id)[2:].upper())
-                item.set("CompositionName", "Items")
-                element_id += 1
-                
-                item_attr_list = ET.SubElement(item, "AttributeList")
-                culture_elem = ET.SubElement(item_attr_list, "Culture")
-                culture_elem.text = culture
-                text_elem = ET.SubElement(item_attr_list, "Text")
-                text_elem.text = text
+        # Add comments if present (only non-empty ones)
+        comments = {culture: row[key] for key, culture in comment_keys if row.get(key)}
+        element_id = self._emit_comments(lines, comments, element_id)
         
-        return element_id
+        lines.append('      </SW.Tags.PlcTag>')
+        return lines, element_id
     
-    def _add_constant_element(self, object_list, row: Dict, element_id: int) -> int:
-        """Add a constant element to the object list"""
-        const = ET.SubElement(object_list, "SW.Tags.PlcUserConstant")
-        const.set("ID", hex(element_id)[2:].upper())
-        const.set("CompositionName", "UserConstants")
+    def _build_constant_element(self, row: Dict, element_id: int,
+                                 comment_keys: List[Tuple[str, str]]) -> Tuple[List[str], int]:
+        """
+        Build the lines of a constant element, returns them with the next free ID
         
-        attr_list = ET.SubElement(const, "AttributeList")
+        comment_keys lists the (Comment_<culture> key, culture) pairs of the sheet.
+        """
+        lines = [f'      <SW.Tags.PlcUserConstant ID="{element_id:X}" CompositionName="UserConstants">']
+        self._emit_attributes(lines, row, self._CONST_XML_FIELDS)
+        element_id += 1
         
-        # Add attributes
-        if row.get('DataType'):
-            elem = ET.SubElement(attr_list, "DataTypeName")
-            elem.text = row['DataType']
+        # Add comments if present (only non-empty ones)
+        comments = {culture: row[key] for key, culture in comment_keys if row.get(key)}
+        element_id = self._emit_comments(lines, comments, element_id)
         
-        if row.get('Name'):
-            elem = ET.SubElement(attr_list, "Name")
-            elem.text = row['Name']
+        lines.append('      </SW.Tags.PlcUserConstant>')
+        return lines, element_id
+    
+    def _emit_attributes(self, lines: List[str], row: Dict, fields: tuple):
+        """Add the AttributeList of a tag or constant with the fields that have a value"""
+        attr_lines = []
+        for key, tag, skip_false in fields:
+            value = row.get(key)
+            if value and not (skip_false and value == 'false'):
+                self._format_text_element(tag, value, '          ', attr_lines)
+        
+        if attr_lines:
+            lines.append('        <AttributeList>')
+            lines.extend(attr_lines)
+            lines.append('        </AttributeList>')
+        else:
+            lines.append('        <AttributeList/>')
+    
+    def _emit_comments(self, lines: List[str], comments: Dict[str, str], element_id: int) -> int:
+        """
+        Add a MultilingualText comment with one item per culture to a tag or constant
         
-        if row.get('Value'):
-            elem = ET.SubElement(attr_list, "Value")
-            elem.text = row['Value']
+        Returns:
+            int: The next free ID
+        """
+        if not comments:
+            return element_id
         
+        lines.append('        <ObjectList>')
+        lines.append(f'          <MultilingualText ID="{element_id:X}" CompositionName="Comment">')
+        lines.append('            <ObjectList>')
         element_id += 1
         
-        # Add comments if present
-        comments = {}
-        for key in row:
-            if key.startswith('Comment_'):
-                culture = key.replace('Comment_', '')
-                if row[key]:  # Only add non-empty comments
-                    comments[culture] = row[key]
-        
-        if comments:
-            obj_list = ET.SubElement(const, "ObjectList")
-            comment_elem = ET.SubElement(obj_list, "MultilingualText")
-            comment_elem.set("ID", hex(element_id)[2:].upper())
-            comment_elem.set("CompositionName", "Comment")
+        for culture, text in comments.items():
+            lines.append(f'              <MultilingualTextItem ID="{element_id:X}" CompositionName="Items">')
+            lines.append('                <AttributeList>')
+            self._format_text_element('Culture', culture, '                  ', lines)
+            self._format_text_element('Text', text, '                  ', lines)
+            lines.append('                </AttributeList>')
+            lines.append('              </MultilingualTextItem>')
             element_id += 1
-            
-            comment_obj_list = ET.SubElement(comment_elem, "ObjectList")
-            
-            for culture, text in comments.items():
-                item = ET.SubElement(comment_obj_list, "MultilingualTextItem")
-                item.set("ID", hex(element_id)[2:].upper())
-                item.set("CompositionName", "Items")
-                element_id += 1
-                
-                item_attr_list = ET.SubElement(item, "AttributeList")
-                culture_elem = ET.SubElement(item_attr_list, "Culture")
-                culture_elem.text = culture
-                text_elem = ET.SubElement(item_attr_list, "Text")
-                text_elem.text = text
         
+        lines.append('            </ObjectList>')
+        lines.append('          </MultilingualText>')
+        lines.append('        </ObjectList>')
         return element_id
     
-    def _write_formatted_xml(self, root, output_path: str):
-        """Write XML with proper formatting"""
-        # Convert to string and format
-        from xml.dom import minidom
-        
-        rough_string = ET.tostring(root, encoding='unicode')
-        reparsed = minidom.parseString(rough_string)
-        
-        # Get pretty printed version
-        pretty_xml = reparsed.toprettyxml(indent="  ", encoding='utf-8')
-        
-        # Remove extra blank lines
-        lines = pretty_xml.decode('utf-8').split('\n')
-        non_empty_lines = [line for line in lines if line.strip()]
+    def _format_element(self, elem, indent: str, lines: List[str]):
+        """
+        Append the formatted lines of an element and its children
         
-        # Write to file
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(non_empty_lines))
\ No newline at end of file
+        The layout is the one of minidom's toprettyxml with the blank lines
+        removed: two-space indent, text-only elements on a single line.
+        """
+        start = indent + '<' + elem.tag + ''.join(
+            f' {name}="{_escape_xml_data(value)}"' for name, value in elem.attrib.items())
+        
+        if len(elem):
+            lines.append(start + '>')
+            child_indent = indent + '  '
+            for child in elem:
+                self._format_element(child, child_indent, lines)
+            lines.append(f"{indent}</{elem.tag}>")
+        elif elem.text:
+            self._append_text(start, elem.tag, elem.text, lines)
+        else:
+            lines.append(start + '/>')
+    
+    def _format_text_element(self, tag: str, text: str, indent: str, lines: List[str]):
+        """Append the lines of a text-only element without attributes, like _format_element"""
+        if text:
+            self._append_text(f"{indent}<{tag}", tag, text, lines)
+        else:
+            lines.append(f"{indent}<{tag}/>")
+    
+    def _append_text(self, start: str, tag: str, text: str, lines: List[str]):
+        """Append a text-only element after its opened start tag"""
+        if '\r' in text:
+            # Line ends as an XML parser normalizes them
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+        line = f"{start}>{_escape_xml_data(text)}</{tag}>"
+        if '\n' in line:
+            # Multi-line text keeps its lines, except the blank ones
+            lines.extend(part for part in line.split('\n') if part.strip())
+        else:
+            lines.append(line)
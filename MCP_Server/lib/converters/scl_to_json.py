@@ -8,6 +8,103 @@ import os
 import re
 from typing import Dict, List, Any, Optional, Tuple
 
+# orjson serializes several times faster than the stdlib; both give the same indented UTF-8
+try:
+    import orjson
+
+    def _dumps(data: Any) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _dumps(data: Any) -> bytes:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+try:
+    from .output_cache import OutputCache, source_key
+    from .batch_runner import run_batch, run_batch_cli
+except ImportError:
+    # Imported as a top-level module with lib/converters on sys.path
+    from output_cache import OutputCache, source_key
+    from batch_runner import run_batch, run_batch_cli
+
+# Header patterns
+_FB_RE = re.compile(r'FUNCTION_BLOCK\s+"([^"]+)"')
+_FC_NAME_RE = re.compile(r'(?<!FUNCTION_BLOCK\s)FUNCTION\s+"([^"]+)"')
+_FC_RET_RE = re.compile(r'FUNCTION\s+"([^"]+)"\s*:\s*(\w+)')
+_FC_RE = re.compile(r'FUNCTION\s+"([^"]+)"')
+_OB_RE = re.compile(r'ORGANIZATION_BLOCK\s+"([^"]+)"')
+_OB_NUMBER_RE = re.compile(r'OB(\d+)')
+_DB_RE = re.compile(r'DATA_BLOCK\s+"([^"]+)"')
+_OPT_RE = re.compile(r'S7_Optimized_Access\s*:=\s*[\'"]([^\'"]+)[\'"]')
+_VERSION_RE = re.compile(r'VERSION\s*:\s*([\d.]+)')
+_AUTHOR_RE = re.compile(r'AUTHOR\s*:\s*([^\n]+)')
+
+# Variable declaration patterns
+# One match per declaration line of a section body. Lines are taken as they were split on
+# '\n' and stripped, so [^\S\n] stands for the whitespace strip() removed and nothing may
+# run past the end of its line. Empty lines, comments, section markers and END_STRUCT
+# lines do not match at all.
+# Start of a line that is not empty, a comment or a section marker
+_VAR_LINE_START = r'^(?![^\S\n]*(?://|\(\*|VAR|END_VAR))[^\S\n]*'
+# Variable declaration: name [{attributes}] : datatype [:= startvalue];
+_VAR_DECL = r'(?P<name>[a-zA-Z_][a-zA-Z0-9_]*)[^\S\n]*(?:\{[^}\n]*\})?[^\S\n]*:[^\S\n]*(?P<datatype>[^;\n]+);'
+_VAR_LINE_RE = re.compile(
+    _VAR_LINE_START +
+    r'(?:'
+    # Multi-line struct definition: the line contains Struct and does not end with ';'.
+    # Its name is only taken if ': Struct' follows, and the match runs on to the line
+    # containing END_STRUCT (or the end of the section)
+    r'(?=[^\n]*Struct)(?![^\n]*;[^\S\n]*$)'
+    r'(?:(?P<struct>[a-zA-Z_][a-zA-Z0-9_]*)(?=[^\n]*:[^\S\n]*Struct))?'
+    r'[^\n]*(?:\n(?![^\n]*END_STRUCT)[^\n]*)*(?:\n[^\n]*)?'
+    r'|(?![^\n]*END_STRUCT)' + _VAR_DECL +
+    r')',
+    re.MULTILINE
+)
+# Same for section bodies without Struct and END_STRUCT, where the struct checks can never
+# apply; this spares two look-aheads over every line
+_VAR_DECL_LINE_RE = re.compile(_VAR_LINE_START + _VAR_DECL, re.MULTILINE)
+_ATTR_RE = re.compile(r'\s*\{[^}]*\}\s*')
+
+# All variable sections in one alternation; each alternative captures its section body
+# in one group, so match.lastindex tells which section matched. The alternatives share
+# the VAR keyword up front, so positions without it are rejected by a single literal check
+_VAR_SECTIONS_RE = re.compile(
+    r'VAR(?:'
+    r'_INPUT(.*?)END_VAR'
+    r'|_OUTPUT(.*?)END_VAR'
+    r'|_IN_OUT(.*?)END_VAR'
+    r'|_TEMP(.*?)END_VAR'
+    r'|\s+CONSTANT(.*?)END_VAR'
+    r'|\s+RETAIN(.*?)END_VAR'
+    # VAR (static) - Only plain VAR without any suffix, not preceded by a word character
+    r'|(?<!\wVAR)\s*\n(.*?)END_VAR'
+    r')',
+    re.DOTALL | re.IGNORECASE
+)
+# Section key per capture group
+_VAR_SECTION_KEYS = (None, "input_section", "output_section", "in_out_section", "temp_section",
+                     "constant_section", "static_section", "static_section")
+_VAR_RETAIN_GROUP = 6
+
+# Code section between BEGIN and the block's END marker
+_CODE_SECTION_RES = {
+    end_marker: re.compile(rf'BEGIN\s*\n(.*?){end_marker}', re.DOTALL)
+    for end_marker in ("END_FUNCTION_BLOCK", "END_FUNCTION", "END_ORGANIZATION_BLOCK", "END_DATA_BLOCK")
+}
+
+# Code formatting patterns
+_LINE_COMMENT_RE = re.compile(r'//.*')
+_BLOCK_COMMENT_RE = re.compile(r'\(\*.*?\*\)')
+_SINGLE_QUOTED_RE = re.compile(r"'.*?'")
+_DOUBLE_QUOTED_RE = re.compile(r'".*?"')
+_WORD_RE = re.compile(r'\b\w+\b')
+
+# Placeholder lines dropped from the code section
+_PLACEHOLDER_LINES = frozenset(("// No code available", "// Add your logic here"))
+
+# Encoded JSON output per source SCL state, and the JSON files written from it
+_output_cache = OutputCache()
+
 
 class SCLToJSONConverter:
     """Converts SCL format to JSON structured data"""
@@ -15,6 +112,11 @@ class SCLToJSONConverter:
     def __init__(self):
         self.current_line = 0
         self.lines = []
+
+    @staticmethod
+    def clear_cache():
+        """Drop cached conversions and written output records (mainly for tests)"""
+        _output_cache.clear()
         
     def parse_scl_header(self, content: str) -> Dict[str, str]:
         """Parse SCL header information with support for all block types (FB, FC, OB, DB)"""
@@ -44,7 +146,7 @@ class SCLToJSONConverter:
         # Try to match different block types in order of specificity
 
         # 1. FUNCTION_BLOCK (FB) - must check before FUNCTION
-        fb_match = re.search(r'FUNCTION_BLOCK\s+"([^"]+)"', content)
+        fb_match = _FB_RE.search(content)
         if fb_match:
             metadata["blockName"] = fb_match.group(1)
             metadata["name"] = fb_match.group(1)
@@ -53,8 +155,8 @@ class SCLToJSONConverter:
 
         # 2. FUNCTION (FC) - with optional return type
         # Pattern: FUNCTION "name" : ReturnType
-        elif re.search(r'(?<!FUNCTION_BLOCK\s)FUNCTION\s+"([^"]+)"', content):
-            fc_match = re.search(r'FUNCTION\s+"([^"]+)"\s*:\s*(\w+)', content)
+        elif _FC_NAME_RE.search(content):
+            fc_match = _FC_RET_RE.search(content)
             if fc_match:
                 metadata["blockName"] = fc_match.group(1)
                 metadata["name"] = fc_match.group(1)
@@ -63,7 +165,7 @@ class SCLToJSONConverter:
                 metadata["description"] = "TIA Portal Function converted from SCL"
             else:
                 # FC without return type (returns Void)
-                fc_match_no_ret = re.search(r'FUNCTION\s+"([^"]+)"', content)
+                fc_match_no_ret = _FC_RE.search(content)
                 if fc_match_no_ret:
                     metadata["blockName"] = fc_match_no_ret.group(1)
                     metadata["name"] = fc_match_no_ret.group(1)
@@ -72,19 +174,19 @@ class SCLToJSONConverter:
                     metadata["description"] = "TIA Portal Function converted from SCL"
 
         # 3. ORGANIZATION_BLOCK (OB)
-        ob_match = re.search(r'ORGANIZATION_BLOCK\s+"([^"]+)"', content)
+        ob_match = _OB_RE.search(content)
         if ob_match:
             metadata["blockName"] = ob_match.group(1)
             metadata["name"] = ob_match.group(1)
             metadata["blockType"] = "OB"
             metadata["description"] = "TIA Portal Organization Block converted from SCL"
             # Extract OB number if present (e.g., OB1, OB100)
-            ob_num_match = re.search(r'OB(\d+)', ob_match.group(1))
+            ob_num_match = _OB_NUMBER_RE.search(ob_match.group(1))
             if ob_num_match:
                 metadata["blockNumber"] = ob_num_match.group(1)
 
         # 4. DATA_BLOCK (DB)
-        db_match = re.search(r'DATA_BLOCK\s+"([^"]+)"', content)
+        db_match = _DB_RE.search(content)
         if db_match:
             metadata["blockName"] = db_match.group(1)
             metadata["name"] = db_match.group(1)
@@ -93,17 +195,17 @@ class SCLToJSONConverter:
             metadata["programmingLanguage"] = "DB"
 
         # Extract S7_Optimized_Access setting
-        opt_match = re.search(r'S7_Optimized_Access\s*:=\s*[\'"]([^\'"]+)[\'"]', content)
+        opt_match = _OPT_RE.search(content)
         if opt_match:
             metadata["memoryLayout"] = "Optimized" if opt_match.group(1) == "TRUE" else "Standard"
 
         # Extract version if present
-        version_match = re.search(r'VERSION\s*:\s*([\d.]+)', content)
+        version_match = _VERSION_RE.search(content)
         if version_match:
             metadata["version"] = version_match.group(1)
 
         # Extract author if present
-        author_match = re.search(r'AUTHOR\s*:\s*([^\n]+)', content)
+        author_match = _AUTHOR_RE.search(content)
         if author_match:
             metadata["author"] = author_match.group(1).strip()
 
@@ -113,74 +215,50 @@ class SCLToJSONConverter:
         """Parse a variable section (VAR_INPUT, VAR_OUTPUT, etc.) with enhanced struct handling"""
         variables = []
         
-        # Remove section declaration and END_VAR
-        lines = section_content.split('\n')
-        i = 0
+        if 'Struct' in section_content or 'END_STRUCT' in section_content:
+            line_re = _VAR_LINE_RE
+        else:
+            line_re = _VAR_DECL_LINE_RE
         
-        while i < len(lines):
-            line = lines[i].strip()
-            
-            # Skip empty lines, comments, and section markers
-            if not line or line.startswith('//') or line.startswith('(*') or line.startswith('VAR') or line.startswith('END_VAR'):
-                i += 1
-                continue
-            
-            # Handle multi-line struct definitions
-            if 'Struct' in line and not line.endswith(';'):
-                # This is a struct definition that spans multiple lines
-                struct_var_match = re.match(r'\s*([a-zA-Z_][a-zA-Z0-9_]*)\s*.*?\s*:\s*Struct.*', line)
-                if struct_var_match:
-                    var_name = struct_var_match.group(1)
+        for var_match in line_re.finditer(section_content):
+            var_name = var_match.group('name')
+            if var_name is None:
+                # Multi-line struct definition, its members are skipped
+                var_name = var_match.group('struct')
+                if var_name:
                     variables.append({
                         "name": var_name,
                         "datatype": "Struct"
                     })
-                
-                # Skip to END_STRUCT
-                i += 1
-                while i < len(lines) and 'END_STRUCT' not in lines[i]:
-                    i += 1
-                i += 1  # Skip END_STRUCT line
                 continue
             
-            # Handle struct end markers
-            if 'END_STRUCT' in line:
-                i += 1
-                continue
-                
-            # Parse variable declarations: name : datatype [:= startvalue];
-            # Enhanced pattern to handle attributes, complex datatypes, and initial values
-            var_match = re.match(r'\s*([a-zA-Z_][a-zA-Z0-9_]*)\s*(?:\{[^}]*\})?\s*:\s*([^;]+);.*', line)
-            if var_match:
-                var_name = var_match.group(1)
-                var_datatype_full = var_match.group(2).strip()
-
-                # Clean up datatype - remove attributes and extra spaces
-                var_datatype_full = re.sub(r'\s*\{[^}]*\}\s*', '', var_datatype_full).strip()
-
-                # Separate datatype from initial value (handle := assignment)
-                start_value = None
-                if ':=' in var_datatype_full:
-                    # Split by := to get datatype and start value
-                    parts = var_datatype_full.split(':=', 1)
-                    var_datatype = parts[0].strip()
-                    start_value = parts[1].strip()
-                else:
-                    var_datatype = var_datatype_full
+            var_datatype_full = var_match.group('datatype').strip()
+
+            # Clean up datatype - remove attributes and extra spaces
+            if '{' in var_datatype_full:
+                var_datatype_full = _ATTR_RE.sub('', var_datatype_full).strip()
+
+            # Separate datatype from initial value (handle := assignment)
+            start_value = None
+            if ':=' in var_datatype_full:
+                # Split by := to get datatype and start value
+                parts = var_datatype_full.split(':=', 1)
+                var_datatype = parts[0].strip()
+                start_value = parts[1].strip()
+            else:
+                var_datatype = var_datatype_full
 
-                # Build variable entry
-                var_entry = {
-                    "name": var_name,
-                    "datatype": var_datatype
-                }
+            # Build variable entry
+            var_entry = {
+                "name": var_name,
+                "datatype": var_datatype
+            }
 
-                # Add start value if present
-                if start_value is not None:
-                    var_entry["startValue"] = start_value
+            # Add start value if present
+            if start_value is not None:
+                var_entry["startValue"] = start_value
 
-                variables.append(var_entry)
-            
-            i += 1
+            variables.append(var_entry)
         
         return variables
     
@@ -195,56 +273,21 @@ class SCLToJSONConverter:
             "constant_section": []
         }
         
-        # Process sections in order, removing matched sections to avoid conflicts
-        remaining_content = content
-        
-        # 1. VAR_INPUT
-        input_matches = re.findall(r'VAR_INPUT(.*?)END_VAR', remaining_content, re.DOTALL | re.IGNORECASE)
-        for match in input_matches:
-            variables = self.parse_variable_section(match, "input_section")
-            sections["input_section"].extend(variables)
-        remaining_content = re.sub(r'VAR_INPUT.*?END_VAR', '', remaining_content, flags=re.DOTALL | re.IGNORECASE)
-        
-        # 2. VAR_OUTPUT
-        output_matches = re.findall(r'VAR_OUTPUT(.*?)END_VAR', remaining_content, re.DOTALL | re.IGNORECASE)
-        for match in output_matches:
-            variables = self.parse_variable_section(match, "output_section")
-            sections["output_section"].extend(variables)
-        remaining_content = re.sub(r'VAR_OUTPUT.*?END_VAR', '', remaining_content, flags=re.DOTALL | re.IGNORECASE)
-        
-        # 3. VAR_IN_OUT
-        inout_matches = re.findall(r'VAR_IN_OUT(.*?)END_VAR', remaining_content, re.DOTALL | re.IGNORECASE)
-        for match in inout_matches:
-            variables = self.parse_variable_section(match, "in_out_section")
-            sections["in_out_section"].extend(variables)
-        remaining_content = re.sub(r'VAR_IN_OUT.*?END_VAR', '', remaining_content, flags=re.DOTALL | re.IGNORECASE)
-        
-        # 4. VAR_TEMP
-        temp_matches = re.findall(r'VAR_TEMP(.*?)END_VAR', remaining_content, re.DOTALL | re.IGNORECASE)
-        for match in temp_matches:
-            variables = self.parse_variable_section(match, "temp_section")
-            sections["temp_section"].extend(variables)
-        remaining_content = re.sub(r'VAR_TEMP.*?END_VAR', '', remaining_content, flags=re.DOTALL | re.IGNORECASE)
-        
-        # 5. VAR CONSTANT
-        constant_matches = re.findall(r'VAR\s+CONSTANT(.*?)END_VAR', remaining_content, re.DOTALL | re.IGNORECASE)
-        for match in constant_matches:
-            variables = self.parse_variable_section(match, "constant_section")
-            sections["constant_section"].extend(variables)
-        remaining_content = re.sub(r'VAR\s+CONSTANT.*?END_VAR', '', remaining_content, flags=re.DOTALL | re.IGNORECASE)
-        
-        # 6. VAR RETAIN (before plain VAR)
-        retain_matches = re.findall(r'VAR\s+RETAIN(.*?)END_VAR', remaining_content, re.DOTALL | re.IGNORECASE)
-        for match in retain_matches:
-            variables = self.parse_variable_section(match, "static_section")
-            sections["static_section"].extend(variables)
-        remaining_content = re.sub(r'VAR\s+RETAIN.*?END_VAR', '', remaining_content, flags=re.DOTALL | re.IGNORECASE)
+        # One left-to-right scan; a matched section is consumed, so its text is never
+        # matched again by another section type
+        retain_variables = []
+        for match in _VAR_SECTIONS_RE.finditer(content):
+            group = match.lastindex
+            key = _VAR_SECTION_KEYS[group]
+            variables = self.parse_variable_section(match.group(group), key)
+            if group == _VAR_RETAIN_GROUP:
+                retain_variables.extend(variables)
+            else:
+                sections[key].extend(variables)
         
-        # 7. VAR (static) - Only plain VAR without any suffix
-        static_matches = re.findall(r'(?<!\w)VAR\s*\n(.*?)END_VAR', remaining_content, re.DOTALL | re.IGNORECASE)
-        for match in static_matches:
-            variables = self.parse_variable_section(match, "static_section")
-            sections["static_section"].extend(variables)
+        # VAR RETAIN variables come before plain VAR ones in the static section
+        if retain_variables:
+            sections["static_section"][:0] = retain_variables
         
         return sections
     
@@ -277,34 +320,28 @@ class SCLToJSONConverter:
 
         begin_match = None
         for end_marker in patterns_to_try:
-            pattern = rf'BEGIN\s*\n(.*?){end_marker}'
-            begin_match = re.search(pattern, content, re.DOTALL)
+            begin_match = _CODE_SECTION_RES[end_marker].search(content)
             if begin_match:
                 break
 
         if begin_match:
             code_content = begin_match.group(1)
 
-            # Split into lines and clean up
-            lines = code_content.split('\n')
-            for line in lines:
-                # Keep original line (don't strip leading whitespace for indentation)
-                cleaned_line = line.rstrip()
-
-                # Filter out obvious placeholder lines but keep meaningful code
-                if cleaned_line and not (cleaned_line.strip() == "// No code available" or
-                                        cleaned_line.strip() == "// Add your logic here"):
-                    code_lines.append(cleaned_line)
-                elif cleaned_line == "":  # Keep empty lines for structure
-                    code_lines.append(cleaned_line)
-
-            # Remove trailing empty lines
-            while code_lines and not code_lines[-1]:
-                code_lines.pop()
-
-            # Remove leading empty lines
-            while code_lines and not code_lines[0]:
-                code_lines.pop(0)
+            # Split into lines and clean up; keep original leading whitespace for indentation
+            # and empty lines for structure
+            code_lines = list(map(str.rstrip, code_content.split('\n')))
+
+            # Filter out obvious placeholder lines, if the code has any at all
+            if any(placeholder in code_content for placeholder in _PLACEHOLDER_LINES):
+                code_lines = [line for line in code_lines if line.lstrip() not in _PLACEHOLDER_LINES]
+
+            # Remove leading and trailing empty lines
+            start, end = 0, len(code_lines)
+            while start < end and not code_lines[start]:
+                start += 1
+            while end > start and not code_lines[end - 1]:
+                end -= 1
+            code_lines = code_lines[start:end]
             
             # Auto-format the code with indentation
             code_lines = self.format_scl_code(code_lines)
@@ -346,11 +383,17 @@ class SCLToJSONConverter:
                 formatted_lines.append("")
                 continue
 
-            # Clean line for analysis (remove comments and strings)
-            clean_line = re.sub(r'//.*', '', stripped)
-            clean_line = re.sub(r'\(\*.*?\*\)', '', clean_line)
-            clean_line = re.sub(r"'.*?'", '', clean_line)
-            clean_line = re.sub(r'".*?"', '', clean_line)
+            # Clean line for analysis (remove comments and strings); each pattern needs
+            # its opening characters, so lines without them skip the substitution
+            clean_line = stripped
+            if '//' in clean_line:
+                clean_line = _LINE_COMMENT_RE.sub('', clean_line)
+            if '(*' in clean_line:
+                clean_line = _BLOCK_COMMENT_RE.sub('', clean_line)
+            if "'" in clean_line:
+                clean_line = _SINGLE_QUOTED_RE.sub('', clean_line)
+            if '"' in clean_line:
+                clean_line = _DOUBLE_QUOTED_RE.sub('', clean_line)
 
             if not clean_line.strip():
                 # Line only contained comments, keep current indent
@@ -358,7 +401,7 @@ class SCLToJSONConverter:
                 continue
 
             upper_line = clean_line.upper()
-            tokens = re.findall(r'\b\w+\b', upper_line)
+            tokens = _WORD_RE.findall(upper_line)
 
             if not tokens:
                 formatted_lines.append((indent_str * len(indent_stack)) + stripped)
@@ -427,40 +470,58 @@ class SCLToJSONConverter:
             Generated JSON file path or None if failed
         """
         try:
-            # Read SCL file
-            with open(scl_file, 'r', encoding='utf-8') as f:
-                scl_content = f.read()
-            
-            print(f"Processing SCL file: {scl_file}")
-            
-            # Parse header information
-            metadata = self.parse_scl_header(scl_content)
-            block_type = metadata.get("blockType", "FB")
-            print(f"Parsed metadata: Block name = {metadata.get('blockName', 'N/A')}, Block type = {block_type}")
-
-            # Extract variable sections
-            sections = self.extract_variable_sections(scl_content)
-            section_summary = {k: len(v) for k, v in sections.items() if v}
-            print(f"Extracted sections: {section_summary}")
-
-            # Extract code section (pass block_type for correct END marker matching)
-            code_lines = self.extract_code_section(scl_content, block_type)
-            print(f"Extracted {len(code_lines)} lines of code")
-            
-            # Build JSON structure matching xml_to_json.py format
-            json_data = {
-                "metadata": metadata,
-                "sections": sections,
-                "code": code_lines
-            }
-            
             # Generate output file path if not provided
             if output_json_file is None:
                 output_json_file = os.path.splitext(scl_file)[0] + "_fromscl.json"
+
+            key = source_key(scl_file)
+
+            # Output written from this very input and untouched since - nothing to do
+            if _output_cache.is_up_to_date(key, output_json_file):
+                print(f"JSON file is up to date: {output_json_file}")
+                return output_json_file
+
+            json_bytes = _output_cache.get(key)
+            if json_bytes is None:
+                # Read SCL file
+                with open(scl_file, 'r', encoding='utf-8') as f:
+                    scl_content = f.read()
+                
+                print(f"Processing SCL file: {scl_file}")
+                
+                # Parse header information
+                metadata = self.parse_scl_header(scl_content)
+                block_type = metadata.get("blockType", "FB")
+                print(f"Parsed metadata: Block name = {metadata.get('blockName', 'N/A')}, Block type = {block_type}")
+
+                # Extract variable sections
+                sections = self.extract_variable_sections(scl_content)
+                section_summary = {k: len(v) for k, v in sections.items() if v}
+                print(f"Extracted sections: {section_summary}")
+
+                # Extract code section (pass block_type for correct END marker matching)
+                code_lines = self.extract_code_section(scl_content, block_type)
+                print(f"Extracted {len(code_lines)} lines of code")
+                
+                # Build JSON structure matching xml_to_json.py format
+                json_data = {
+                    "metadata": metadata,
+                    "sections": sections,
+                    "code": code_lines
+                }
+                
+                json_bytes = _dumps(json_data)
+                # Same newline translation a text-mode write would do
+                if os.linesep != "\n":
+                    json_bytes = json_bytes.replace(b"\n", os.linesep.encode())
+                _output_cache.put(key, json_bytes)
+            else:
+                print(f"Reusing conversion of unchanged SCL file: {scl_file}")
             
             # Write JSON file
-            with open(output_json_file, 'w', encoding='utf-8') as f:
-                json.dump(json_data, f, indent=2, ensure_ascii=False)
+            with open(output_json_file, 'wb') as f:
+                f.write(json_bytes)
+            _output_cache.record_output(key, output_json_file)
             
             print(f"Successfully converted SCL to JSON: {output_json_file}")
             return output_json_file
@@ -472,14 +533,41 @@ class SCLToJSONConverter:
             return None
 
 
+def _scl_to_json_job(scl_file: str, output_json_file: Optional[str]) -> Optional[str]:
+    """Convert one SCL file in a worker process"""
+    return SCLToJSONConverter().scl_to_json(scl_file, output_json_file)
+
+
+def scl_to_json_batch(scl_files: List[str], output_dir: Optional[str] = None,
+                      max_workers: Optional[int] = None) -> List[Optional[str]]:
+    """
+    Convert several SCL files to JSON in parallel worker processes
+
+    Args:
+        scl_files: Paths to input SCL files
+        output_dir: Directory for the JSON files (optional, next to each input by default)
+        max_workers: Number of worker processes (optional, one per CPU by default)
+
+    Returns:
+        List of generated JSON file paths, None for failed files, in input order
+    """
+    return run_batch(_scl_to_json_job, scl_files, output_dir, "_fromscl.json", max_workers)
+
+
 def main():
     """Main function for command line usage"""
     import sys
     
     if len(sys.argv) < 2:
         print("Usage: python scl_to_json.py <scl_file> [output_json_file]")
+        print("       python scl_to_json.py <scl_dir or glob> [output_dir]")
         print("\nExample:")
         print("  python scl_to_json.py FB_Example.scl FB_Example_fromscl.json")
+        print("  python scl_to_json.py \"exports/*.scl\" json_out")
+        return
+    
+    # Batch mode: a directory or a glob pattern
+    if run_batch_cli(sys.argv[1:], scl_to_json_batch, ".scl", "SCL"):
         return
     
     scl_file = sys.argv[1]
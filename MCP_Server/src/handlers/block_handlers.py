@@ -14,7 +14,7 @@ sys.path.insert(0, str(base_dir / "lib"))
 
 # Import block operation modules
 try:
-    from BlockImport import import_block_from_xml
+    from BlockImport import import_block_from_xml, invalidate_import_cache
     from BlockExport import export_block_to_xml, export_all_blocks, clean_exported_blocks_folder
 except ImportError as e:
     import logging
@@ -329,6 +329,9 @@ class BlockHandlers:
             # Execute in sync context
             plc_software = await session.client_wrapper.execute_sync(_get_plc_software)
             
+            # Folders may have changed since the last request, resolve them afresh
+            invalidate_import_cache()
+            
             # Import each block
             for xml_path in xml_paths:
                 path = Path(xml_path)
@@ -0,0 +1,71 @@
+"""
+Tests for the batch conversion helpers shared by the file converters
+"""
+import sys
+import os
+import io
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+
+# Add converters to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "lib" / "converters"))
+
+from batch_runner import run_batch_cli
+
+
+class TestRunBatchCLI(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.calls = []
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _batch(self, files, output_dir):
+        self.calls.append((files, output_dir))
+        return [None if name.endswith("bad.json") else name for name in files]
+
+    def _touch(self, name):
+        path = os.path.join(self.temp_dir, name)
+        open(path, 'w').close()
+        return path
+
+    def test_single_file_is_not_batch_mode(self):
+        """A plain file argument is left to the single-file mode"""
+        path = self._touch("a.json")
+
+        self.assertFalse(run_batch_cli([path], self._batch, ".json", "JSON"))
+        self.assertEqual(self.calls, [])
+
+    def test_directory_converts_sorted_matches_and_reports_failures(self):
+        """A directory converts its files of the extension, sorted, into the created output dir"""
+        good = self._touch("b.json")
+        bad = self._touch("a_bad.json")
+        self._touch("c.txt")
+        output_dir = os.path.join(self.temp_dir, "out")
+
+        out = io.StringIO()
+        with redirect_stdout(out):
+            self.assertTrue(run_batch_cli([self.temp_dir, output_dir], self._batch, ".json", "JSON"))
+
+        self.assertEqual(self.calls, [([bad, good], output_dir)])
+        self.assertTrue(os.path.isdir(output_dir))
+        self.assertIn("Converted 1 of 2 files", out.getvalue())
+        self.assertIn(f"Failed: {bad}", out.getvalue())
+
+    def test_glob_without_matches(self):
+        """A glob matching nothing reports it and converts nothing"""
+        out = io.StringIO()
+        with redirect_stdout(out):
+            self.assertTrue(run_batch_cli([os.path.join(self.temp_dir, "*.scl")], self._batch, ".scl", "SCL"))
+
+        self.assertEqual(self.calls, [])
+        self.assertIn("No SCL files found", out.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
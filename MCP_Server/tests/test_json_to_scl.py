@@ -0,0 +1,80 @@
+"""
+Tests for the JSON to SCL converter output caching
+"""
+import sys
+import os
+import json
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add converters to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "lib" / "converters"))
+
+from json_to_scl import JSONToSCLConverter, convert_many
+
+
+class TestJSONToSCLOutputCache(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        JSONToSCLConverter.clear_cache()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        JSONToSCLConverter.clear_cache()
+
+    def _write_json(self, name, block_name):
+        path = os.path.join(self.temp_dir, name)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({"metadata": {"blockName": block_name}, "sections": {}, "code": ["a := 1;"]}, f)
+        return path
+
+    def test_older_source_to_same_output_path_is_converted(self):
+        """A newer output written from another source must not be taken as up to date"""
+        output = os.path.join(self.temp_dir, "out.scl")
+        json_a = self._write_json("a.json", "A")
+        json_b = self._write_json("b.json", "B")
+        # b.json is older than the output written from a.json
+        os.utime(json_b, ns=(1_000_000_000, 1_000_000_000))
+
+        converter = JSONToSCLConverter()
+        self.assertEqual(converter.json_to_scl(json_a, output), output)
+        self.assertEqual(converter.json_to_scl(json_b, output), output)
+
+        with open(output, encoding='utf-8') as f:
+            content = f.read()
+        self.assertIn('FUNCTION_BLOCK "B"', content)
+        self.assertNotIn('FUNCTION_BLOCK "A"', content)
+
+
+class TestJSONToSCLBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_convert_many_writes_one_scl_per_json(self):
+        """Each JSON file is converted into output_dir, results in input order"""
+        json_files = []
+        for block_name in ("A", "B"):
+            path = os.path.join(self.temp_dir, f"{block_name}.json")
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump({"metadata": {"blockName": block_name}, "sections": {}, "code": ["a := 1;"]}, f)
+            json_files.append(path)
+        output_dir = os.path.join(self.temp_dir, "out")
+        os.makedirs(output_dir)
+
+        results = convert_many(json_files, output_dir, max_workers=2)
+
+        self.assertEqual(results, [os.path.join(output_dir, "A.scl"), os.path.join(output_dir, "B.scl")])
+        for block_name, result in zip(("A", "B"), results):
+            with open(result, encoding='utf-8') as f:
+                self.assertIn(f'FUNCTION_BLOCK "{block_name}"', f.read())
+
+
+if __name__ == "__main__":
+    unittest.main()
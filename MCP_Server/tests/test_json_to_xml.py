@@ -0,0 +1,125 @@
+"""
+Tests for the JSON to XML converter output file handling
+"""
+import sys
+import os
+import json
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add converters to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "lib" / "converters"))
+
+from json_to_xml import json_to_xml, json_to_xml_batch
+
+
+# StructuredText of the block in test_structured_text_output, as generated before
+# the output was streamed into the file
+EXPECTED_STRUCTURED_TEXT = """<StructuredText xmlns="http://www.siemens.com/automation/Openness/SW/NetworkSource/StructuredText/v4">
+  <Access Scope="LocalVariable" UId="21">
+    <Symbol UId="22">
+      <Component Name="x" UId="23" />
+    </Symbol>
+  </Access>
+  <Blank UId="24" />
+  <Token Text=":=" UId="25" />
+  <Blank UId="26" />
+  <Access Scope="LiteralConstant" UId="27">
+    <Constant UId="28">
+      <ConstantValue UId="29">&quot;a&quot;</ConstantValue>
+    </Constant>
+  </Access>
+  <Token Text=";" UId="30" />
+  <Blank UId="31" />
+  <LineComment UId="32">
+    <Text UId="33"> &lt;n&gt;</Text>
+  </LineComment>
+  <NewLine UId="34" />
+  <NewLine UId="35" />
+  <Blank Num="2" UId="36" />
+  <Token Text="END_IF" UId="37" />
+  <Token Text=";" UId="38" />
+</StructuredText>"""
+
+
+class TestJSONToXMLOutput(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.output_path = os.path.join(self.temp_dir, "Demo.xml")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _write_json(self, code):
+        path = os.path.join(self.temp_dir, "Demo.json")
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({"metadata": {"blockName": "Demo", "blockType": "FC", "blockNumber": "5"},
+                       "sections": {}, "code": code}, f)
+        return path
+
+    def test_structured_text_output(self):
+        """The StructuredText of a small block is written between the template head and tail"""
+        json_path = self._write_json(['#x := "a"; // <n>', '', '  END_IF;'])
+
+        result = json_to_xml(json_path, self.output_path)
+
+        self.assertEqual(result, self.output_path)
+        with open(self.output_path, encoding='utf-8') as f:
+            xml = f.read()
+        start = xml.index('<StructuredText')
+        end = xml.index('</StructuredText>') + len('</StructuredText>')
+        self.assertEqual(xml[start:end], EXPECTED_STRUCTURED_TEXT)
+        self.assertIn('<Name>Demo</Name>', xml)
+        self.assertTrue(xml.rstrip().endswith('</Document>'))
+        self.assertFalse(os.path.exists(self.output_path + ".tmp"))
+
+    def test_failed_conversion_keeps_existing_output(self):
+        """A conversion failing halfway leaves the previous output file unchanged"""
+        with open(self.output_path, 'w', encoding='utf-8') as f:
+            f.write("previous output")
+        json_path = self._write_json(['#x := 1;', None])
+
+        result = json_to_xml(json_path, self.output_path)
+
+        self.assertIsNone(result)
+        with open(self.output_path, encoding='utf-8') as f:
+            self.assertEqual(f.read(), "previous output")
+        self.assertFalse(os.path.exists(self.output_path + ".tmp"))
+
+
+class TestJSONToXMLBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_json_to_xml_batch_writes_one_xml_per_json(self):
+        """Each JSON file is converted into output_dir, results in input order, None for failures"""
+        json_files = []
+        for block_name in ("B", "A"):
+            path = os.path.join(self.temp_dir, f"{block_name}.json")
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump({"metadata": {"blockName": block_name, "blockType": "FC"},
+                           "sections": {}, "code": ["#x := 1;"]}, f)
+            json_files.append(path)
+        json_files.append(os.path.join(self.temp_dir, "missing.json"))
+        output_dir = os.path.join(self.temp_dir, "out")
+        os.makedirs(output_dir)
+
+        results = json_to_xml_batch(json_files, output_dir, max_workers=2)
+
+        self.assertEqual(results, [os.path.join(output_dir, "B_generated.xml"),
+                                   os.path.join(output_dir, "A_generated.xml"),
+                                   None])
+        for block_name, result in zip(("B", "A"), results):
+            with open(result, encoding='utf-8') as f:
+                self.assertIn(f'<Name>{block_name}</Name>', f.read())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+"""
+Tests for the output cache shared by the file converters
+"""
+import sys
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add converters to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "lib" / "converters"))
+
+import output_cache
+from output_cache import OutputCache, source_key
+
+
+class TestOutputCache(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache = OutputCache()
+        self.source = self._write("a.src", "source A")
+        self.output = os.path.join(self.temp_dir, "out.txt")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _write(self, name, content):
+        path = os.path.join(self.temp_dir, name)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        return path
+
+    def _write_output(self, key, content="output"):
+        self._write("out.txt", content)
+        self.cache.record_output(key, self.output)
+
+    def test_recorded_output_is_up_to_date(self):
+        """An output written from the same source key and untouched since is up to date"""
+        key = source_key(self.source)
+        self._write_output(key)
+
+        self.assertTrue(self.cache.is_up_to_date(key, self.output))
+
+    def test_output_from_other_source_is_not_up_to_date(self):
+        """An output written from another source must not be taken as up to date"""
+        other = self._write("b.src", "source B")
+        self._write_output(source_key(other))
+
+        self.assertFalse(self.cache.is_up_to_date(source_key(self.source), self.output))
+
+    def test_modified_output_is_not_up_to_date(self):
+        """An output changed since it was written is not up to date"""
+        key = source_key(self.source)
+        self._write_output(key)
+        self._write("out.txt", "edited")
+
+        self.assertFalse(self.cache.is_up_to_date(key, self.output))
+
+    def test_deleted_output_is_not_up_to_date(self):
+        """An output removed since it was written is not up to date"""
+        key = source_key(self.source)
+        self._write_output(key)
+        os.remove(self.output)
+
+        self.assertFalse(self.cache.is_up_to_date(key, self.output))
+
+    def test_modified_source_gets_a_new_key(self):
+        """A source with a new mtime but the same size gets another key"""
+        key = source_key(self.source)
+        self.cache.put(key, b"converted")
+        self._write("a.src", "source C")
+        os.utime(self.source, ns=(1_000_000_000, 1_000_000_000))
+
+        new_key = source_key(self.source)
+        self.assertNotEqual(new_key, key)
+        self.assertIsNone(self.cache.get(new_key))
+        self.assertEqual(self.cache.get(key), b"converted")
+
+    def test_oldest_entry_is_dropped_when_full(self):
+        """Once the cache is full, the first stored entry is dropped first"""
+        for i in range(output_cache._CACHE_SIZE):
+            self.cache.put(i, i)
+        self.cache.put(0, 0)  # Replacing an entry does not drop anything
+        self.cache.put("new", "new")
+
+        self.assertIsNone(self.cache.get(0))
+        self.assertEqual(self.cache.get(1), 1)
+        self.assertEqual(self.cache.get("new"), "new")
+
+    def test_clear(self):
+        """clear drops both the cached outputs and the written output records"""
+        key = source_key(self.source)
+        self.cache.put(key, b"converted")
+        self._write_output(key)
+
+        self.cache.clear()
+
+        self.assertIsNone(self.cache.get(key))
+        self.assertFalse(self.cache.is_up_to_date(key, self.output))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,349 @@
+"""
+Tests for the PLC tag table converter XML output and Excel extraction
+"""
+import sys
+import os
+import re
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add converters to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "lib" / "converters"))
+
+import openpyxl
+
+from plc_tag_converter import PLCTagConverter
+
+
+VARIABLE_HEADERS = ['Name', 'DataType', 'LogicalAddress',
+                    'Comment_de-DE', 'Comment_en-US', 'Comment_zh-CN', 'Comment_hu-HU',
+                    'ExternalAccessible', 'ExternalVisible', 'ExternalWritable',
+                    'SetPoint', 'Retain']
+CONSTANT_HEADERS = ['Name', 'DataType', 'Value',
+                    'Comment_de-DE', 'Comment_en-US', 'Comment_zh-CN', 'Comment_hu-HU']
+
+# Expected excel_to_xml output for the workbook of _write_workbook, as the
+# minidom based writer produced it, with the Created timestamp masked
+EXPECTED_XML = """<?xml version="1.0" encoding="utf-8"?>
+<Document>
+  <Engineering version="V20"/>
+  <DocumentInfo>
+    <Created/>
+    <ExportSetting>None</ExportSetting>
+  </DocumentInfo>
+  <SW.Tags.PlcTagTable ID="0">
+    <AttributeList>
+      <Name>T</Name>
+    </AttributeList>
+    <ObjectList>
+      <SW.Tags.PlcTag ID="1" CompositionName="Tags">
+        <AttributeList>
+          <DataTypeName>Bool</DataTypeName>
+          <ExternalAccessible>true</ExternalAccessible>
+          <LogicalAddress>%Q0.0</LogicalAddress>
+          <Name>Motor_On</Name>
+        </AttributeList>
+        <ObjectList>
+          <MultilingualText ID="2" CompositionName="Comment">
+            <ObjectList>
+              <MultilingualTextItem ID="3" CompositionName="Items">
+                <AttributeList>
+                  <Culture>de-DE</Culture>
+                  <Text>Motor an</Text>
+                </AttributeList>
+              </MultilingualTextItem>
+              <MultilingualTextItem ID="4" CompositionName="Items">
+                <AttributeList>
+                  <Culture>en-US</Culture>
+                  <Text>Motor &quot;on&quot; &amp; &lt;ready&gt;</Text>
+                </AttributeList>
+              </MultilingualTextItem>
+            </ObjectList>
+          </MultilingualText>
+        </ObjectList>
+      </SW.Tags.PlcTag>
+      <SW.Tags.PlcTag ID="5" CompositionName="Tags">
+        <AttributeList>
+          <DataTypeName>Int</DataTypeName>
+          <ExternalAccessible>false</ExternalAccessible>
+          <LogicalAddress>%MW10</LogicalAddress>
+          <Name>Speed</Name>
+          <ExternalVisible>true</ExternalVisible>
+          <ExternalWritable>true</ExternalWritable>
+          <SetPoint>true</SetPoint>
+          <Retain>true</Retain>
+        </AttributeList>
+        <ObjectList>
+          <MultilingualText ID="6" CompositionName="Comment">
+            <ObjectList>
+              <MultilingualTextItem ID="7" CompositionName="Items">
+                <AttributeList>
+                  <Culture>en-US</Culture>
+                  <Text>Line one
+Line two</Text>
+                </AttributeList>
+              </MultilingualTextItem>
+            </ObjectList>
+          </MultilingualText>
+        </ObjectList>
+      </SW.Tags.PlcTag>
+      <SW.Tags.PlcTag ID="8" CompositionName="Tags">
+        <AttributeList>
+          <DataTypeName>Real</DataTypeName>
+          <ExternalAccessible>true</ExternalAccessible>
+          <LogicalAddress>%MD20</LogicalAddress>
+          <Name>A&amp;B</Name>
+          <ExternalVisible>true</ExternalVisible>
+        </AttributeList>
+        <ObjectList>
+          <MultilingualText ID="9" CompositionName="Comment">
+            <ObjectList>
+              <MultilingualTextItem ID="A" CompositionName="Items">
+                <AttributeList>
+                  <Culture>de-DE</Culture>
+                  <Text>x</Text>
+                </AttributeList>
+              </MultilingualTextItem>
+              <MultilingualTextItem ID="B" CompositionName="Items">
+                <AttributeList>
+                  <Culture>en-US</Culture>
+                  <Text>y</Text>
+                </AttributeList>
+              </MultilingualTextItem>
+              <MultilingualTextItem ID="C" CompositionName="Items">
+                <AttributeList>
+                  <Culture>zh-CN</Culture>
+                  <Text>z</Text>
+                </AttributeList>
+              </MultilingualTextItem>
+            </ObjectList>
+          </MultilingualText>
+        </ObjectList>
+      </SW.Tags.PlcTag>
+      <SW.Tags.PlcUserConstant ID="D" CompositionName="UserConstants">
+        <AttributeList>
+          <DataTypeName>Int</DataTypeName>
+          <Name>MAX_SPEED</Name>
+          <Value>1500</Value>
+        </AttributeList>
+        <ObjectList>
+          <MultilingualText ID="E" CompositionName="Comment">
+            <ObjectList>
+              <MultilingualTextItem ID="F" CompositionName="Items">
+                <AttributeList>
+                  <Culture>en-US</Culture>
+                  <Text>Limit &gt; 1000</Text>
+                </AttributeList>
+              </MultilingualTextItem>
+            </ObjectList>
+          </MultilingualText>
+        </ObjectList>
+      </SW.Tags.PlcUserConstant>
+      <SW.Tags.PlcUserConstant ID="10" CompositionName="UserConstants">
+        <AttributeList>
+          <DataTypeName>Bool</DataTypeName>
+          <Name>Flag</Name>
+        </AttributeList>
+      </SW.Tags.PlcUserConstant>
+    </ObjectList>
+  </SW.Tags.PlcTagTable>
+</Document>"""
+
+EXPECTED_EMPTY_XML = """<?xml version="1.0" encoding="utf-8"?>
+<Document>
+  <Engineering version="V20"/>
+  <DocumentInfo>
+    <Created/>
+    <ExportSetting>None</ExportSetting>
+  </DocumentInfo>
+  <SW.Tags.PlcTagTable ID="0">
+    <AttributeList>
+      <Name>Empty</Name>
+    </AttributeList>
+    <ObjectList/>
+  </SW.Tags.PlcTagTable>
+</Document>"""
+
+TAG_TABLE_XML = """<?xml version="1.0" encoding="utf-8"?>
+<Document>
+  <Engineering version="V20"/>
+  <SW.Tags.PlcTagTable ID="0">
+    <AttributeList>
+      <Name>Motors</Name>
+    </AttributeList>
+    <ObjectList>
+      <SW.Tags.PlcTag ID="1" CompositionName="Tags">
+        <AttributeList>
+          <DataTypeName>Bool</DataTypeName>
+          <ExternalAccessible>true</ExternalAccessible>
+          <LogicalAddress>%Q0.0</LogicalAddress>
+          <Name>Motor_On</Name>
+          <Retain>true</Retain>
+        </AttributeList>
+        <ObjectList>
+          <MultilingualText ID="2" CompositionName="Comment">
+            <ObjectList>
+              <MultilingualTextItem ID="3" CompositionName="Items">
+                <AttributeList>
+                  <Culture>de-DE</Culture>
+                  <Text>Motor an</Text>
+                </AttributeList>
+              </MultilingualTextItem>
+              <MultilingualTextItem ID="4" CompositionName="Items">
+                <AttributeList>
+                  <Culture>en-US</Culture>
+                  <Text>Motor &quot;on&quot; &amp; &lt;ready&gt;</Text>
+                </AttributeList>
+              </MultilingualTextItem>
+            </ObjectList>
+          </MultilingualText>
+        </ObjectList>
+      </SW.Tags.PlcTag>
+      <SW.Tags.PlcTag ID="5" CompositionName="Tags">
+        <AttributeList>
+          <DataTypeName>Int</DataTypeName>
+          <LogicalAddress>%MW10</LogicalAddress>
+          <Name>Speed</Name>
+        </AttributeList>
+      </SW.Tags.PlcTag>
+      <SW.Tags.PlcUserConstant ID="6" CompositionName="UserConstants">
+        <AttributeList>
+          <DataTypeName>Int</DataTypeName>
+          <Name>MAX_SPEED</Name>
+          <Value>1500</Value>
+        </AttributeList>
+      </SW.Tags.PlcUserConstant>
+      <SW.Tags.PlcSystemConstant ID="7" CompositionName="SystemConstants">
+        <AttributeList>
+          <DataTypeName>Hw_Io</DataTypeName>
+          <Name>Local~DI_1</Name>
+          <Value>257</Value>
+        </AttributeList>
+      </SW.Tags.PlcSystemConstant>
+    </ObjectList>
+  </SW.Tags.PlcTagTable>
+</Document>
+"""
+
+
+def _mask_created(xml):
+    return re.sub(r'<Created>[^<]*</Created>', '<Created/>', xml)
+
+
+def _sheet_rows(ws):
+    """Data rows of a converter sheet, from row 5 on"""
+    return [list(row) for row in ws.iter_rows(min_row=5, values_only=True)]
+
+
+class TestExcelToXML(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.converter = PLCTagConverter()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _write_workbook(self):
+        """Workbook with a variables and a user constants sheet, laid out like xml_to_excel writes it"""
+        wb = openpyxl.Workbook()
+        ws = wb.active
+        ws.title = "Variables"
+        ws.append(["PLC Tag Table: T"])
+        ws.append(["Type: Variables"])
+        ws.append([])
+        ws.append(VARIABLE_HEADERS)
+        ws.append(['Motor_On', 'Bool', '%Q0.0', 'Motor an', 'Motor "on" & <ready>', None, None,
+                   'true', 'false', 'false', 'false', 'false'])
+        ws.append(['Speed', 'Int', '%MW10', None, 'Line one\r\nLine two', None, None,
+                   'false', 'true', 'true', 'true', 'true'])
+        ws.append([None] * len(VARIABLE_HEADERS))
+        ws.append(['A&B', 'Real', '%MD20', 'x', 'y', 'z', None,
+                   'true', 'true', 'false', 'false', 'false'])
+
+        ws = wb.create_sheet("User Constants")
+        ws.append(["PLC Tag Table: T"])
+        ws.append(["Type: User Constants"])
+        ws.append([])
+        ws.append(CONSTANT_HEADERS)
+        ws.append(['MAX_SPEED', 'Int', 1500, None, 'Limit > 1000', None, None])
+        ws.append(['Flag', 'Bool', None, None, None, None, None])
+
+        path = os.path.join(self.temp_dir, "in.xlsx")
+        wb.save(path)
+        return path
+
+    def test_excel_to_xml_output(self):
+        """Escaping, line ends, left-out 'false' flags, hex IDs and comments per culture"""
+        output_path = os.path.join(self.temp_dir, "out.xml")
+
+        result = self.converter.excel_to_xml(self._write_workbook(), output_path, table_name='T')
+
+        self.assertEqual(result, output_path)
+        with open(output_path, encoding='utf-8', newline='') as f:
+            self.assertEqual(_mask_created(f.read()), EXPECTED_XML)
+
+    def test_excel_to_xml_without_rows_writes_empty_object_list(self):
+        """A sheet without data rows gives an empty <ObjectList/>"""
+        wb = openpyxl.Workbook()
+        ws = wb.active
+        ws.title = "Variables"
+        ws.append(["PLC Tag Table: Empty"])
+        ws.append(["Type: Variables"])
+        ws.append([])
+        ws.append(['Name', 'DataType', 'LogicalAddress', 'Comment_en-US'])
+        ws.append([None, None, None, None])
+        excel_path = os.path.join(self.temp_dir, "empty.xlsx")
+        wb.save(excel_path)
+        output_path = os.path.join(self.temp_dir, "empty.xml")
+
+        self.converter.excel_to_xml(excel_path, output_path, table_name='Empty')
+
+        with open(output_path, encoding='utf-8', newline='') as f:
+            self.assertEqual(_mask_created(f.read()), EXPECTED_EMPTY_XML)
+
+
+class TestXMLToExcel(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.xml_path = os.path.join(self.temp_dir, "Motors.xml")
+        with open(self.xml_path, 'w', encoding='utf-8') as f:
+            f.write(TAG_TABLE_XML)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_xml_to_excel_rows(self):
+        """Each tag type gets its sheet with one row per element in header order"""
+        output_path = PLCTagConverter().xml_to_excel(self.xml_path)
+
+        self.assertEqual(output_path, os.path.join(self.temp_dir, "Motors.xlsx"))
+        wb = openpyxl.load_workbook(output_path, read_only=True)
+        try:
+            self.assertEqual(wb.sheetnames, ["Variables", "User Constants", "System Constants"])
+            variables = wb["Variables"]
+            self.assertEqual(next(variables.iter_rows(min_row=1, max_row=1, values_only=True))[0],
+                             "PLC Tag Table: Motors")
+            self.assertEqual(list(next(variables.iter_rows(min_row=4, max_row=4, values_only=True))),
+                             VARIABLE_HEADERS)
+            self.assertEqual(_sheet_rows(variables), [
+                ['Motor_On', 'Bool', '%Q0.0', 'Motor an', 'Motor "on" & <ready>', None, None,
+                 'true', 'false', 'false', 'false', 'true'],
+                ['Speed', 'Int', '%MW10', None, None, None, None,
+                 'false', 'false', 'false', 'false', 'false'],
+            ])
+            self.assertEqual(_sheet_rows(wb["User Constants"]), [
+                ['MAX_SPEED', 'Int', '1500', None, None, None, None],
+            ])
+            self.assertEqual(_sheet_rows(wb["System Constants"]), [
+                ['Local~DI_1', 'Hw_Io', '257', None, None, None, None],
+            ])
+        finally:
+            wb.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+"""
+Tests for the SCL to JSON converter output caching
+"""
+import sys
+import os
+import json
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add converters to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "lib" / "converters"))
+
+from scl_to_json import SCLToJSONConverter, scl_to_json_batch
+
+
+class TestSCLToJSONOutputCache(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        SCLToJSONConverter.clear_cache()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        SCLToJSONConverter.clear_cache()
+
+    def _write_scl(self, name, block_name):
+        path = os.path.join(self.temp_dir, name)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(f'FUNCTION_BLOCK "{block_name}"\n'
+                    "{ S7_Optimized_Access := 'TRUE' }\n\nBEGIN\n\na := 1;\n\nEND_FUNCTION_BLOCK\n")
+        return path
+
+    def _block_name(self, json_file):
+        with open(json_file, encoding='utf-8') as f:
+            return json.load(f)["metadata"]["blockName"]
+
+    def test_other_source_to_same_output_path_is_converted(self):
+        """An output written from another source must not be taken as up to date"""
+        output = os.path.join(self.temp_dir, "out.json")
+        scl_a = self._write_scl("a.scl", "A")
+        scl_b = self._write_scl("b.scl", "B")
+
+        converter = SCLToJSONConverter()
+        self.assertEqual(converter.scl_to_json(scl_a, output), output)
+        self.assertEqual(converter.scl_to_json(scl_b, output), output)
+
+        self.assertEqual(self._block_name(output), "B")
+
+
+class TestSCLToJSONBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_scl_to_json_batch_writes_one_json_per_scl(self):
+        """Each SCL file is converted into output_dir, results in input order"""
+        scl_files = []
+        for block_name in ("B", "A"):
+            path = os.path.join(self.temp_dir, f"{block_name}.scl")
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(f'FUNCTION_BLOCK "{block_name}"\nBEGIN\na := 1;\nEND_FUNCTION_BLOCK\n')
+            scl_files.append(path)
+        output_dir = os.path.join(self.temp_dir, "out")
+        os.makedirs(output_dir)
+
+        results = scl_to_json_batch(scl_files, output_dir, max_workers=2)
+
+        self.assertEqual(results, [os.path.join(output_dir, "B_fromscl.json"),
+                                   os.path.join(output_dir, "A_fromscl.json")])
+        for block_name, result in zip(("B", "A"), results):
+            with open(result, encoding='utf-8') as f:
+                self.assertEqual(json.load(f)["metadata"]["blockName"], block_name)
+
+
+if __name__ == "__main__":
+    unittest.main()